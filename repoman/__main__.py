@@ -3,22 +3,65 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+from collections.abc import Callable, Coroutine
+from typing import TYPE_CHECKING, Any
 
 import typer
-import uvicorn
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
-from repoman.config import MAX_GITHUB_ISSUE_INGEST_LIMIT, MIN_GITHUB_ISSUE_INGEST_LIMIT, Settings
+from repoman.config import MAX_GITHUB_ISSUE_INGEST_LIMIT, MIN_GITHUB_ISSUE_INGEST_LIMIT
 from repoman.utils.exceptions import reraise_if_fatal
 from repoman.utils.logging import configure_logging
+from repoman.utils.ui import maybe_progress
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from repoman.agents.base import BaseAgent
+    from repoman.elasticsearch.ingestion import ElasticsearchIngestionService
+    from repoman.models.router import ModelRouter
 
 app = typer.Typer(name="repoman", help="Multi-model agentic repository transformation system")
 es_app = typer.Typer(name="es", help="Elasticsearch indexing and search utilities")
 app.add_typer(es_app)
-console = Console()
+
+
+@functools.cache
+def _console() -> Console:
+    """Return the shared Rich console, created on first use.
+
+    Deferring construction keeps terminal probing off the `--help` path.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+def _run_async(coro: Coroutine[Any, Any, None]) -> None:
+    """Run a command's coroutine, on uvloop when it is installed.
+
+    uvloop does not support Windows; there the default asyncio loop is used.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(coro)
+    else:
+        asyncio.run(coro, loop_factory=uvloop.new_event_loop)
+
+
+@functools.cache
+def _load_agents() -> tuple[Callable[[ModelRouter], BaseAgent], ...]:
+    """Import the auditing agent classes once, on first use.
+
+    Returns:
+        The Architect, Auditor and Builder agent classes, in that order.
+    """
+    from repoman.agents.architect import ArchitectAgent
+    from repoman.agents.auditor import AuditorAgent
+    from repoman.agents.builder import BuilderAgent
+
+    return (ArchitectAgent, AuditorAgent, BuilderAgent)
 
 
 @app.command()
@@ -27,19 +70,25 @@ def transform(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose logging"),
 ) -> None:
     """Run the full 7-phase transformation pipeline on a repository."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from repoman.config import get_settings
+
     configure_logging("DEBUG" if verbose else "INFO")
-    settings = Settings()
+    settings = get_settings()
+    console = _console()
 
     async def _run() -> None:
         from repoman.core.pipeline import Pipeline
 
         pipeline = Pipeline(settings)
-        with Progress(
-            SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
-        ) as progress:
-            task = progress.add_task("Transforming repository...", total=None)
-            result = await pipeline.run(repo_url)
-            progress.update(task, description="Done!")
+        try:
+            with maybe_progress(console, "Transforming repository...") as status:
+                result = await pipeline.run(repo_url)
+                status("Done!")
+        finally:
+            await pipeline.aclose()
 
         # Results table
         table = Table(title="Transformation Results", show_header=True)
@@ -59,7 +108,7 @@ def transform(
         if result.error:
             console.print(Panel(f"[red]Error: {result.error}[/red]", title="Pipeline Error"))
 
-    asyncio.run(_run())
+    _run_async(_run())
 
 
 @app.command()
@@ -67,39 +116,35 @@ def audit(
     repo_url: str = typer.Argument(..., help="Git repository URL to audit"),
 ) -> None:
     """Run phases 1-2 only: ingest and audit the repository."""
+    from rich.panel import Panel
+
+    from repoman.config import get_settings
+
     configure_logging()
-    settings = Settings()
+    settings = get_settings()
+    console = _console()
 
     async def _run() -> None:
-        from repoman.agents.architect import ArchitectAgent
-        from repoman.agents.auditor import AuditorAgent
-        from repoman.agents.builder import BuilderAgent
         from repoman.analysis.ingestion import RepoIngester
+        from repoman.core.state import AgentAuditReport
         from repoman.models.router import ModelRouter
 
         router = ModelRouter(settings)
         ingester = RepoIngester(settings)
+        agents = tuple(agent_cls(router) for agent_cls in _load_agents())
 
-        with Progress(
-            SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
-        ) as progress:
-            task = progress.add_task("Cloning and analysing...", total=None)
-            snapshot = await ingester.ingest(repo_url)
-            progress.update(task, description="Running audits...")
-
-            reports = await asyncio.gather(
-                ArchitectAgent(router).audit(snapshot),
-                AuditorAgent(router).audit(snapshot),
-                BuilderAgent(router).audit(snapshot),
-                return_exceptions=True,
-            )
-            progress.update(task, description="Done!")
+        async def _audit_one(agent) -> AgentAuditReport | Exception:
+            # Return failures as values so one agent cannot cancel its siblings.
+            try:
+                return await agent.audit(snapshot)
+            except Exception as exc:
+                return exc
 
-        for report in reports:
+        def _render(report: AgentAuditReport | Exception) -> None:
             if isinstance(report, BaseException):
                 reraise_if_fatal(report)
                 console.print(f"[red]Audit failed: {report}[/red]")
-                continue
+                return
             console.print(
                 Panel(
                     f"Critical: {len(report.critical_issues)} | Major: {len(report.major_issues)} | Score: {report.overall_score:.1f}\n\n{report.executive_summary}",
@@ -107,7 +152,23 @@ def audit(
                 )
             )
 
-    asyncio.run(_run())
+        try:
+            with maybe_progress(console, "Cloning and analysing...") as status:
+                snapshot = await ingester.ingest(repo_url)
+                status("Running audits...")
+
+                # Render each report as soon as it lands instead of waiting for the
+                # slowest agent, so output overlaps with the remaining LLM calls.
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [tg.create_task(_audit_one(agent)) for agent in agents]
+                    for done, next_report in enumerate(asyncio.as_completed(tasks), start=1):
+                        _render(await next_report)
+                        status(f"Running audits ({done}/{len(tasks)})...")
+                status("Done!")
+        finally:
+            await router.aclose()
+
+    _run_async(_run())
 
 
 @app.command()
@@ -116,33 +177,37 @@ def serve(
     port: int = typer.Option(None, "--port", help="Override API port"),
 ) -> None:
     """Start the FastAPI server with uvicorn."""
-    configure_logging()
-    settings = Settings()
+    import uvicorn
+
     from repoman.api.app import create_app
+    from repoman.config import get_settings
+
+    configure_logging()
+    settings = get_settings()
 
     api_host = host or settings.api_host
     api_port = port or settings.api_port
-    uvicorn.run(create_app(settings), host=api_host, port=api_port)
+    uvicorn.run(create_app(settings), host=api_host, port=api_port, loop="auto")
 
 
 @es_app.command("setup")
 def es_setup() -> None:
     """Create Elasticsearch indices and templates (idempotent)."""
+    from repoman.config import get_settings
+
     configure_logging()
-    settings = Settings()
+    settings = get_settings()
+    console = _console()
 
     async def _run() -> None:
         from repoman.elasticsearch.client import create_es_client
         from repoman.elasticsearch.index_management import ensure_indices
 
-        es = create_es_client(settings)
-        try:
+        async with create_es_client(settings) as es:
             await ensure_indices(es, vector_dims=settings.embedding_dims)
             console.print("[green]Elasticsearch indices ensured.[/green]")
-        finally:
-            await es.close()
 
-    asyncio.run(_run())
+    _run_async(_run())
 
 
 @es_app.command("ingest")
@@ -161,38 +226,90 @@ def es_ingest(
     analyze: bool = typer.Option(False, "--analyze", help="Run analysis after ingestion"),
 ) -> None:
     """Ingest GitHub data into Elasticsearch."""
+    from repoman.config import get_settings
+
     configure_logging()
-    settings = Settings()
+    settings = get_settings()
+    console = _console()
 
     async def _run() -> None:
         from repoman.elasticsearch.client import create_es_client
-        from repoman.elasticsearch.index_management import ensure_indices
+        from repoman.elasticsearch.index_management import bulk_load, ensure_indices
         from repoman.elasticsearch.ingestion import ElasticsearchIngestionService
 
-        es = create_es_client(settings)
-        service = ElasticsearchIngestionService(settings, es=es)
-        try:
-            await ensure_indices(es, vector_dims=settings.embedding_dims)
-            repos = await service.ingest_input(input_value, limit=limit)
-            if not repos:
-                console.print("[yellow]No repositories found.[/yellow]")
-                return
+        async with create_es_client(settings) as es:
+            service = ElasticsearchIngestionService(settings, es=es)
+            try:
+                await ensure_indices(es, vector_dims=settings.embedding_dims)
+                repos = await service.ingest_input(input_value, limit=limit)
+                if not repos:
+                    console.print("[yellow]No repositories found.[/yellow]")
+                    return
+
+                async with bulk_load(es):
+                    await _ingest_repos(
+                        service,
+                        repos,
+                        issues_limit=issues_limit,
+                        analyze=analyze,
+                        concurrency=settings.ingest_concurrency,
+                    )
+            finally:
+                await service.aclose()
 
-            for repo_full_name in repos:
-                result = await service.ingest_repo(repo_full_name, issues_limit=issues_limit)
-                console.print(
-                    f"[cyan]{repo_full_name}[/cyan] indexed: issues={result['issues_indexed']} health={result['health_score']}"
-                )
-                if analyze:
-                    analysis_doc = await service.analyze_repo(repo_full_name)
-                    console.print(
-                        f"  analysis indexed: stale_issues={analysis_doc.get('stale_issues_count')} duplicates={len(analysis_doc.get('duplicate_issue_groups') or [])}"
+    _run_async(_run())
+
+
+@es_app.command("batch")
+def es_batch(
+    issues_limit: int | None = typer.Option(
+        None,
+        "--issues-limit",
+        min=MIN_GITHUB_ISSUE_INGEST_LIMIT,
+        max=MAX_GITHUB_ISSUE_INGEST_LIMIT,
+        help="Max issues/PRs to ingest per repo",
+    ),
+    analyze: bool = typer.Option(False, "--analyze", help="Run analysis after ingestion"),
+) -> None:
+    """Ingest newline-delimited repos (URL or owner/repo) from stdin in one session.
+
+    Scripted ingestion that would otherwise invoke `es ingest` once per repo pays
+    process startup and connection setup only once.
+    """
+    import sys
+
+    from repoman.config import get_settings
+
+    configure_logging()
+    settings = get_settings()
+
+    async def _run() -> None:
+        from repoman.elasticsearch.client import create_es_client
+        from repoman.elasticsearch.index_management import bulk_load, ensure_indices
+        from repoman.elasticsearch.ingestion import ElasticsearchIngestionService
+        from repoman.github.fetcher import parse_repo_full_name
+
+        async with create_es_client(settings) as es:
+            service = ElasticsearchIngestionService(settings, es=es)
+            try:
+                await ensure_indices(es, vector_dims=settings.embedding_dims)
+                repos = [
+                    parse_repo_full_name(value)
+                    for value in (line.strip() for line in sys.stdin)
+                    if value and not value.startswith("#")
+                ]
+                async with bulk_load(es):
+                    await _ingest_repos(
+                        service,
+                        repos,
+                        issues_limit=issues_limit,
+                        analyze=analyze,
+                        concurrency=settings.ingest_concurrency,
                     )
-        finally:
-            await service.aclose()
-            await es.close()
+            finally:
+                await service.aclose()
 
-    asyncio.run(_run())
+    _run_async(_run())
 
 
 @es_app.command("analyze")
@@ -200,25 +317,77 @@ def es_analyze(
     repo_full_name: str = typer.Argument(..., help="owner/repo"),
 ) -> None:
     """Run analysis for a repo already ingested into Elasticsearch."""
+    from repoman.config import get_settings
+
     configure_logging()
-    settings = Settings()
+    settings = get_settings()
+    console = _console()
 
     async def _run() -> None:
         from repoman.elasticsearch.client import create_es_client
         from repoman.elasticsearch.ingestion import ElasticsearchIngestionService
 
-        es = create_es_client(settings)
-        service = ElasticsearchIngestionService(settings, es=es)
+        async with create_es_client(settings) as es:
+            service = ElasticsearchIngestionService(settings, es=es)
+            try:
+                analysis_doc = await service.analyze_repo(repo_full_name)
+                console.print(
+                    f"[green]{repo_full_name}[/green] analysis indexed: missing={analysis_doc.get('missing_elements')} stale_issues={analysis_doc.get('stale_issues_count')}"
+                )
+            finally:
+                await service.aclose()
+
+    _run_async(_run())
+
+
+async def _ingest_repos(
+    service: ElasticsearchIngestionService,
+    repos: list[str],
+    *,
+    issues_limit: int | None,
+    analyze: bool,
+    concurrency: int,
+) -> None:
+    """Ingest (and optionally analyse) repos with bounded concurrency.
+
+    Each repo's ingest and analysis run back to back inside one task while up to
+    `concurrency` repos proceed at once. Callers wrap this in `bulk_load`, so the
+    indices are refreshed explicitly before each analysis. Summaries are printed in
+    input order; a repo that fails gets a failure line and does not stop the rest.
+    """
+    console = _console()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(repo_full_name: str) -> tuple[dict, dict | None] | Exception:
+        # Return failures as values so one bad repo cannot cancel its siblings.
         try:
-            analysis_doc = await service.analyze_repo(repo_full_name)
+            async with semaphore:
+                result = await service.ingest_repo(repo_full_name, issues_limit=issues_limit)
+                analysis_doc = None
+                if analyze:
+                    await service.refresh()
+                    analysis_doc = await service.analyze_repo(repo_full_name)
+            return result, analysis_doc
+        except Exception as exc:
+            return exc
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_one(repo_full_name)) for repo_full_name in repos]
+
+    for repo_full_name, task in zip(repos, tasks, strict=True):
+        outcome = task.result()
+        if isinstance(outcome, BaseException):
+            reraise_if_fatal(outcome)
+            console.print(f"[red]{repo_full_name} failed: {outcome}[/red]")
+            continue
+        result, analysis_doc = outcome
+        console.print(
+            f"[cyan]{repo_full_name}[/cyan] indexed: issues={result['issues_indexed']} health={result['health_score']}"
+        )
+        if analysis_doc is not None:
             console.print(
-                f"[green]{repo_full_name}[/green] analysis indexed: missing={analysis_doc.get('missing_elements')} stale_issues={analysis_doc.get('stale_issues_count')}"
+                f"  analysis indexed: stale_issues={analysis_doc.get('stale_issues_count')} duplicates={len(analysis_doc.get('duplicate_issue_groups') or [])}"
             )
-        finally:
-            await service.aclose()
-            await es.close()
-
-    asyncio.run(_run())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,126 @@
+"""Cached CLI help.
+
+Building the Typer app re-runs every ``@app.command`` decorator and constructs the
+Click parser tree. A bare ``repoman --help`` does not need any of that, so the
+top-level help is recorded as text the first time it is rendered and written out
+directly on later invocations. The cache file is keyed by ``repoman.__version__``,
+by the modification time and size of ``repoman/__main__.py`` (so upgrades and
+edits to the commands in a development install both invalidate it), and by
+whether stdout is a terminal and how wide it is, since Rich renders colour and
+line wrapping for those.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import TextIO
+
+from repoman import __version__
+
+_HELP_ARGS = (["--help"],)
+
+# Module that defines the commands; its stat is part of the cache key.
+_COMMANDS_MODULE = Path(__file__).with_name("__main__.py")
+
+
+class _Tee(io.StringIO):
+    """Record text written to stdout while passing it through.
+
+    ``isatty`` and ``fileno`` report the real stream, so Rich renders colour and
+    width exactly as it would for the live help.
+    """
+
+    def __init__(self, out: TextIO) -> None:
+        super().__init__()
+        self._out = out
+
+    def write(self, s: str) -> int:
+        self._out.write(s)
+        return super().write(s)
+
+    def flush(self) -> None:
+        self._out.flush()
+
+    def isatty(self) -> bool:
+        return self._out.isatty()
+
+    def fileno(self) -> int:
+        return self._out.fileno()
+
+
+def manifest_path() -> Path:
+    """Return the help cache location for the current commands and terminal."""
+    cache_root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    try:
+        st = _COMMANDS_MODULE.stat()
+        stamp = f"{st.st_mtime_ns:x}-{st.st_size:x}"
+    except OSError:
+        stamp = "0"
+    tty = "tty" if sys.stdout.isatty() else "pipe"
+    columns = shutil.get_terminal_size().columns
+    return Path(cache_root) / "repoman" / f"help-{__version__}-{stamp}-{tty}{columns}.txt"
+
+
+def load_manifest() -> str | None:
+    """Load the cached help text, returning None on a miss or unreadable file."""
+    try:
+        return manifest_path().read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def save_manifest(text: str) -> None:
+    """Atomically persist the help text; cache write failures are ignored."""
+    path = manifest_path()
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+
+
+def build_manifest() -> str:
+    """Print the live top-level help and return the text that was printed.
+
+    Returns:
+        The help exactly as written to stdout, including any colour codes.
+    """
+    import typer.main
+
+    from repoman.__main__ import app
+
+    command = typer.main.get_command(app)
+    tee = _Tee(sys.stdout)
+    with contextlib.redirect_stdout(tee):
+        ctx = command.make_context("repoman", ["--help"], resilient_parsing=True)
+        # Rich-formatted help is printed as it renders and returns ""; echo the
+        # result either way, as Click's --help does.
+        print(command.get_help(ctx))
+    return tee.getvalue()
+
+
+def main() -> None:
+    """Console-script entry point.
+
+    Serves a bare ``--help`` from the cache when possible and otherwise
+    dispatches to the full Typer app.
+    """
+    if sys.argv[1:] in _HELP_ARGS:
+        text = load_manifest()
+        if text is None:
+            save_manifest(build_manifest())
+        else:
+            sys.stdout.write(text)
+        return
+
+    from repoman.__main__ import app
+
+    app()
@@ -0,0 +1,21 @@
+"""Compact JSON rendering for agent prompts."""
+
+from __future__ import annotations
+
+import orjson
+
+
+def dumps(obj: object, *, sort_keys: bool = False) -> str:
+    """Serialise ``obj`` as compact JSON for embedding in a prompt.
+
+    Indentation roughly doubles the serialised size of plans and critiques, and
+    every byte is billed as input tokens without helping the model read them.
+
+    Args:
+        obj: JSON-compatible value; unsupported types are rendered with ``str``.
+        sort_keys: Emit object keys in sorted order for byte-stable output.
+
+    Returns:
+        JSON text without insignificant whitespace.
+    """
+    return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS if sort_keys else 0).decode()
@@ -2,46 +2,24 @@
 
 from __future__ import annotations
 
-import json
-
-from repoman.agents.base import BaseAgent
-from repoman.core.state import AgentAuditReport, AgentVote, ChangeSet, Issue, RepoSnapshot
+from repoman.agents._json import dumps
+from repoman.agents.base import BaseAgent, _plans_json, _shared_json
+from repoman.core.state import AgentAuditReport, AgentVote, ChangeSet, RepoSnapshot
 from repoman.models.router import ModelRouter
 
+_AUDIT_PROMPT = """Audit this repository for architectural quality.
 
-class ArchitectAgent(BaseAgent):
-    """Architecture-focused agent powered by Claude."""
-
-    def __init__(self, router: ModelRouter) -> None:
-        """Initialise the Architect agent.
-
-        Args:
-            router: Model router instance.
-        """
-        super().__init__(name="Architect", role="architect", router=router)
-
-    async def audit(self, snapshot: RepoSnapshot) -> AgentAuditReport:
-        """Audit repository architecture and structure.
-
-        Args:
-            snapshot: Repository state.
-
-        Returns:
-            AgentAuditReport with architectural findings.
-        """
-        prompt = f"""Audit this repository for architectural quality.
-
-Repository: {snapshot.url}
-Primary language: {snapshot.primary_language}
-Frameworks: {", ".join(snapshot.frameworks)}
-Files: {len(snapshot.file_tree)}
-Has README: {snapshot.has_readme}
-Has tests: {snapshot.has_tests}
-Has CI: {snapshot.has_ci}
-Has Dockerfile: {snapshot.has_dockerfile}
+Repository: {url}
+Primary language: {language}
+Frameworks: {frameworks}
+Files: {file_count}
+Has README: {has_readme}
+Has tests: {has_tests}
+Has CI: {has_ci}
+Has Dockerfile: {has_dockerfile}
 
 File tree (first 50):
-{chr(10).join(snapshot.file_tree[:50])}
+{file_tree}
 
 Return a JSON object with exactly this structure:
 {{
@@ -57,51 +35,83 @@ Return a JSON object with exactly this structure:
   "executive_summary": "...",
   "estimated_effort": "..."
 }}"""
-        data = await self._call_llm_json(prompt)
-        return self._parse_audit_report(data)
 
-    def _parse_audit_report(self, data: dict) -> AgentAuditReport:
-        """Convert raw LLM JSON to an AgentAuditReport.
+_PROPOSE_PROMPT = """Based on these audit findings, propose an architectural improvement plan.
+
+Audit summaries:
+{summaries}
+
+Return a JSON object describing your proposed plan with keys: priority_order (list), steps (dict), rationale (str)."""
+
+_CRITIQUE_PROMPT = """Critique these proposed plans from an architectural perspective.
+
+Plans:
+{plans}
+
+Return a JSON object with keys: critiques (dict mapping agent_name to critique str), blocking_concerns (list), minor_concerns (list)."""
+
+_REVISE_PROMPT = """Revise your plan based on the critiques received.
+
+Your plan:
+{own_plan}
+
+Critiques:
+{critiques}
+
+Return your revised plan as a JSON object."""
+
+_VOTE_PROMPT = """Vote on this unified improvement plan from an architectural perspective.
+
+Plan:
+{plan}
+
+Return JSON with: agent_name (str), score (float 0-10), approve (bool), blocking_concerns (list), minor_concerns (list), rationale (str)."""
+
+_REVIEW_PROMPT = """Review these changes applied to the repository.
+
+Changes:
+{changes}
+
+Repository: {url} ({language})
+
+Return JSON with: approved (bool), rejections (list of str), concerns (list of str)."""
+
+
+class ArchitectAgent(BaseAgent):
+    """Architecture-focused agent powered by Claude."""
+
+    def __init__(self, router: ModelRouter) -> None:
+        """Initialise the Architect agent.
+
+        Args:
+            router: Model router instance.
+        """
+        super().__init__(name="Architect", role="architect", router=router)
+
+    async def audit(self, snapshot: RepoSnapshot) -> AgentAuditReport:
+        """Audit repository architecture and structure.
 
         Args:
-            data: Parsed JSON dictionary from the LLM.
+            snapshot: Repository state.
 
         Returns:
-            AgentAuditReport instance.
+            AgentAuditReport with architectural findings.
         """
-
-        def parse_issues(raw: list) -> list[Issue]:
-            issues = []
-            for item in raw:
-                if isinstance(item, dict):
-                    issues.append(
-                        Issue(
-                            severity=item.get("severity", "minor"),
-                            category=item.get("category", "architecture"),
-                            file_path=item.get("file_path"),
-                            line_number=item.get("line_number"),
-                            description=item.get("description", ""),
-                            suggested_fix=item.get("suggested_fix", ""),
-                        )
-                    )
-            return issues
-
-        return AgentAuditReport(
-            agent_name=self.name,
-            agent_role=self.role,
-            model_used=self._router._config.architect_model,
-            critical_issues=parse_issues(data.get("critical_issues", [])),
-            major_issues=parse_issues(data.get("major_issues", [])),
-            minor_issues=parse_issues(data.get("minor_issues", [])),
-            architecture_changes=data.get("architecture_changes", []),
-            new_files_needed=data.get("new_files_needed", []),
-            files_to_refactor=data.get("files_to_refactor", []),
-            files_to_delete=data.get("files_to_delete", []),
-            scores=data.get("scores", {}),
-            overall_score=float(data.get("overall_score", 0.0)),
-            executive_summary=data.get("executive_summary", ""),
-            estimated_effort=data.get("estimated_effort", ""),
+        prompt = _AUDIT_PROMPT.format_map(
+            {
+                "url": snapshot.url,
+                "language": snapshot.primary_language,
+                "frameworks": ", ".join(snapshot.frameworks),
+                "file_count": len(snapshot.file_tree),
+                "has_readme": snapshot.has_readme,
+                "has_tests": snapshot.has_tests,
+                "has_ci": snapshot.has_ci,
+                "has_dockerfile": snapshot.has_dockerfile,
+                "file_tree": "\n".join(snapshot.file_tree[:50]),
+            }
         )
+        data = await self._call_llm_json(prompt)
+        return self._parse_audit_report(data, "architecture")
 
     async def propose_plan(self, audit_reports: list[AgentAuditReport]) -> dict:
         """Propose an architectural improvement plan.
@@ -112,31 +122,22 @@ Return a JSON object with exactly this structure:
         Returns:
             Plan dictionary.
         """
-        summaries = "\n".join(f"- {r.agent_name}: {r.executive_summary}" for r in audit_reports)
-        prompt = f"""Based on these audit findings, propose an architectural improvement plan.
-
-Audit summaries:
-{summaries}
-
-Return a JSON object describing your proposed plan with keys: priority_order (list), steps (dict), rationale (str)."""
+        summaries = "\n".join([f"- {r.agent_name}: {r.executive_summary}" for r in audit_reports])
+        prompt = _PROPOSE_PROMPT.format_map({"summaries": summaries})
         return await self._call_llm_json(prompt)
 
-    async def critique_plans(self, other_plans: dict[str, dict]) -> dict:
+    async def critique_plans(self, all_plans: dict[str, dict], exclude: str | None = None) -> dict:
         """Critique other agents' proposals from an architectural perspective.
 
         Args:
-            other_plans: Mapping of agent name to their plan.
+            all_plans: Mapping of agent name to their plan.
+            exclude: Agent whose plan is left out, normally the caller's own.
 
         Returns:
             Critique dictionary.
         """
-        plans_text = json.dumps(other_plans, indent=2)
-        prompt = f"""Critique these proposed plans from an architectural perspective.
-
-Plans:
-{plans_text}
-
-Return a JSON object with keys: critiques (dict mapping agent_name to critique str), blocking_concerns (list), minor_concerns (list)."""
+        plans_text = _plans_json(all_plans, exclude)
+        prompt = _CRITIQUE_PROMPT.format_map({"plans": plans_text})
         return await self._call_llm_json(prompt)
 
     async def revise_plan(self, own_plan: dict, critiques: dict) -> dict:
@@ -149,15 +150,12 @@ Return a JSON object with keys: critiques (dict mapping agent_name to critique s
         Returns:
             Revised plan dictionary.
         """
-        prompt = f"""Revise your plan based on the critiques received.
-
-Your plan:
-{json.dumps(own_plan, indent=2)}
-
-Critiques:
-{json.dumps(critiques, indent=2)}
-
-Return your revised plan as a JSON object."""
+        prompt = _REVISE_PROMPT.format_map(
+            {
+                "own_plan": dumps(own_plan),
+                "critiques": _plans_json(critiques),
+            }
+        )
         return await self._call_llm_json(prompt)
 
     async def vote_on_plan(self, unified_plan: dict) -> AgentVote:
@@ -169,12 +167,7 @@ Return your revised plan as a JSON object."""
         Returns:
             AgentVote instance.
         """
-        prompt = f"""Vote on this unified improvement plan from an architectural perspective.
-
-Plan:
-{json.dumps(unified_plan, indent=2)}
-
-Return JSON with: agent_name (str), score (float 0-10), approve (bool), blocking_concerns (list), minor_concerns (list), rationale (str)."""
+        prompt = _VOTE_PROMPT.format_map({"plan": _shared_json(unified_plan)})
         data = await self._call_llm_json(prompt)
         score = float(data.get("score", 5.0))
         return AgentVote(
@@ -196,13 +189,12 @@ Return JSON with: agent_name (str), score (float 0-10), approve (bool), blocking
         Returns:
             Review result with 'approved' bool and 'rejections' list.
         """
-        changes_summary = "\n".join(f"- {cs.step_name}: {cs.summary}" for cs in change_sets)
-        prompt = f"""Review these changes applied to the repository.
-
-Changes:
-{changes_summary}
-
-Repository: {snapshot.url} ({snapshot.primary_language})
-
-Return JSON with: approved (bool), rejections (list of str), concerns (list of str)."""
+        changes_summary = "\n".join([f"- {cs.step_name}: {cs.summary}" for cs in change_sets])
+        prompt = _REVIEW_PROMPT.format_map(
+            {
+                "changes": changes_summary,
+                "url": snapshot.url,
+                "language": snapshot.primary_language,
+            }
+        )
         return await self._call_llm_json(prompt)
@@ -2,45 +2,22 @@
 
 from __future__ import annotations
 
-import json
+import itertools
 
-from repoman.agents.base import BaseAgent
-from repoman.core.state import AgentAuditReport, AgentVote, ChangeSet, Issue, RepoSnapshot
+from repoman.agents._json import dumps
+from repoman.agents.base import BaseAgent, _plans_json, _shared_json
+from repoman.core.state import AgentAuditReport, AgentVote, ChangeSet, RepoSnapshot
 from repoman.models.router import ModelRouter
 
+_AUDIT_PROMPT = """Perform an adversarial security and quality audit of this repository.
 
-class AuditorAgent(BaseAgent):
-    """Security and quality agent powered by GPT-4o."""
-
-    def __init__(self, router: ModelRouter) -> None:
-        """Initialise the Auditor agent.
-
-        Args:
-            router: Model router instance.
-        """
-        super().__init__(name="Auditor", role="auditor", router=router)
-
-    async def audit(self, snapshot: RepoSnapshot) -> AgentAuditReport:
-        """Audit repository for bugs, security issues, and code quality problems.
-
-        Args:
-            snapshot: Repository state.
-
-        Returns:
-            AgentAuditReport with security and quality findings.
-        """
-        files_preview = "\n".join(
-            f"{path}: {summary}" for path, summary in list(snapshot.file_summaries.items())[:30]
-        )
-        prompt = f"""Perform an adversarial security and quality audit of this repository.
-
-Repository: {snapshot.url}
-Language: {snapshot.primary_language}
-Frameworks: {", ".join(snapshot.frameworks)}
-Dependencies: {json.dumps(snapshot.dependencies[:20], indent=2)}
+Repository: {url}
+Language: {language}
+Frameworks: {frameworks}
+Dependencies: {dependencies}
 
 File summaries:
-{files_preview}
+{files}
 
 Find every bug, security vulnerability, performance issue, and code smell.
 
@@ -58,51 +35,83 @@ Return a JSON object with exactly this structure:
   "executive_summary": "...",
   "estimated_effort": "..."
 }}"""
-        data = await self._call_llm_json(prompt)
-        return self._parse_audit_report(data)
 
-    def _parse_audit_report(self, data: dict) -> AgentAuditReport:
-        """Convert raw LLM JSON to an AgentAuditReport.
+_PROPOSE_PROMPT = """Propose a security and quality improvement plan based on these critical issues.
+
+Critical issues:
+{critical_issues}
+
+Return a JSON object with keys: priority_order (list), steps (dict), rationale (str)."""
+
+_CRITIQUE_PROMPT = """Critique these plans from a security and quality perspective. Find gaps and risks.
+
+Plans:
+{plans}
+
+Return JSON with: critiques (dict), blocking_concerns (list), minor_concerns (list)."""
+
+_REVISE_PROMPT = """Revise your security plan based on critiques.
+
+Your plan:
+{own_plan}
+
+Critiques:
+{critiques}
+
+Return your revised plan as a JSON object."""
+
+_VOTE_PROMPT = """Vote on this unified plan from a security and quality perspective.
+
+Plan:
+{plan}
+
+Return JSON with: agent_name (str), score (float 0-10), approve (bool), blocking_concerns (list), minor_concerns (list), rationale (str)."""
+
+_REVIEW_PROMPT = """Review these code changes for security regressions or new vulnerabilities.
+
+Changes:
+{changes}
+
+Return JSON with: approved (bool), rejections (list of str), concerns (list of str)."""
+
+
+class AuditorAgent(BaseAgent):
+    """Security and quality agent powered by GPT-4o."""
+
+    def __init__(self, router: ModelRouter) -> None:
+        """Initialise the Auditor agent.
+
+        Args:
+            router: Model router instance.
+        """
+        super().__init__(name="Auditor", role="auditor", router=router)
+
+    async def audit(self, snapshot: RepoSnapshot) -> AgentAuditReport:
+        """Audit repository for bugs, security issues, and code quality problems.
 
         Args:
-            data: Parsed JSON dictionary from the LLM.
+            snapshot: Repository state.
 
         Returns:
-            AgentAuditReport instance.
+            AgentAuditReport with security and quality findings.
         """
-
-        def parse_issues(raw: list) -> list[Issue]:
-            issues = []
-            for item in raw:
-                if isinstance(item, dict):
-                    issues.append(
-                        Issue(
-                            severity=item.get("severity", "minor"),
-                            category=item.get("category", "bug"),
-                            file_path=item.get("file_path"),
-                            line_number=item.get("line_number"),
-                            description=item.get("description", ""),
-                            suggested_fix=item.get("suggested_fix", ""),
-                        )
-                    )
-            return issues
-
-        return AgentAuditReport(
-            agent_name=self.name,
-            agent_role=self.role,
-            model_used=self._router._config.auditor_model,
-            critical_issues=parse_issues(data.get("critical_issues", [])),
-            major_issues=parse_issues(data.get("major_issues", [])),
-            minor_issues=parse_issues(data.get("minor_issues", [])),
-            architecture_changes=data.get("architecture_changes", []),
-            new_files_needed=data.get("new_files_needed", []),
-            files_to_refactor=data.get("files_to_refactor", []),
-            files_to_delete=data.get("files_to_delete", []),
-            scores=data.get("scores", {}),
-            overall_score=float(data.get("overall_score", 0.0)),
-            executive_summary=data.get("executive_summary", ""),
-            estimated_effort=data.get("estimated_effort", ""),
+        files_preview = "\n".join(
+            [
+                f"{path}: {summary}"
+                for path, summary in itertools.islice(snapshot.file_summaries.items(), 30)
+            ]
+        )
+        prompt = _AUDIT_PROMPT.format_map(
+            {
+                "url": snapshot.url,
+                "language": snapshot.primary_language,
+                "frameworks": ", ".join(snapshot.frameworks),
+                "dependencies": dumps(snapshot.dependencies[:20]),
+                "files": files_preview,
+            }
         )
+        data = await self._call_llm_json(prompt)
+        return self._parse_audit_report(data, "bug")
 
     async def propose_plan(self, audit_reports: list[AgentAuditReport]) -> dict:
         """Propose a security and quality improvement plan.
@@ -116,29 +125,20 @@ Return a JSON object with exactly this structure:
         all_critical = [
             issue.model_dump() for report in audit_reports for issue in report.critical_issues
         ]
-        prompt = f"""Propose a security and quality improvement plan based on these critical issues.
-
-Critical issues:
-{json.dumps(all_critical, indent=2, default=str)}
-
-Return a JSON object with keys: priority_order (list), steps (dict), rationale (str)."""
+        prompt = _PROPOSE_PROMPT.format_map({"critical_issues": dumps(all_critical)})
         return await self._call_llm_json(prompt)
 
-    async def critique_plans(self, other_plans: dict[str, dict]) -> dict:
+    async def critique_plans(self, all_plans: dict[str, dict], exclude: str | None = None) -> dict:
         """Critique other agents' proposals from a security perspective.
 
         Args:
-            other_plans: Mapping of agent name to their plan.
+            all_plans: Mapping of agent name to their plan.
+            exclude: Agent whose plan is left out, normally the caller's own.
 
         Returns:
             Critique dictionary.
         """
-        prompt = f"""Critique these plans from a security and quality perspective. Find gaps and risks.
-
-Plans:
-{json.dumps(other_plans, indent=2)}
-
-Return JSON with: critiques (dict), blocking_concerns (list), minor_concerns (list)."""
+        prompt = _CRITIQUE_PROMPT.format_map({"plans": _plans_json(all_plans, exclude)})
         return await self._call_llm_json(prompt)
 
     async def revise_plan(self, own_plan: dict, critiques: dict) -> dict:
@@ -151,15 +151,12 @@ Return JSON with: critiques (dict), blocking_concerns (list), minor_concerns (li
         Returns:
             Revised plan dictionary.
         """
-        prompt = f"""Revise your security plan based on critiques.
-
-Your plan:
-{json.dumps(own_plan, indent=2)}
-
-Critiques:
-{json.dumps(critiques, indent=2)}
-
-Return your revised plan as a JSON object."""
+        prompt = _REVISE_PROMPT.format_map(
+            {
+                "own_plan": dumps(own_plan),
+                "critiques": _plans_json(critiques),
+            }
+        )
         return await self._call_llm_json(prompt)
 
     async def vote_on_plan(self, unified_plan: dict) -> AgentVote:
@@ -171,12 +168,7 @@ Return your revised plan as a JSON object."""
         Returns:
             AgentVote instance.
         """
-        prompt = f"""Vote on this unified plan from a security and quality perspective.
-
-Plan:
-{json.dumps(unified_plan, indent=2)}
-
-Return JSON with: agent_name (str), score (float 0-10), approve (bool), blocking_concerns (list), minor_concerns (list), rationale (str)."""
+        prompt = _VOTE_PROMPT.format_map({"plan": _shared_json(unified_plan)})
         data = await self._call_llm_json(prompt)
         score = float(data.get("score", 5.0))
         return AgentVote(
@@ -198,11 +190,6 @@ Return JSON with: agent_name (str), score (float 0-10), approve (bool), blocking
         Returns:
             Review result with 'approved' bool and 'rejections' list.
         """
-        changes_summary = "\n".join(f"- {cs.step_name}: {cs.summary}" for cs in change_sets)
-        prompt = f"""Review these code changes for security regressions or new vulnerabilities.
-
-Changes:
-{changes_summary}
-
-Return JSON with: approved (bool), rejections (list of str), concerns (list of str)."""
+        changes_summary = "\n".join([f"- {cs.step_name}: {cs.summary}" for cs in change_sets])
+        prompt = _REVIEW_PROMPT.format_map({"changes": changes_summary})
         return await self._call_llm_json(prompt)
@@ -2,21 +2,186 @@
 
 from __future__ import annotations
 
-import json
-import re
+import contextlib
+import functools
+import hashlib
+import os
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextvars import ContextVar
 from pathlib import Path
 
+import json5
+import orjson
 import structlog
-
-from repoman.core.state import AgentAuditReport, AgentVote, ChangeSet, RepoSnapshot
+from pydantic import TypeAdapter
+
+from repoman.agents._json import dumps
+from repoman.core.state import (
+    AgentAuditReport,
+    AgentVote,
+    ChangeSet,
+    Issue,
+    IssueDict,
+    RepoSnapshot,
+)
 from repoman.models.base import Message
-from repoman.models.router import ModelRouter
+from repoman.models.router import ModelRouter, prefix_cache_key
 
 log = structlog.get_logger()
 
 _PROMPTS_DIR = Path(__file__).parent / "prompts"
 
+_ISSUE_LIST_ADAPTER = TypeAdapter(list[Issue])
+
+
+class RenderCache:
+    """JSON renderings of debate inputs for one consensus round, keyed by identity.
+
+    Every agent in a round is sent the same plans, critiques and unified plan, so
+    each object is serialised once and the text reused. The cache holds its
+    objects only until the round ends; they must not be mutated before then.
+    """
+
+    __slots__ = ("_renders",)
+
+    def __init__(self) -> None:
+        self._renders: dict[int, tuple[object, str]] = {}
+
+    def render(self, value: object) -> str:
+        """Return the compact JSON for ``value``, serialising it on first use."""
+        cached = self._renders.get(id(value))
+        if cached is None or cached[0] is not value:
+            cached = self._renders[id(value)] = (value, dumps(value))
+        return cached[1]
+
+
+_round_renders: ContextVar[RenderCache | None] = ContextVar("round_renders", default=None)
+
+
+@contextlib.contextmanager
+def render_cache() -> Iterator[RenderCache]:
+    """Share one `RenderCache` between the agent calls made inside the block.
+
+    Tasks started inside the block inherit it; outside one, inputs are rendered
+    on every call.
+    """
+    cache = RenderCache()
+    token = _round_renders.set(cache)
+    try:
+        yield cache
+    finally:
+        _round_renders.reset(token)
+
+
+def _shared_json(value: object) -> str:
+    """Render a debate input that every agent in a round receives.
+
+    Inside `render_cache` the rendering is shared by all agents of the round;
+    outside one, ``value`` is serialised on every call.
+
+    Args:
+        value: Shared plan or critique.
+
+    Returns:
+        Compact JSON text.
+    """
+    cache = _round_renders.get()
+    return dumps(value) if cache is None else cache.render(value)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_prompt(role: str, name: str) -> str:
+    """Load (once per process) the system prompt for an agent role.
+
+    Args:
+        role: Agent role; selects ``prompts/<role>_system.md``.
+        name: Agent name used in the fallback prompt.
+
+    Returns:
+        System prompt string.
+    """
+    prompt_file = _PROMPTS_DIR / f"{role}_system.md"
+    if prompt_file.exists():
+        return prompt_file.read_text(encoding="utf-8")
+    return f"You are the {name} agent. Respond carefully and precisely."
+
+
+@functools.lru_cache(maxsize=64)
+def _render_repo_prefix(
+    url: str,
+    language: str,
+    frameworks: tuple[str, ...],
+    total_files: int,
+    total_lines: int,
+    has_readme: bool,
+    has_tests: bool,
+    has_ci: bool,
+    has_dockerfile: bool,
+) -> str:
+    """Render (once per distinct snapshot) the repository context for `BaseAgent._repo_prefix`."""
+    return (
+        f"Repository: {url}\n"
+        f"Primary language: {language}\n"
+        f"Frameworks: {', '.join(frameworks)}\n"
+        f"Total files: {total_files}\n"
+        f"Total lines: {total_lines}\n"
+        f"Has README: {has_readme}\n"
+        f"Has tests: {has_tests}\n"
+        f"Has CI: {has_ci}\n"
+        f"Has Dockerfile: {has_dockerfile}"
+    )
+
+
+def _strip_fences(content: str) -> str:
+    """Remove a surrounding markdown code fence (``` or ```json) from a reply.
+
+    Args:
+        content: Raw model response.
+
+    Returns:
+        The response body with fences and outer whitespace removed.
+    """
+    s = content.strip()
+    if s.startswith("```"):
+        s = s[3:].removeprefix("json")
+    if s.endswith("```"):
+        s = s[:-3]
+    return s.strip()
+
+
+def _plans_json(plans: dict[str, dict], exclude: str | None = None) -> str:
+    """Render a mapping of agent name to plan or critique, serialising each value once.
+
+    Every agent in a round is sent the same plans or critiques minus its own, so
+    each value is rendered once per round (see `render_cache`) and each agent's
+    JSON object is assembled from the pieces. The result equals ``dumps`` of the
+    filtered mapping.
+
+    Args:
+        plans: Mapping of agent name to plan or critique.
+        exclude: Name to leave out.
+
+    Returns:
+        Compact JSON text.
+    """
+    parts = [
+        f"{dumps(name)}:{_shared_json(value)}" for name, value in plans.items() if name != exclude
+    ]
+    return "{" + ",".join(parts) + "}"
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    """Write ``payload`` to ``path`` via a temp file; cache write failures are ignored."""
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+
 
 class BaseAgent(ABC):
     """Abstract agent that all concrete agents inherit from."""
@@ -32,18 +197,7 @@ class BaseAgent(ABC):
         self.name = name
         self.role = role
         self._router = router
-        self._system_prompt = self._load_system_prompt()
-
-    def _load_system_prompt(self) -> str:
-        """Load the system prompt from the corresponding .md file.
-
-        Returns:
-            System prompt string.
-        """
-        prompt_file = _PROMPTS_DIR / f"{self.role}_system.md"
-        if prompt_file.exists():
-            return prompt_file.read_text(encoding="utf-8")
-        return f"You are the {self.name} agent. Respond carefully and precisely."
+        self._system_prompt = _load_prompt(role, name)
 
     async def _call_llm(self, user_content: str) -> str:
         """Send a single user message and return the text response.
@@ -58,39 +212,163 @@ class BaseAgent(ABC):
         response = await self._router.complete(self.role, messages, self._system_prompt)
         return response.content
 
-    async def _call_llm_json(self, user_content: str) -> dict:
+    @staticmethod
+    def _repo_prefix(snapshot: RepoSnapshot) -> str:
+        """Render repository-wide context in a fixed format.
+
+        Passed as the ``context`` of `_call_llm_json` so every prompt about the
+        same repository starts with byte-identical text that providers can serve
+        from their prompt-prefix cache.
+
+        Args:
+            snapshot: Repository state.
+
+        Returns:
+            Repository context block.
+        """
+        return _render_repo_prefix(
+            snapshot.url,
+            snapshot.primary_language,
+            tuple(snapshot.frameworks),
+            snapshot.total_files,
+            snapshot.total_lines,
+            snapshot.has_readme,
+            snapshot.has_tests,
+            snapshot.has_ci,
+            snapshot.has_dockerfile,
+        )
+
+    async def _call_llm_json(self, user_content: str, *, context: str = "") -> dict:
         """Send a single user message expecting a JSON response.
 
-        Strips markdown code fences and parses the result.
+        When ``llm_cache_enabled`` is set, parsed replies are stored on disk keyed
+        by role, model, system prompt and message, and identical prompts are
+        answered from the cache without an LLM call.
+
+        Args:
+            user_content: Call-specific message content.
+            context: Invariant context (e.g. `_repo_prefix`) placed ahead of
+                ``user_content`` and used as the prompt-cache key.
+
+        Returns:
+            Parsed JSON dictionary.
+        """
+        cache_key = prefix_cache_key(self._system_prompt, context)
+        if context:
+            user_content = f"{context}\n\n{user_content}"
+        config = self._router._config
+        if not config.llm_cache_enabled:
+            return await self._request_llm_json(user_content, cache_key)
+
+        model = getattr(config, f"{self.role}_model", "")
+        key = hashlib.sha256(
+            "\0".join((self.role, model, self._system_prompt, user_content)).encode()
+        ).hexdigest()
+        path = Path(config.llm_cache_dir) / key[:2] / f"{key}.json"
+        try:
+            return orjson.loads(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            pass
+
+        data = await self._request_llm_json(user_content, cache_key)
+        _write_atomic(path, orjson.dumps(data))
+        return data
+
+    async def _request_llm_json(self, user_content: str, cache_key: str) -> dict:
+        """Request and parse a JSON reply from the LLM.
+
+        Strips markdown code fences and parses the result. Malformed JSON is
+        first retried with a lenient JSON5 parse, then by re-prompting once.
 
         Args:
             user_content: User message content.
+            cache_key: Provider prompt-cache key for the shared prefix.
 
         Returns:
             Parsed JSON dictionary.
         """
         messages = [Message(role="user", content=user_content)]
-        response = await self._router.complete_json(self.role, messages, self._system_prompt)
-        content = response.content.strip()
-        # Strip markdown fences if present
-        content = re.sub(r"^```(?:json)?\s*", "", content)
-        content = re.sub(r"\s*```$", "", content)
+        response = await self._router.complete_json(
+            self.role, messages, self._system_prompt, cache_key=cache_key
+        )
+        content = _strip_fences(response.content)
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+
+        # Trailing commas, comments and single quotes are common near-misses that a
+        # lenient local parse recovers without another LLM round-trip.
         try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            # Attempt to re-prompt once
-            messages.append(Message(role="assistant", content=response.content))
-            messages.append(
-                Message(
-                    role="user",
-                    content="Your response was not valid JSON. Please return only a valid JSON object.",
-                )
-            )
-            retry = await self._router.complete_json(self.role, messages, self._system_prompt)
-            retry_content = retry.content.strip()
-            retry_content = re.sub(r"^```(?:json)?\s*", "", retry_content)
-            retry_content = re.sub(r"\s*```$", "", retry_content)
-            return json.loads(retry_content)
+            data = json5.loads(content)
+        except ValueError:
+            log.warning("llm_invalid_json", agent=self.name, recovered=False)
+        else:
+            log.warning("llm_invalid_json", agent=self.name, recovered=True)
+            return data
+
+        # Attempt to re-prompt once, reusing the cached prompt prefix
+        retry = await self._router.complete_json_continue(
+            self.role,
+            messages,
+            response,
+            "Your response was not valid JSON. Please return only a valid JSON object.",
+            self._system_prompt,
+            cache_key=cache_key,
+        )
+        return orjson.loads(_strip_fences(retry.content))
+
+    def _parse_issues(self, raw: list[IssueDict] | None, default_category: str) -> list[Issue]:
+        """Validate a raw list of LLM issue dicts in a single batch.
+
+        Args:
+            raw: Issue dicts as returned by the LLM; non-dict items are skipped.
+            default_category: Category used when an item omits one.
+
+        Returns:
+            List of Issue instances.
+        """
+        return _ISSUE_LIST_ADAPTER.validate_python(
+            [
+                {
+                    "severity": item.get("severity", "minor"),
+                    "category": item.get("category", default_category),
+                    "file_path": item.get("file_path"),
+                    "line_number": item.get("line_number"),
+                    "description": item.get("description", ""),
+                    "suggested_fix": item.get("suggested_fix", ""),
+                }
+                for item in raw or ()
+                if isinstance(item, dict)
+            ]
+        )
+
+    def _parse_audit_report(self, data: dict, default_category: str) -> AgentAuditReport:
+        """Convert raw LLM JSON to an AgentAuditReport.
+
+        Args:
+            data: Parsed JSON dictionary from the LLM.
+            default_category: Issue category used when the LLM omits one.
+
+        Returns:
+            AgentAuditReport instance.
+        """
+        return AgentAuditReport(
+            agent_name=self.name,
+            agent_role=self.role,
+            model_used=getattr(self._router._config, f"{self.role}_model"),
+            critical_issues=self._parse_issues(data.get("critical_issues"), default_category),
+            major_issues=self._parse_issues(data.get("major_issues"), default_category),
+            minor_issues=self._parse_issues(data.get("minor_issues"), default_category),
+            architecture_changes=data.get("architecture_changes", []),
+            new_files_needed=data.get("new_files_needed", []),
+            files_to_refactor=data.get("files_to_refactor", []),
+            files_to_delete=data.get("files_to_delete", []),
+            scores=data.get("scores", {}),
+            overall_score=float(data.get("overall_score", 0.0)),
+            executive_summary=data.get("executive_summary", ""),
+            estimated_effort=data.get("estimated_effort", ""),
+        )
 
     @abstractmethod
     async def audit(self, snapshot: RepoSnapshot) -> AgentAuditReport:
@@ -115,11 +393,12 @@ class BaseAgent(ABC):
         """
 
     @abstractmethod
-    async def critique_plans(self, other_plans: dict[str, dict]) -> dict:
+    async def critique_plans(self, all_plans: dict[str, dict], exclude: str | None = None) -> dict:
         """Critique other agents' proposals.
 
         Args:
-            other_plans: Mapping of agent name to their plan.
+            all_plans: Mapping of agent name to their plan.
+            exclude: Agent whose plan is left out, normally the caller's own.
 
         Returns:
             Critique dictionary.
@@ -2,20 +2,88 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable
 
-from repoman.agents.base import BaseAgent
+from repoman.agents._json import dumps
+from repoman.agents.base import BaseAgent, _plans_json, _shared_json
+from repoman.constants import EXECUTION_ORDER
 from repoman.core.state import (
     AgentAuditReport,
     AgentVote,
     ChangeSet,
     FileChange,
-    Issue,
     RepoSnapshot,
 )
 from repoman.execution.file_ops import FileOps
 from repoman.models.router import ModelRouter
 
+_FILE_OP_CONCURRENCY = 32
+
+# Shared by every execution step so it sits in the cacheable prompt prefix.
+_CHANGESET_FORMAT = """Respond to each task below with a JSON ChangeSet:
+{
+  "step_name": "<the step being executed>",
+  "files_created": [{"path": "...", "action": "create", "content": "...", "summary": "..."}],
+  "files_modified": [{"path": "...", "action": "modify", "content": "...", "summary": "..."}],
+  "files_deleted": [],
+  "summary": "..."
+}"""
+
+
+def _plan_waves(steps: list[tuple[str, dict]]) -> list[list[tuple[str, dict]]]:
+    """Group ordered plan steps into waves that can be generated concurrently.
+
+    A step lands one wave after the latest earlier step that declares any of the
+    same files; steps without overlapping files share the earliest wave.
+
+    Args:
+        steps: ``(name, step)`` pairs in execution order.
+
+    Returns:
+        Waves of ``(name, step)`` pairs, each preserving execution order.
+    """
+    waves: list[list[tuple[str, dict]]] = []
+    last_wave_for_file: dict[str, int] = {}
+    for name, step in steps:
+        files = [f for f in step.get("files", []) if isinstance(f, str)]
+        wave = max((last_wave_for_file[f] + 1 for f in files if f in last_wave_for_file), default=0)
+        if wave == len(waves):
+            waves.append([])
+        waves[wave].append((name, step))
+        for f in files:
+            last_wave_for_file[f] = wave
+    return waves
+
+
+async def _apply_change_set(cs: ChangeSet, file_ops: FileOps, *, delete: bool = True) -> None:
+    """Write a ChangeSet's created/modified files and, optionally, its deletions.
+
+    Operations on distinct paths run concurrently (at most ``_FILE_OP_CONCURRENCY``
+    at once). When a path appears more than once, only its last operation in
+    created → modified → deleted order runs, which leaves the same final state as
+    applying them one by one.
+    """
+    ops: dict[str, Callable[[], Awaitable[None]]] = {}
+    for fc in cs.files_created:
+        if fc.content:
+            ops[fc.path] = functools.partial(file_ops.create_file, fc.path, fc.content)
+    for fc in cs.files_modified:
+        if fc.content:
+            ops[fc.path] = functools.partial(file_ops.modify_file, fc.path, fc.content)
+    if delete:
+        for path in cs.files_deleted:
+            ops[path] = functools.partial(file_ops.delete_file, path)
+
+    semaphore = asyncio.Semaphore(_FILE_OP_CONCURRENCY)
+
+    async def _run(op: Callable[[], Awaitable[None]]) -> None:
+        async with semaphore:
+            await op()
+
+    await asyncio.gather(*[_run(op) for op in ops.values()])
+
 
 class BuilderAgent(BaseAgent):
     """Implementation-focused agent powered by Claude Sonnet."""
@@ -37,76 +105,24 @@ class BuilderAgent(BaseAgent):
         Returns:
             AgentAuditReport with implementation findings.
         """
-        prompt = f"""Audit this repository for implementation quality.
-
-Repository: {snapshot.url}
-Language: {snapshot.primary_language}
-Has tests: {snapshot.has_tests}
-Has README: {snapshot.has_readme}
-Has CI: {snapshot.has_ci}
-Has Dockerfile: {snapshot.has_dockerfile}
-Total files: {snapshot.total_files}
-Total lines: {snapshot.total_lines}
+        prompt = """Audit this repository for implementation quality.
 
 Return a JSON object with:
-{{
+{
   "critical_issues": [],
-  "major_issues": [{{"severity": "major", "category": "docs", "file_path": null, "line_number": null, "description": "...", "suggested_fix": "..."}}],
+  "major_issues": [{"severity": "major", "category": "docs", "file_path": null, "line_number": null, "description": "...", "suggested_fix": "..."}],
   "minor_issues": [...],
   "architecture_changes": [],
-  "new_files_needed": [{{"path": "...", "purpose": "..."}}],
+  "new_files_needed": [{"path": "...", "purpose": "..."}],
   "files_to_refactor": [],
   "files_to_delete": [],
-  "scores": {{"architecture": 5.0, "code_quality": 5.0, "test_coverage": 5.0, "security": 5.0, "documentation": 5.0, "performance": 5.0, "maintainability": 5.0, "deployment_readiness": 5.0}},
+  "scores": {"architecture": 5.0, "code_quality": 5.0, "test_coverage": 5.0, "security": 5.0, "documentation": 5.0, "performance": 5.0, "maintainability": 5.0, "deployment_readiness": 5.0},
   "overall_score": 5.0,
   "executive_summary": "...",
   "estimated_effort": "..."
-}}"""
-        data = await self._call_llm_json(prompt)
-        return self._parse_audit_report(data)
-
-    def _parse_audit_report(self, data: dict) -> AgentAuditReport:
-        """Convert raw LLM JSON to an AgentAuditReport.
-
-        Args:
-            data: Parsed JSON dictionary from the LLM.
-
-        Returns:
-            AgentAuditReport instance.
-        """
-
-        def parse_issues(raw: list) -> list[Issue]:
-            issues = []
-            for item in raw:
-                if isinstance(item, dict):
-                    issues.append(
-                        Issue(
-                            severity=item.get("severity", "minor"),
-                            category=item.get("category", "docs"),
-                            file_path=item.get("file_path"),
-                            line_number=item.get("line_number"),
-                            description=item.get("description", ""),
-                            suggested_fix=item.get("suggested_fix", ""),
-                        )
-                    )
-            return issues
-
-        return AgentAuditReport(
-            agent_name=self.name,
-            agent_role=self.role,
-            model_used=self._router._config.builder_model,
-            critical_issues=parse_issues(data.get("critical_issues", [])),
-            major_issues=parse_issues(data.get("major_issues", [])),
-            minor_issues=parse_issues(data.get("minor_issues", [])),
-            architecture_changes=data.get("architecture_changes", []),
-            new_files_needed=data.get("new_files_needed", []),
-            files_to_refactor=data.get("files_to_refactor", []),
-            files_to_delete=data.get("files_to_delete", []),
-            scores=data.get("scores", {}),
-            overall_score=float(data.get("overall_score", 0.0)),
-            executive_summary=data.get("executive_summary", ""),
-            estimated_effort=data.get("estimated_effort", ""),
-        )
+}"""
+        data = await self._call_llm_json(prompt, context=self._repo_prefix(snapshot))
+        return self._parse_audit_report(data, "docs")
 
     async def propose_plan(self, audit_reports: list[AgentAuditReport]) -> dict:
         """Propose an implementation plan.
@@ -121,16 +137,17 @@ Return a JSON object with:
         prompt = f"""Propose an implementation plan: new files, tests, docs, and CI/CD setup.
 
 New files needed across all audits:
-{json.dumps(new_files, indent=2)}
+{dumps(new_files)}
 
 Return a JSON object with keys: priority_order (list), steps (dict), rationale (str)."""
         return await self._call_llm_json(prompt)
 
-    async def critique_plans(self, other_plans: dict[str, dict]) -> dict:
+    async def critique_plans(self, all_plans: dict[str, dict], exclude: str | None = None) -> dict:
         """Critique other agents' proposals from an implementation perspective.
 
         Args:
-            other_plans: Mapping of agent name to their plan.
+            all_plans: Mapping of agent name to their plan.
+            exclude: Agent whose plan is left out, normally the caller's own.
 
         Returns:
             Critique dictionary.
@@ -138,7 +155,7 @@ Return a JSON object with keys: priority_order (list), steps (dict), rationale (
         prompt = f"""Critique these plans from an implementation feasibility perspective.
 
 Plans:
-{json.dumps(other_plans, indent=2)}
+{_plans_json(all_plans, exclude)}
 
 Return JSON with: critiques (dict), blocking_concerns (list), minor_concerns (list)."""
         return await self._call_llm_json(prompt)
@@ -156,10 +173,10 @@ Return JSON with: critiques (dict), blocking_concerns (list), minor_concerns (li
         prompt = f"""Revise your implementation plan.
 
 Your plan:
-{json.dumps(own_plan, indent=2)}
+{dumps(own_plan)}
 
 Critiques:
-{json.dumps(critiques, indent=2)}
+{_plans_json(critiques)}
 
 Return your revised plan as a JSON object."""
         return await self._call_llm_json(prompt)
@@ -176,7 +193,7 @@ Return your revised plan as a JSON object."""
         prompt = f"""Vote on this unified plan from an implementation perspective.
 
 Plan:
-{json.dumps(unified_plan, indent=2)}
+{_shared_json(unified_plan)}
 
 Return JSON with: agent_name (str), score (float 0-10), approve (bool), blocking_concerns (list), minor_concerns (list), rationale (str)."""
         data = await self._call_llm_json(prompt)
@@ -200,14 +217,14 @@ Return JSON with: agent_name (str), score (float 0-10), approve (bool), blocking
         Returns:
             Review result with 'approved' bool and 'rejections' list.
         """
-        changes_summary = "\n".join(f"- {cs.step_name}: {cs.summary}" for cs in change_sets)
+        changes_summary = "\n".join([f"- {cs.step_name}: {cs.summary}" for cs in change_sets])
         prompt = f"""Review these changes for implementation quality and completeness.
 
 Changes:
 {changes_summary}
 
 Return JSON with: approved (bool), rejections (list of str), concerns (list of str)."""
-        return await self._call_llm_json(prompt)
+        return await self._call_llm_json(prompt, context=self._repo_prefix(snapshot))
 
     async def execute_plan(
         self,
@@ -215,7 +232,11 @@ Return JSON with: approved (bool), rejections (list of str), concerns (list of s
         snapshot: RepoSnapshot,
         file_ops: FileOps,
     ) -> list[ChangeSet]:
-        """Execute the unified plan step by step.
+        """Execute the unified plan in dependency-ordered waves.
+
+        Steps whose declared files do not overlap an earlier step's files share a
+        wave, and a wave's LLM calls run concurrently. Generated changes are
+        still applied in ``EXECUTION_ORDER`` so later steps win on conflicts.
 
         Args:
             unified_plan: The orchestrator's approved plan.
@@ -223,61 +244,54 @@ Return JSON with: approved (bool), rejections (list of str), concerns (list of s
             file_ops: File operations interface.
 
         Returns:
-            List of ChangeSets describing every change made.
+            List of ChangeSets describing every change made, in execution order.
         """
-        from repoman.constants import EXECUTION_ORDER
-
-        change_sets: list[ChangeSet] = []
         steps = unified_plan.get("steps", {})
+        ordered = [(name, steps[name]) for name in EXECUTION_ORDER if name in steps]
 
-        for step_name in EXECUTION_ORDER:
-            if step_name not in steps:
-                continue
-            step = steps[step_name]
-            prompt = f"""Execute this step: {step_name}
+        results: dict[str, ChangeSet] = {}
+        for wave in _plan_waves(ordered):
+            generated = await asyncio.gather(
+                *[self._generate_step(name, step, snapshot) for name, step in wave]
+            )
+            for cs in generated:
+                try:
+                    await _apply_change_set(cs, file_ops)
+                except Exception as exc:
+                    cs = ChangeSet(step_name=cs.step_name, summary=f"Step failed: {exc}")
+                results[cs.step_name] = cs
 
-Step description: {step.get("description", "")}
-Files to modify: {json.dumps(step.get("files", []))}
-Changes to make: {json.dumps(step.get("changes", []))}
+        return [results[name] for name, _ in ordered]
 
-Repository: {snapshot.url} ({snapshot.primary_language})
+    async def _generate_step(self, step_name: str, step: dict, snapshot: RepoSnapshot) -> ChangeSet:
+        """Ask the LLM for the ChangeSet implementing one plan step.
 
-Return a JSON ChangeSet:
-{{
-  "step_name": "{step_name}",
-  "files_created": [{{"path": "...", "action": "create", "content": "...", "summary": "..."}}],
-  "files_modified": [{{"path": "...", "action": "modify", "content": "...", "summary": "..."}}],
-  "files_deleted": [],
-  "summary": "..."
-}}"""
-            try:
-                data = await self._call_llm_json(prompt)
-                cs = ChangeSet(
-                    step_name=step_name,
-                    files_created=[FileChange(**f) for f in data.get("files_created", [])],
-                    files_modified=[FileChange(**f) for f in data.get("files_modified", [])],
-                    files_deleted=data.get("files_deleted", []),
-                    summary=data.get("summary", f"Completed {step_name}"),
-                )
-                # Apply changes
-                for fc in cs.files_created:
-                    if fc.content:
-                        await file_ops.create_file(fc.path, fc.content)
-                for fc in cs.files_modified:
-                    if fc.content:
-                        await file_ops.modify_file(fc.path, fc.content)
-                for path in cs.files_deleted:
-                    await file_ops.delete_file(path)
-                change_sets.append(cs)
-            except Exception as exc:
-                change_sets.append(
-                    ChangeSet(
-                        step_name=step_name,
-                        summary=f"Step failed: {exc}",
-                    )
-                )
-
-        return change_sets
+        Args:
+            step_name: Plan step key.
+            step: Step description from the unified plan.
+            snapshot: Current repository snapshot.
+
+        Returns:
+            Generated ChangeSet, or an empty one describing the failure.
+        """
+        prompt = f"""Execute this step: {step_name}
+
+Step description: {step.get("description", "")}
+Files to modify: {dumps(step.get("files", []), sort_keys=True)}
+Changes to make: {dumps(step.get("changes", []), sort_keys=True)}"""
+        try:
+            data = await self._call_llm_json(
+                prompt, context=f"{self._repo_prefix(snapshot)}\n\n{_CHANGESET_FORMAT}"
+            )
+            return ChangeSet(
+                step_name=step_name,
+                files_created=[FileChange(**f) for f in data.get("files_created", [])],
+                files_modified=[FileChange(**f) for f in data.get("files_modified", [])],
+                files_deleted=data.get("files_deleted", []),
+                summary=data.get("summary", f"Completed {step_name}"),
+            )
+        except Exception as exc:
+            return ChangeSet(step_name=step_name, summary=f"Step failed: {exc}")
 
     async def apply_fixes(
         self,
@@ -297,13 +311,11 @@ Return a JSON ChangeSet:
         """
         prompt = f"""Apply fixes for these review rejections:
 
-{json.dumps(rejections, indent=2)}
-
-Repository: {snapshot.url} ({snapshot.primary_language})
-
-Return a JSON ChangeSet with fixes applied."""
+{dumps(rejections)}"""
         try:
-            data = await self._call_llm_json(prompt)
+            data = await self._call_llm_json(
+                prompt, context=f"{self._repo_prefix(snapshot)}\n\n{_CHANGESET_FORMAT}"
+            )
             cs = ChangeSet(
                 step_name="apply_fixes",
                 files_created=[FileChange(**f) for f in data.get("files_created", [])],
@@ -311,12 +323,7 @@ Return a JSON ChangeSet with fixes applied."""
                 files_deleted=data.get("files_deleted", []),
                 summary=data.get("summary", "Applied reviewer fixes"),
             )
-            for fc in cs.files_created:
-                if fc.content:
-                    await file_ops.create_file(fc.path, fc.content)
-            for fc in cs.files_modified:
-                if fc.content:
-                    await file_ops.modify_file(fc.path, fc.content)
+            await _apply_change_set(cs, file_ops, delete=False)
             return [cs]
         except Exception as exc:
             return [ChangeSet(step_name="apply_fixes", summary=f"Fix failed: {exc}")]
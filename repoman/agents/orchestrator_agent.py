@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-import json
-
-from repoman.agents.base import BaseAgent
+from repoman.agents._json import dumps
+from repoman.agents.base import BaseAgent, _plans_json, _shared_json
 from repoman.core.state import AgentAuditReport, AgentVote, ChangeSet, RepoSnapshot
 from repoman.models.router import ModelRouter
 
@@ -31,42 +30,11 @@ class OrchestratorAgent(BaseAgent):
         """
         prompt = f"""Provide a high-level overview audit of this repository.
 
-Repository: {snapshot.url}
-Language: {snapshot.primary_language}
 Health score: {snapshot.health_score}
 
 Return a JSON object with the standard audit structure."""
-        data = await self._call_llm_json(prompt)
-        from repoman.core.state import Issue
-
-        def parse_issues(raw: list) -> list[Issue]:
-            issues = []
-            for item in raw:
-                if isinstance(item, dict):
-                    issues.append(
-                        Issue(
-                            severity=item.get("severity", "minor"),
-                            category=item.get("category", "architecture"),
-                            file_path=item.get("file_path"),
-                            line_number=item.get("line_number"),
-                            description=item.get("description", ""),
-                            suggested_fix=item.get("suggested_fix", ""),
-                        )
-                    )
-            return issues
-
-        return AgentAuditReport(
-            agent_name=self.name,
-            agent_role=self.role,
-            model_used=self._router._config.orchestrator_model,
-            critical_issues=parse_issues(data.get("critical_issues", [])),
-            major_issues=parse_issues(data.get("major_issues", [])),
-            minor_issues=parse_issues(data.get("minor_issues", [])),
-            scores=data.get("scores", {}),
-            overall_score=float(data.get("overall_score", 0.0)),
-            executive_summary=data.get("executive_summary", ""),
-            estimated_effort=data.get("estimated_effort", ""),
-        )
+        data = await self._call_llm_json(prompt, context=self._repo_prefix(snapshot))
+        return self._parse_audit_report(data, "architecture")
 
     async def propose_plan(self, audit_reports: list[AgentAuditReport]) -> dict:
         """Propose an orchestration-level plan.
@@ -85,11 +53,12 @@ Critical issues total: {sum(len(r.critical_issues) for r in audit_reports)}
 Return a JSON object with keys: priority_order (list), steps (dict), rationale (str)."""
         return await self._call_llm_json(prompt)
 
-    async def critique_plans(self, other_plans: dict[str, dict]) -> dict:
+    async def critique_plans(self, all_plans: dict[str, dict], exclude: str | None = None) -> dict:
         """Critique other agents' plans as a mediator.
 
         Args:
-            other_plans: Mapping of agent name to their plan.
+            all_plans: Mapping of agent name to their plan.
+            exclude: Agent whose plan is left out, normally the caller's own.
 
         Returns:
             Critique dictionary.
@@ -97,7 +66,7 @@ Return a JSON object with keys: priority_order (list), steps (dict), rationale (
         prompt = f"""As mediator, critique these plans for conflicts and gaps.
 
 Plans:
-{json.dumps(other_plans, indent=2)}
+{_plans_json(all_plans, exclude)}
 
 Return JSON with: critiques (dict), blocking_concerns (list), minor_concerns (list)."""
         return await self._call_llm_json(prompt)
@@ -115,10 +84,10 @@ Return JSON with: critiques (dict), blocking_concerns (list), minor_concerns (li
         prompt = f"""Revise the orchestration plan based on critiques.
 
 Plan:
-{json.dumps(own_plan, indent=2)}
+{dumps(own_plan)}
 
 Critiques:
-{json.dumps(critiques, indent=2)}
+{_plans_json(critiques)}
 
 Return your revised plan as a JSON object."""
         return await self._call_llm_json(prompt)
@@ -135,7 +104,7 @@ Return your revised plan as a JSON object."""
         prompt = f"""Vote on this unified plan from a holistic perspective.
 
 Plan:
-{json.dumps(unified_plan, indent=2)}
+{_shared_json(unified_plan)}
 
 Return JSON with: agent_name (str), score (float 0-10), approve (bool), blocking_concerns (list), minor_concerns (list), rationale (str)."""
         data = await self._call_llm_json(prompt)
@@ -159,14 +128,14 @@ Return JSON with: agent_name (str), score (float 0-10), approve (bool), blocking
         Returns:
             Review result with 'approved' bool and 'rejections' list.
         """
-        changes_summary = "\n".join(f"- {cs.step_name}: {cs.summary}" for cs in change_sets)
+        changes_summary = "\n".join([f"- {cs.step_name}: {cs.summary}" for cs in change_sets])
         prompt = f"""Review these changes for overall coherence and completeness.
 
 Changes:
 {changes_summary}
 
 Return JSON with: approved (bool), rejections (list of str), concerns (list of str)."""
-        return await self._call_llm_json(prompt)
+        return await self._call_llm_json(prompt, context=self._repo_prefix(snapshot))
 
     async def synthesize_plans(self, plans: dict[str, dict]) -> dict:
         """Synthesise multiple agent plans into one unified plan.
@@ -180,7 +149,7 @@ Return JSON with: approved (bool), rejections (list of str), concerns (list of s
         prompt = f"""Synthesise these agent plans into a single unified improvement plan.
 
 Plans:
-{json.dumps(plans, indent=2)}
+{dumps(plans)}
 
 Prioritise: critical bugs > security > architecture > tests > docs
 
@@ -209,7 +178,7 @@ Return a JSON unified plan with: priority_order (list), steps (dict keyed by ste
         prompt = f"""Consensus was not reached. Make a final binding decision.
 
 Plans submitted: {list(plans.keys())}
-Vote scores: {json.dumps(votes_summary, indent=2)}
+Vote scores: {dumps(votes_summary)}
 
 Return the best unified plan as a JSON object with: priority_order (list), steps (dict), rationale (str), estimated_improvement (float)."""
         return await self._call_llm_json(prompt)
@@ -11,6 +11,31 @@ class CompletenessResult:
     completeness_score: float
 
 
+_LABELS = ("README", "LICENSE", "CONTRIBUTING", "CI_CONFIG", "TESTS", "PACKAGE_MANAGER")
+
+# Indexed by the bit mask of present elements (bit i set => _LABELS[i] present).
+_MISSING_BY_MASK = tuple(
+    tuple(label for i, label in enumerate(_LABELS) if not mask >> i & 1)
+    for mask in range(1 << len(_LABELS))
+)
+_SCORE_BY_MASK = tuple(
+    round((mask.bit_count() / len(_LABELS)) * 100.0, 2) for mask in range(1 << len(_LABELS))
+)
+
+
+def _readme_ok(readme_text: str | None) -> bool:
+    """Whether the README has at least 500 characters once outer whitespace is stripped.
+
+    Only copies the text via ``strip()`` when it actually starts or ends with
+    whitespace; the common case is decided from its length and end characters.
+    """
+    if not readme_text or len(readme_text) < 500:
+        return False
+    if not (readme_text[0].isspace() or readme_text[-1].isspace()):
+        return True
+    return len(readme_text.strip()) >= 500
+
+
 def compute_completeness(
     *,
     readme_text: str | None,
@@ -33,22 +58,15 @@ def compute_completeness(
     Returns:
         CompletenessResult.
     """
-    missing: list[str] = []
-    readme_ok = bool(readme_text and len(readme_text.strip()) >= 500)
-    if not readme_ok:
-        missing.append("README")
-    if not has_license:
-        missing.append("LICENSE")
-    if not has_contributing:
-        missing.append("CONTRIBUTING")
-    if not has_ci_config:
-        missing.append("CI_CONFIG")
-    if not has_tests:
-        missing.append("TESTS")
-    if not has_package_manager_config:
-        missing.append("PACKAGE_MANAGER")
-
-    total = 6
-    present = total - len(missing)
-    score = round((present / total) * 100.0, 2)
-    return CompletenessResult(missing_elements=missing, completeness_score=score)
+    readme_ok = _readme_ok(readme_text)
+    mask = (
+        readme_ok
+        | has_license << 1
+        | has_contributing << 2
+        | has_ci_config << 3
+        | has_tests << 4
+        | has_package_manager_config << 5
+    )
+    return CompletenessResult(
+        missing_elements=list(_MISSING_BY_MASK[mask]), completeness_score=_SCORE_BY_MASK[mask]
+    )
@@ -2,79 +2,117 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
+from collections.abc import Callable
 from pathlib import Path
 
+import aiofiles  # type: ignore[import-untyped]
 
-def parse_dependencies(clone_path: str) -> list[dict]:
+_REQ_RE = re.compile(r"([A-Za-z0-9_\-.]+)([><=!~^]+.*)?")
+_CARGO_RE = re.compile(r'(\S+)\s*=\s*"([^"]+)"')
+_GOMOD_RE = re.compile(r"\s+(\S+)\s+v(\S+)")
+
+
+def _parse_requirements(text: str, dep_type: str) -> list[dict]:
+    """Parse a pip requirements file."""
+    deps: list[dict] = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        match = _REQ_RE.match(line)
+        if match:
+            deps.append(
+                {
+                    "name": match.group(1),
+                    "version": (match.group(2) or "").strip(),
+                    "type": dep_type,
+                }
+            )
+    return deps
+
+
+def _parse_package_json(text: str) -> list[dict]:
+    """Parse runtime and dev dependencies from package.json."""
+    deps: list[dict] = []
+    try:
+        pkg = json.loads(text)
+        for name, ver in pkg.get("dependencies", {}).items():
+            deps.append({"name": name, "version": ver, "type": "runtime"})
+        for name, ver in pkg.get("devDependencies", {}).items():
+            deps.append({"name": name, "version": ver, "type": "dev"})
+    except json.JSONDecodeError:
+        pass
+    return deps
+
+
+def _parse_cargo_toml(text: str) -> list[dict]:
+    """Parse the ``[dependencies]`` table of Cargo.toml (simple parsing)."""
+    deps: list[dict] = []
+    in_deps = False
+    for line in text.splitlines():
+        if "[dependencies]" in line:
+            in_deps = True
+            continue
+        if in_deps and line.startswith("["):
+            in_deps = False
+        if in_deps:
+            match = _CARGO_RE.match(line)
+            if match:
+                deps.append({"name": match.group(1), "version": match.group(2), "type": "runtime"})
+    return deps
+
+
+def _parse_go_mod(text: str) -> list[dict]:
+    """Parse indented ``require`` entries from go.mod."""
+    deps: list[dict] = []
+    for line in text.splitlines():
+        match = _GOMOD_RE.match(line)
+        if match:
+            deps.append(
+                {"name": match.group(1), "version": f"v{match.group(2)}", "type": "runtime"}
+            )
+    return deps
+
+
+# Manifest file name and its parser, in the order dependencies are reported.
+_MANIFESTS: tuple[tuple[str, Callable[[str], list[dict]]], ...] = (
+    ("requirements.txt", lambda text: _parse_requirements(text, "runtime")),
+    ("requirements-dev.txt", lambda text: _parse_requirements(text, "dev")),
+    ("package.json", _parse_package_json),
+    ("Cargo.toml", _parse_cargo_toml),
+    ("go.mod", _parse_go_mod),
+)
+
+
+async def _read_manifest(path: Path) -> str | None:
+    """Read a manifest file, returning None if it is missing or unreadable."""
+    try:
+        async with aiofiles.open(path, encoding="utf-8", errors="ignore") as f:
+            return await f.read()
+    except OSError:
+        return None
+
+
+async def parse_dependencies(clone_path: str) -> list[dict]:
     """Parse dependencies from manifest files.
 
+    All supported manifests are read concurrently, so slow storage costs one
+    round-trip rather than one per file.
+
     Args:
         clone_path: Root of the cloned repository.
 
     Returns:
         List of dicts with keys: name, version, type (runtime|dev).
     """
-    deps: list[dict] = []
     root = Path(clone_path)
+    texts = await asyncio.gather(*(_read_manifest(root / name) for name, _ in _MANIFESTS))
 
-    # Python — requirements.txt
-    for req_file in (root / "requirements.txt", root / "requirements-dev.txt"):
-        if req_file.exists():
-            dep_type = "dev" if "dev" in req_file.name else "runtime"
-            for line in req_file.read_text(encoding="utf-8", errors="ignore").splitlines():
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                match = re.match(r"([A-Za-z0-9_\-\.]+)([><=!~^]+.*)?", line)
-                if match:
-                    deps.append(
-                        {
-                            "name": match.group(1),
-                            "version": (match.group(2) or "").strip(),
-                            "type": dep_type,
-                        }
-                    )
-
-    # JavaScript — package.json
-    pkg_file = root / "package.json"
-    if pkg_file.exists():
-        try:
-            pkg = json.loads(pkg_file.read_text(encoding="utf-8", errors="ignore"))
-            for name, ver in pkg.get("dependencies", {}).items():
-                deps.append({"name": name, "version": ver, "type": "runtime"})
-            for name, ver in pkg.get("devDependencies", {}).items():
-                deps.append({"name": name, "version": ver, "type": "dev"})
-        except json.JSONDecodeError:
-            pass
-
-    # Rust — Cargo.toml (simple parsing)
-    cargo_file = root / "Cargo.toml"
-    if cargo_file.exists():
-        text = cargo_file.read_text(encoding="utf-8", errors="ignore")
-        in_deps = False
-        for line in text.splitlines():
-            if "[dependencies]" in line:
-                in_deps = True
-                continue
-            if in_deps and line.startswith("["):
-                in_deps = False
-            if in_deps:
-                match = re.match(r'(\S+)\s*=\s*"([^"]+)"', line)
-                if match:
-                    deps.append(
-                        {"name": match.group(1), "version": match.group(2), "type": "runtime"}
-                    )
-
-    # Go — go.mod
-    go_mod = root / "go.mod"
-    if go_mod.exists():
-        for line in go_mod.read_text(encoding="utf-8", errors="ignore").splitlines():
-            match = re.match(r"\s+([^\s]+)\s+v([^\s]+)", line)
-            if match:
-                deps.append(
-                    {"name": match.group(1), "version": f"v{match.group(2)}", "type": "runtime"}
-                )
-
+    deps: list[dict] = []
+    for (_, parse), text in zip(_MANIFESTS, texts, strict=True):
+        if text is not None:
+            deps.extend(parse(text))
     return deps
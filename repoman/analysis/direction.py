@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
 
 from elasticsearch import AsyncElasticsearch
 
 from repoman.elasticsearch.constants import ISSUES_INDEX
 
+# How far back closed issues and PRs count as "recent work".
+_RECENT_WINDOW = "now-90d"
+
 
 @dataclass(slots=True)
 class DirectionAssessment:
@@ -26,28 +28,21 @@ async def assess_repo_direction(
     """Assess whether recent work diverges from stated repo purpose."""
     resp = await es.search(
         index=ISSUES_INDEX,
-        size=20,
-        sort=[{"updated_at": {"order": "desc"}}],
+        size=0,
         query={
             "bool": {
                 "filter": [
                     {"term": {"repo_full_name": repo_full_name}},
                     {"term": {"state": "closed"}},
+                    {"range": {"updated_at": {"gte": _RECENT_WINDOW}}},
                 ]
             }
         },
-        source_includes=["labels", "is_pull_request", "title"],
+        aggs={"top_labels": {"terms": {"field": "labels", "size": 5}}},
     )
 
-    hits = (resp.get("hits") or {}).get("hits") or []
-    label_counts: dict[str, int] = {}
-    for h in hits:
-        src: dict[str, Any] = h.get("_source") or {}
-        for label in src.get("labels") or []:
-            label_counts[label] = label_counts.get(label, 0) + 1
-
-    top_labels = sorted(label_counts.items(), key=lambda kv: kv[1], reverse=True)[:5]
-    labels_list = [k for k, _ in top_labels]
+    buckets = ((resp.get("aggregations") or {}).get("top_labels") or {}).get("buckets") or []
+    labels_list = [b["key"] for b in buckets]
     topics_set = {t.lower() for t in repo_topics or []}
 
     diverges = bool(labels_list) and not any(label.lower() in topics_set for label in labels_list)
@@ -2,12 +2,34 @@
 
 from __future__ import annotations
 
+import functools
+import math
+import random
 from dataclasses import dataclass
 from typing import Any
 
+import structlog
 from elasticsearch import AsyncElasticsearch
 
 from repoman.elasticsearch.constants import ISSUES_INDEX
+from repoman.elasticsearch.indexer import bulk_index
+
+log = structlog.get_logger()
+
+# kNN queries sent per msearch request, to bound the request body size.
+_MSEARCH_BATCH = 50
+
+# Banded random-hyperplane LSH used to bucket embeddings into `dup_cluster` keys.
+# Each band hashes a vector to ``_LSH_BAND_BITS`` sign bits; two vectors are
+# candidates when any band matches. With 10 bands of 6 bits, pairs at cosine 0.85
+# share a key about 98% of the time and unrelated pairs about 12%.
+_LSH_BANDS = 10
+_LSH_BAND_BITS = 6
+_LSH_SEED = 0x5EED
+
+# A cluster usually shows up in several bands' buckets, so `find_duplicate_clusters`
+# fetches this many buckets per cluster it may return.
+_BUCKETS_PER_CLUSTER = 2
 
 
 @dataclass(slots=True)
@@ -17,25 +39,187 @@ class DuplicateIssueGroup:
     max_similarity: float
 
 
-def _connected_components(edges: dict[str, set[str]]) -> list[set[str]]:
-    seen: set[str] = set()
-    groups: list[set[str]] = []
+@functools.lru_cache(maxsize=4)
+def _lsh_planes(dims: int) -> tuple[tuple[float, ...], ...]:
+    """Fixed random hyperplanes for ``dims``-dimensional vectors (seeded, so stable)."""
+    rng = random.Random(_LSH_SEED)
+    return tuple(
+        tuple(rng.gauss(0.0, 1.0) for _ in range(dims)) for _ in range(_LSH_BANDS * _LSH_BAND_BITS)
+    )
+
+
+def duplicate_cluster_keys(vector: list[float]) -> list[str]:
+    """Hash an embedding into its `dup_cluster` buckets with banded LSH.
+
+    Vectors with a small angle between them fall on the same side of most
+    hyperplanes, so near-duplicate issues almost always agree on every bit of at
+    least one band and share that band's key. Sharing a key only makes two issues
+    candidates; `find_duplicate_clusters` compares their embeddings.
+
+    Args:
+        vector: Issue body embedding.
+
+    Returns:
+        One ``"<band>:<bits>"`` key per band; empty for an empty or zero vector.
+    """
+    if not any(vector):
+        return []
+    keys: list[str] = []
+    key = 0
+    for i, plane in enumerate(_lsh_planes(len(vector)), start=1):
+        key = key << 1 | (sum(p * v for p, v in zip(plane, vector, strict=True)) >= 0.0)
+        if i % _LSH_BAND_BITS == 0:
+            keys.append(f"{i // _LSH_BAND_BITS - 1}:{key:02x}")
+            key = 0
+    return keys
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b, strict=False))
+    norm = math.sqrt(sum(x * x for x in a) * sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class _DisjointSet:
+    """Union-find over issue ids with union by rank and path compression.
+
+    Ids are mapped to dense integers on first sight so parent, rank and the
+    per-root best similarity live in flat lists rather than string-keyed dicts.
+    """
+
+    __slots__ = ("best", "ids", "index", "parent", "rank")
+
+    def __init__(self) -> None:
+        self.index: dict[str, int] = {}
+        self.ids: list[str] = []
+        self.parent: list[int] = []
+        self.rank: list[int] = []
+        self.best: list[float] = []
+
+    def _add(self, x: str) -> int:
+        i = self.index.get(x)
+        if i is None:
+            i = self.index[x] = len(self.ids)
+            self.ids.append(x)
+            self.parent.append(i)
+            self.rank.append(0)
+            self.best.append(0.0)
+        return i
 
-    for node in edges:
-        if node in seen:
-            continue
-        stack = [node]
-        comp: set[str] = set()
-        while stack:
-            cur = stack.pop()
-            if cur in seen:
+    def _find(self, i: int) -> int:
+        parent = self.parent
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    def union(self, a: str, b: str, similarity: float = 0.0) -> None:
+        ra, rb = self._find(self._add(a)), self._find(self._add(b))
+        best = self.best
+        if ra != rb:
+            rank = self.rank
+            if rank[ra] < rank[rb]:
+                ra, rb = rb, ra
+            self.parent[rb] = ra
+            if rank[ra] == rank[rb]:
+                rank[ra] += 1
+            best[ra] = max(best[ra], best[rb])
+        best[ra] = max(best[ra], similarity)
+
+    def components(self) -> list[tuple[list[str], float]]:
+        """Return every set with more than one member and its best similarity.
+
+        Members are collected in one walk over the ids in sorted order, so each
+        list is already sorted and its first id is the smallest.
+        """
+        groups: dict[int, list[str]] = {}
+        index = self.index
+        for x in sorted(self.ids):
+            # No setdefault: it would build a throwaway list for every member.
+            root = self._find(index[x])
+            group = groups.get(root)
+            if group is None:
+                groups[root] = [x]
+            else:
+                group.append(x)
+        return [(g, self.best[root]) for root, g in groups.items() if len(g) > 1]
+
+
+async def _knn_neighbors(
+    es: AsyncElasticsearch,
+    issues: list[dict[str, Any]],
+    *,
+    repo_full_name: str,
+    per_issue_k: int,
+    vector_lookup: bool,
+) -> dict[str, list[dict[str, Any]]]:
+    """Find each issue's nearest open issues with batched kNN searches.
+
+    Returns:
+        Mapping of issue id to ``{"issue_id", "score"}`` neighbors, best first.
+        Issues whose search failed or got no response are left out, so they are
+        searched again on the next run rather than stored as having no neighbors.
+    """
+    neighbors: dict[str, list[dict[str, Any]]] = {}
+    for start in range(0, len(issues), _MSEARCH_BATCH):
+        batch = issues[start : start + _MSEARCH_BATCH]
+        searches: list[dict[str, Any]] = []
+        for issue in batch:
+            if vector_lookup:
+                vector: dict[str, Any] = {
+                    "query_vector_builder": {
+                        "lookup": {
+                            "index": ISSUES_INDEX,
+                            "id": issue["_id"],
+                            "path": "body_embedding",
+                        }
+                    }
+                }
+            else:
+                vector = {"query_vector": issue["body_embedding"]}
+            searches.append({"index": ISSUES_INDEX})
+            searches.append(
+                {
+                    "size": per_issue_k,
+                    "knn": {
+                        "field": "body_embedding",
+                        **vector,
+                        "k": per_issue_k,
+                        "num_candidates": 100,
+                        "filter": {
+                            "bool": {
+                                "filter": [
+                                    {"term": {"repo_full_name": repo_full_name}},
+                                    {"term": {"state": "open"}},
+                                ],
+                                "must_not": [{"term": {"issue_id": issue["issue_id"]}}],
+                            }
+                        },
+                    },
+                    "_source": ["issue_id"],
+                }
+            )
+        msearch_resp = await es.msearch(searches=searches)
+
+        # Responses come back in request order, one per issue in the batch.
+        responses = msearch_resp.get("responses") or []
+        for i, issue in enumerate(batch):
+            knn_resp = responses[i] if i < len(responses) else None
+            if knn_resp is None or "error" in knn_resp:
+                log.warning(
+                    "duplicate_knn_failed",
+                    issue_id=issue["issue_id"],
+                    error=(knn_resp or {}).get("error", "missing msearch response"),
+                )
                 continue
-            seen.add(cur)
-            comp.add(cur)
-            stack.extend(list(edges.get(cur, set()) - seen))
-        if len(comp) > 1:
-            groups.append(comp)
-    return groups
+            found = neighbors[issue["issue_id"]] = []
+            for hit in (knn_resp.get("hits") or {}).get("hits") or []:
+                other = (hit.get("_source") or {}).get("issue_id")
+                if other:
+                    found.append({"issue_id": other, "score": float(hit.get("_score") or 0.0)})
+    return neighbors
 
 
 async def find_duplicate_issue_groups(
@@ -44,88 +228,194 @@ async def find_duplicate_issue_groups(
     repo_full_name: str,
     threshold: float = 0.85,
     per_issue_k: int = 5,
+    vector_lookup: bool = False,
+    store_neighbors: bool = False,
 ) -> list[DuplicateIssueGroup]:
     """Detect potential duplicate open issues within a repo.
 
+    Issues whose ``duplicate_neighbors`` were stored by an earlier run reuse them;
+    only the rest are sent kNN searches. Re-indexing an issue drops its stored
+    neighbors, so edited issues are searched again.
+
     Args:
         es: Elasticsearch client.
         repo_full_name: Owner/repo.
-        threshold: Similarity threshold for grouping.
+        threshold: Minimum similarity for grouping, on Elasticsearch's cosine
+            ``_score`` scale of ``(1 + cos) / 2``; 0.85 is a cosine of 0.70.
         per_issue_k: Neighbors to fetch per issue.
+        vector_lookup: Have Elasticsearch (9.4+) resolve each query vector from the
+            stored document via ``query_vector_builder.lookup`` instead of fetching
+            the embeddings and sending them back.
+        store_neighbors: Write newly searched neighbors back to the issue
+            documents for later runs.
 
     Returns:
         List of DuplicateIssueGroup.
     """
+    filters: list[dict[str, Any]] = [
+        {"term": {"repo_full_name": repo_full_name}},
+        {"term": {"state": "open"}},
+    ]
+    if vector_lookup:
+        filters.append({"exists": {"field": "body_embedding"}})
+    source = ["issue_id", "duplicate_neighbors"]
     resp = await es.search(
         index=ISSUES_INDEX,
         size=500,
-        query={
-            "bool": {
-                "filter": [
-                    {"term": {"repo_full_name": repo_full_name}},
-                    {"term": {"state": "open"}},
-                ]
-            }
-        },
-        source_includes=["issue_id", "body_embedding"],
+        query={"bool": {"filter": filters}},
+        source_includes=source if vector_lookup else [*source, "body_embedding"],
     )
     hits = (resp.get("hits") or {}).get("hits") or []
-    issues: list[dict[str, Any]] = [h.get("_source") for h in hits if h.get("_source")]
-    issues = [i for i in issues if i.get("issue_id") and i.get("body_embedding")]
-
-    edges: dict[str, set[str]] = {i["issue_id"]: set() for i in issues}
-    max_sim: dict[tuple[str, str], float] = {}
+    issues: list[dict[str, Any]] = []
+    for hit in hits:
+        src = hit.get("_source") or {}
+        if src.get("issue_id") and (vector_lookup or src.get("body_embedding")):
+            issues.append({**src, "_id": hit.get("_id") or src["issue_id"]})
 
+    # Stored neighbors may name issues closed since; fresh kNN hits are open already.
+    open_ids = {issue["issue_id"] for issue in issues}
+    stored: dict[str, list[dict[str, Any]]] = {}
+    pending: list[dict[str, Any]] = []
     for issue in issues:
-        issue_id = issue["issue_id"]
-        vec = issue["body_embedding"]
-        knn_resp = await es.search(
-            index=ISSUES_INDEX,
-            size=per_issue_k,
-            knn={
-                "field": "body_embedding",
-                "query_vector": vec,
-                "k": per_issue_k,
-                "num_candidates": 100,
-                "filter": {
-                    "bool": {
-                        "filter": [
-                            {"term": {"repo_full_name": repo_full_name}},
-                            {"term": {"state": "open"}},
-                        ],
-                        "must_not": [{"term": {"issue_id": issue_id}}],
-                    }
-                },
-            },
-            source_includes=["issue_id"],
+        if isinstance(issue.get("duplicate_neighbors"), list):
+            stored[issue["issue_id"]] = [
+                n for n in issue["duplicate_neighbors"] if n.get("issue_id") in open_ids
+            ]
+        else:
+            pending.append(issue)
+
+    searched = await _knn_neighbors(
+        es,
+        pending,
+        repo_full_name=repo_full_name,
+        per_issue_k=per_issue_k,
+        vector_lookup=vector_lookup,
+    )
+    if store_neighbors and searched:
+        ids = {issue["issue_id"]: issue["_id"] for issue in pending}
+        await bulk_index(
+            es,
+            [
+                {
+                    "_op_type": "update",
+                    "_index": ISSUES_INDEX,
+                    "_id": ids[issue_id],
+                    "_source": {"doc": {"duplicate_neighbors": found}},
+                }
+                for issue_id, found in searched.items()
+            ],
         )
 
-        for hit in (knn_resp.get("hits") or {}).get("hits") or []:
-            other = (hit.get("_source") or {}).get("issue_id")
-            sim = float(hit.get("_score") or 0.0)
-            if not other or sim < threshold:
-                continue
-            edges.setdefault(issue_id, set()).add(other)
-            edges.setdefault(other, set()).add(issue_id)
-            key = tuple(sorted((issue_id, other)))
-            max_sim[key] = max(max_sim.get(key, 0.0), sim)
+    dsu = _DisjointSet()
+    for neighbors in (stored, searched):
+        for issue_id, found in neighbors.items():
+            for n in found:
+                sim = float(n.get("score") or 0.0)
+                if sim >= threshold:
+                    dsu.union(issue_id, n["issue_id"], sim)
 
-    components = _connected_components(edges)
     groups: list[DuplicateIssueGroup] = []
-    for comp in components:
-        sorted_ids = sorted(comp)
-        rep = sorted_ids[0]
-        best = 0.0
-        for i in range(len(sorted_ids)):
-            for j in range(i + 1, len(sorted_ids)):
-                best = max(best, max_sim.get((sorted_ids[i], sorted_ids[j]), 0.0))
-
+    for members, best in dsu.components():
         groups.append(
             DuplicateIssueGroup(
-                representative_issue_id=rep,
-                issue_ids=sorted_ids,
+                representative_issue_id=members[0],
+                issue_ids=members,
                 max_similarity=round(best, 4),
             )
         )
 
     return groups
+
+
+async def find_duplicate_clusters(
+    es: AsyncElasticsearch,
+    *,
+    repo_full_name: str,
+    threshold: float = 0.85,
+    max_clusters: int = 20,
+    bucket_size: int = 8,
+) -> list[DuplicateIssueGroup]:
+    """Group open issues that share a `dup_cluster` key with a single aggregation.
+
+    A cheaper, approximate alternative to `find_duplicate_issue_groups` for
+    dashboards: Elasticsearch buckets issues by their indexing-time LSH keys, and
+    members of the same bucket are compared client-side. Pairs at or above
+    ``threshold`` are merged, so an issue found through several bands lands in a
+    single group. Issues indexed before `dup_cluster` existed are not grouped.
+
+    Args:
+        es: Elasticsearch client.
+        repo_full_name: Owner/repo.
+        threshold: Minimum similarity for grouping, on the same ``(1 + cos) / 2``
+            scale as `find_duplicate_issue_groups`.
+        max_clusters: Largest number of clusters to return. At most
+            ``_BUCKETS_PER_CLUSTER`` times as many of the largest buckets are
+            fetched.
+        bucket_size: Members (with embeddings) fetched and compared per bucket.
+
+    Returns:
+        List of DuplicateIssueGroup, largest clusters first.
+    """
+    resp = await es.search(
+        index=ISSUES_INDEX,
+        size=0,
+        query={
+            "bool": {
+                "filter": [
+                    {"term": {"repo_full_name": repo_full_name}},
+                    {"term": {"state": "open"}},
+                    {"exists": {"field": "dup_cluster"}},
+                ]
+            }
+        },
+        aggs={
+            "clusters": {
+                "terms": {
+                    "field": "dup_cluster",
+                    "size": min(max_clusters * _BUCKETS_PER_CLUSTER, _LSH_BANDS << _LSH_BAND_BITS),
+                    "min_doc_count": 2,
+                },
+                "aggs": {
+                    "members": {
+                        "top_hits": {
+                            "size": bucket_size,
+                            "sort": [{"issue_id": "asc"}],
+                            "_source": ["issue_id", "body_embedding"],
+                        }
+                    }
+                },
+            }
+        },
+    )
+    buckets = ((resp.get("aggregations") or {}).get("clusters") or {}).get("buckets") or []
+
+    dsu = _DisjointSet()
+    compared: set[tuple[str, str]] = set()
+    for bucket in buckets:
+        hits = ((bucket.get("members") or {}).get("hits") or {}).get("hits") or []
+        members = [
+            (src["issue_id"], src.get("body_embedding") or [])
+            for src in (hit.get("_source") or {} for hit in hits)
+            if src.get("issue_id")
+        ]
+        for i, (a, vec_a) in enumerate(members):
+            for b, vec_b in members[i + 1 :]:
+                # Issues sharing several bands meet in several buckets.
+                if (a, b) in compared:
+                    continue
+                compared.add((a, b))
+                # Same scale as the kNN ``_score`` that find_duplicate_issue_groups uses.
+                sim = (1.0 + _cosine(vec_a, vec_b)) / 2.0
+                if sim >= threshold:
+                    dsu.union(a, b, sim)
+
+    groups = [
+        DuplicateIssueGroup(
+            representative_issue_id=members[0],
+            issue_ids=members,
+            max_similarity=round(best, 4),
+        )
+        for members, best in dsu.components()
+    ]
+    groups.sort(key=lambda g: len(g.issue_ids), reverse=True)
+    return groups[:max_clusters]
@@ -5,6 +5,17 @@ from __future__ import annotations
 from repoman.constants import HEALTH_WEIGHTS
 from repoman.core.state import RepoSnapshot
 
+# HEALTH_WEIGHTS is a constant, so its items and total are taken once at import.
+_HEALTH_ITEMS: tuple[tuple[str, float], ...] = tuple(HEALTH_WEIGHTS.items())
+_HEALTH_TOTAL: float = sum(weight for _, weight in _HEALTH_ITEMS)
+
+# Hygiene bonuses; bit i of a snapshot's mask is set when _BONUSES[i] applies.
+_BONUSES = (10.0, 15.0, 10.0, 5.0, 5.0, 5.0)  # readme, tests, ci, dockerfile, license, env
+_BONUS_BY_MASK = tuple(
+    sum(bonus for i, bonus in enumerate(_BONUSES) if mask >> i & 1)
+    for mask in range(1 << len(_BONUSES))
+)
+
 
 def compute_initial_health_score(snapshot: RepoSnapshot) -> float:
     """Compute a heuristic health score for a repository snapshot.
@@ -17,24 +28,20 @@ def compute_initial_health_score(snapshot: RepoSnapshot) -> float:
     Returns:
         Health score between 0 and 100.
     """
-    score = 30.0
-    if snapshot.has_readme:
-        score += 10.0
-    if snapshot.has_tests:
-        score += 15.0
-    if snapshot.has_ci:
-        score += 10.0
-    if snapshot.has_dockerfile:
-        score += 5.0
-    if snapshot.has_license:
-        score += 5.0
-    if snapshot.has_env_example:
-        score += 5.0
+    mask = (
+        snapshot.has_readme
+        | snapshot.has_tests << 1
+        | snapshot.has_ci << 2
+        | snapshot.has_dockerfile << 3
+        | snapshot.has_license << 4
+        | snapshot.has_env_example << 5
+    )
+    score = 30.0 + _BONUS_BY_MASK[mask]
     # Reasonable file size: not too tiny, not too huge
     if 5 <= snapshot.total_files <= 500:
         score += 5.0
     # Penalise very large files count
-    if snapshot.total_files > 1000:
+    elif snapshot.total_files > 1000:
         score -= 10.0
     return min(max(score, 0.0), 100.0)
 
@@ -48,10 +55,9 @@ def compute_weighted_score(dimension_scores: dict[str, float]) -> float:
     Returns:
         Weighted score on a 0-10 scale.
     """
+    if _HEALTH_TOTAL <= 0:
+        return 0.0
     total = 0.0
-    weight_sum = 0.0
-    for dim, weight in HEALTH_WEIGHTS.items():
-        score = dimension_scores.get(dim, 5.0)
-        total += score * weight
-        weight_sum += weight
-    return round(total / weight_sum if weight_sum > 0 else 0.0, 2)
+    for dim, weight in _HEALTH_ITEMS:
+        total += dimension_scores.get(dim, 5.0) * weight
+    return round(total / _HEALTH_TOTAL, 2)
@@ -3,17 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
 import tempfile
-from pathlib import Path
+from concurrent.futures import Executor, ThreadPoolExecutor
 
 import structlog
 
 from repoman.analysis.dependency import parse_dependencies
 from repoman.analysis.health import compute_initial_health_score
 from repoman.analysis.language import detect_frameworks, detect_languages
+from repoman.analysis.structure import FileRecord, count_newlines, scan_repo
 from repoman.config import Settings
-from repoman.constants import SKIP_DIRS
 from repoman.core.state import RepoSnapshot
 
 log = structlog.get_logger()
@@ -22,13 +23,16 @@ log = structlog.get_logger()
 class RepoIngester:
     """Clones and analyses a remote git repository."""
 
-    def __init__(self, config: Settings) -> None:
+    def __init__(self, config: Settings, *, io_pool: Executor | None = None) -> None:
         """Initialise the ingester.
 
         Args:
             config: Application settings.
+            io_pool: Executor for the blocking file-tree scan; defaults to the event
+                loop's default executor.
         """
         self._config = config
+        self._io_pool = io_pool
 
     async def ingest(self, repo_url: str) -> RepoSnapshot:
         """Clone the repository and build a RepoSnapshot.
@@ -69,51 +73,16 @@ class RepoIngester:
         Returns:
             Populated RepoSnapshot.
         """
-        repo_root = Path(clone_path)
         name = repo_url.rstrip("/").split("/")[-1].replace(".git", "")
 
-        # Walk file tree
-        file_tree: list[str] = []
-        total_lines = 0
-        file_summaries: dict[str, str] = {}
-
-        for root, dirs, files in os.walk(clone_path):
-            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-            for fname in files:
-                fpath = Path(root) / fname
-                rel = str(fpath.relative_to(repo_root))
-                file_tree.append(rel)
-
-                # Count lines for supported text files
-                try:
-                    size_kb = fpath.stat().st_size / 1024
-                    if size_kb <= self._config.max_file_size_kb:
-                        text = fpath.read_text(encoding="utf-8", errors="ignore")
-                        lines = text.count("\n")
-                        total_lines += lines
-                        file_summaries[rel] = f"{lines} lines"
-                except (OSError, PermissionError):
-                    pass
-
-                if len(file_tree) >= self._config.max_files_to_process:
-                    break
-
-        languages = detect_languages(clone_path, self._config.max_file_size_kb)
-        frameworks = detect_frameworks(clone_path)
-        dependencies = parse_dependencies(clone_path)
-        entry_points = _find_entry_points(clone_path, languages)
-
-        # Check existence of key files
-        has_readme = any(f.lower().startswith("readme") for f in file_tree)
-        has_tests = any("test" in f.lower() for f in file_tree)
-        has_ci = any(
-            ".github/workflows" in f or ".circleci" in f or "Jenkinsfile" in f for f in file_tree
-        )
-        has_dockerfile = any(
-            f.lower() == "dockerfile" or "dockerfile" in f.lower() for f in file_tree
+        # Filesystem work runs off the event loop; manifests are read meanwhile.
+        loop = asyncio.get_running_loop()
+        scan, dependencies = await asyncio.gather(
+            loop.run_in_executor(self._io_pool, self._scan_tree, clone_path),
+            parse_dependencies(clone_path),
         )
-        has_license = any(f.lower().startswith("license") for f in file_tree)
-        has_env_example = any(".env.example" in f or ".env.sample" in f for f in file_tree)
+        file_tree, total_lines, file_summaries, languages, frameworks, entry_points, flags = scan
+        has_readme, has_tests, has_ci, has_dockerfile, has_license, has_env_example = flags
 
         primary_language = max(languages, key=lambda k: languages[k], default="")
 
@@ -140,12 +109,84 @@ class RepoIngester:
         snapshot.health_score = compute_initial_health_score(snapshot)
         return snapshot
 
+    def _scan_tree(
+        self, clone_path: str
+    ) -> tuple[
+        list[str], int, dict[str, str], dict[str, float], list[str], list[str], tuple[bool, ...]
+    ]:
+        """Walk the clone once and derive every file-based metric from that walk.
+
+        Line counts are read on a thread pool.
+
+        Args:
+            clone_path: Local path to the cloned repo.
+
+        Returns:
+            File tree, total lines, per-file summaries, languages, frameworks,
+            entry points and the `_key_file_flags` of the tree.
+        """
+        records = scan_repo(clone_path)
+        capped = records[: self._config.max_files_to_process]
+        file_tree = [record.rel_path for record in capped]
+        flags = _key_file_flags(file_tree)
+
+        max_bytes = self._config.max_file_size_kb * 1024
+        total_lines = 0
+        file_summaries: dict[str, str] = {}
+        if capped:
+            with ThreadPoolExecutor(max_workers=min(32, len(capped))) as pool:
+                counts = pool.map(functools.partial(_count_lines, max_bytes=max_bytes), capped)
+                for rel, lines in zip(file_tree, counts, strict=True):
+                    if lines is not None:
+                        total_lines += lines
+                        file_summaries[rel] = f"{lines} lines"
+
+        languages = detect_languages(clone_path, self._config.max_file_size_kb, records=records)
+        frameworks = detect_frameworks(clone_path, records=records)
+        entry_points = _find_entry_points(records, languages)
+        return file_tree, total_lines, file_summaries, languages, frameworks, entry_points, flags
+
 
-def _find_entry_points(clone_path: str, languages: dict[str, float]) -> list[str]:
+def _key_file_flags(file_tree: list[str]) -> tuple[bool, bool, bool, bool, bool, bool]:
+    """Check for key project files in a single pass over the tree.
+
+    Each path is lower-cased once and the walk stops as soon as every flag is set.
+
+    Args:
+        file_tree: Relative file paths of the cloned repo.
+
+    Returns:
+        has_readme, has_tests, has_ci, has_dockerfile, has_license, has_env_example.
+    """
+    readme = tests = ci = dockerfile = license_ = env_example = False
+    for path in file_tree:
+        lo = path.lower()
+        readme = readme or lo.startswith("readme")
+        tests = tests or "test" in lo
+        ci = ci or ".github/workflows" in path or ".circleci" in path or "Jenkinsfile" in path
+        dockerfile = dockerfile or "dockerfile" in lo
+        license_ = license_ or lo.startswith("license")
+        env_example = env_example or ".env.example" in path or ".env.sample" in path
+        if readme and tests and ci and dockerfile and license_ and env_example:
+            break
+    return readme, tests, ci, dockerfile, license_, env_example
+
+
+def _count_lines(record: FileRecord, *, max_bytes: int) -> int | None:
+    """Count newlines in a file no larger than ``max_bytes``; None if skipped or unreadable."""
+    if record.size is None or record.size > max_bytes:
+        return None
+    try:
+        return count_newlines(record.abs_path)
+    except OSError:
+        return None
+
+
+def _find_entry_points(records: list[FileRecord], languages: dict[str, float]) -> list[str]:
     """Identify likely entry point files.
 
     Args:
-        clone_path: Root of the cloned repo.
+        records: Files of the cloned repo, from `scan_repo`.
         languages: Detected language distribution.
 
     Returns:
@@ -169,9 +210,5 @@ def _find_entry_points(clone_path: str, languages: dict[str, float]) -> list[str
         "index.php",
         "main.rb",
     ]
-    found = []
-    root = Path(clone_path)
-    for candidate in candidates:
-        if (root / candidate).exists():
-            found.append(candidate)
-    return found
+    present = {record.rel_path for record in records}
+    return [candidate for candidate in candidates if candidate in present]
@@ -3,40 +3,39 @@
 from __future__ import annotations
 
 import os
-from pathlib import Path
+import re
 
-from repoman.constants import EXTENSION_TO_LANGUAGE, SKIP_DIRS
+from repoman.analysis.structure import FileRecord, count_newlines, scan_repo
+from repoman.constants import EXTENSION_TO_LANGUAGE
 
 
-def detect_languages(clone_path: str, max_file_size_kb: int = 500) -> dict[str, float]:
+def detect_languages(
+    clone_path: str, max_file_size_kb: int = 500, *, records: list[FileRecord] | None = None
+) -> dict[str, float]:
     """Detect programming languages by extension weighted by line count.
 
     Args:
         clone_path: Root of the cloned repository.
         max_file_size_kb: Skip files larger than this.
+        records: Result of `scan_repo` for ``clone_path``, to avoid walking it again.
 
     Returns:
         Dict mapping language name to fraction of total lines (0.0–1.0).
     """
+    if records is None:
+        records = scan_repo(clone_path)
+    max_bytes = max_file_size_kb * 1024
     counts: dict[str, int] = {}
 
-    for dirpath, dirnames, filenames in os.walk(clone_path):
-        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
-        for fname in filenames:
-            ext = Path(fname).suffix.lower()
-            lang = EXTENSION_TO_LANGUAGE.get(ext)
-            if not lang:
-                continue
-            fpath = Path(dirpath) / fname
-            try:
-                size_kb = fpath.stat().st_size / 1024
-                if size_kb > max_file_size_kb:
-                    continue
-                text = fpath.read_text(encoding="utf-8", errors="ignore")
-                lines = text.count("\n") + 1
-                counts[lang] = counts.get(lang, 0) + lines
-            except (OSError, PermissionError):
-                continue
+    for record in records:
+        lang = EXTENSION_TO_LANGUAGE.get(record.ext)
+        if not lang or record.size is None or record.size > max_bytes:
+            continue
+        try:
+            lines = count_newlines(record.abs_path) + 1
+        except OSError:
+            continue
+        counts[lang] = counts.get(lang, 0) + lines
 
     total = sum(counts.values()) or 1
     return {
@@ -44,66 +43,55 @@ def detect_languages(clone_path: str, max_file_size_kb: int = 500) -> dict[str,
     }
 
 
-def detect_frameworks(clone_path: str) -> list[str]:
+# Manifest -> (marker, framework) pairs, in reporting order. Markers are matched
+# case-insensitively as substrings of the manifest.
+_FRAMEWORK_MARKERS: tuple[tuple[str, tuple[tuple[str, str], ...]], ...] = (
+    (
+        "requirements.txt",
+        (("django", "Django"), ("flask", "Flask"), ("fastapi", "FastAPI"), ("tornado", "Tornado")),
+    ),
+    (
+        "package.json",
+        (
+            ('"react"', "React"),
+            ('"vue"', "Vue"),
+            ('"express"', "Express"),
+            ('"next"', "Next.js"),
+            ('"svelte"', "Svelte"),
+        ),
+    ),
+    ("Cargo.toml", (("actix", "Actix"), ("rocket", "Rocket"), ("axum", "Axum"))),
+    ("go.mod", (("gin", "Gin"), ("echo", "Echo"), ("fiber", "Fiber"))),
+)
+
+# One alternation per manifest, so each file is scanned once for all its markers.
+_FRAMEWORK_PATTERNS = tuple(
+    (name, re.compile("|".join(re.escape(m) for m, _ in markers), re.IGNORECASE), markers)
+    for name, markers in _FRAMEWORK_MARKERS
+)
+
+
+def detect_frameworks(clone_path: str, *, records: list[FileRecord] | None = None) -> list[str]:
     """Detect frameworks from package manifest files.
 
     Args:
         clone_path: Root of the cloned repository.
+        records: Result of `scan_repo` for ``clone_path``; when given, manifests
+            missing from it are skipped without touching the filesystem.
 
     Returns:
         List of detected framework names.
     """
+    present = None if records is None else {record.rel_path for record in records}
     frameworks: list[str] = []
-    root = Path(clone_path)
-
-    # Python
-    req_file = root / "requirements.txt"
-    if req_file.exists():
-        text = req_file.read_text(encoding="utf-8", errors="ignore").lower()
-        if "django" in text:
-            frameworks.append("Django")
-        if "flask" in text:
-            frameworks.append("Flask")
-        if "fastapi" in text:
-            frameworks.append("FastAPI")
-        if "tornado" in text:
-            frameworks.append("Tornado")
-
-    # JavaScript / TypeScript
-    pkg_file = root / "package.json"
-    if pkg_file.exists():
-        text = pkg_file.read_text(encoding="utf-8", errors="ignore").lower()
-        if '"react"' in text:
-            frameworks.append("React")
-        if '"vue"' in text:
-            frameworks.append("Vue")
-        if '"express"' in text:
-            frameworks.append("Express")
-        if '"next"' in text:
-            frameworks.append("Next.js")
-        if '"svelte"' in text:
-            frameworks.append("Svelte")
-
-    # Rust
-    cargo_file = root / "Cargo.toml"
-    if cargo_file.exists():
-        text = cargo_file.read_text(encoding="utf-8", errors="ignore").lower()
-        if "actix" in text:
-            frameworks.append("Actix")
-        if "rocket" in text:
-            frameworks.append("Rocket")
-        if "axum" in text:
-            frameworks.append("Axum")
-
-    # Go
-    go_mod = root / "go.mod"
-    if go_mod.exists():
-        text = go_mod.read_text(encoding="utf-8", errors="ignore").lower()
-        if "gin-gonic" in text or "gin" in text:
-            frameworks.append("Gin")
-        if "echo" in text:
-            frameworks.append("Echo")
-        if "fiber" in text:
-            frameworks.append("Fiber")
-
-    return list(dict.fromkeys(frameworks))  # deduplicate preserving order
+    for name, pattern, markers in _FRAMEWORK_PATTERNS:
+        if present is not None and name not in present:
+            continue
+        try:
+            with open(os.path.join(clone_path, name), encoding="utf-8", errors="ignore") as f:
+                text = f.read()
+        except OSError:
+            continue
+        found = {m.lower() for m in pattern.findall(text)}
+        frameworks.extend(label for marker, label in markers if marker in found)
+    return frameworks
@@ -45,24 +45,25 @@ async def query_stale_counts(
         {"range": {"updated_at": {"lt": cutoff}}},
     ]
 
-    issues_count = await es.count(
+    # One request buckets issues and PRs, instead of a count per type.
+    resp = await es.search(
         index=ISSUES_INDEX,
-        query={
-            "bool": {
-                "filter": common_filter + [{"term": {"is_pull_request": False}}],
-            }
-        },
-    )
-    prs_count = await es.count(
-        index=ISSUES_INDEX,
-        query={
-            "bool": {
-                "filter": common_filter + [{"term": {"is_pull_request": True}}],
+        size=0,
+        query={"bool": {"filter": common_filter}},
+        aggs={
+            "by_type": {
+                "filters": {
+                    "filters": {
+                        "issues": {"term": {"is_pull_request": False}},
+                        "prs": {"term": {"is_pull_request": True}},
+                    }
+                }
             }
         },
     )
+    buckets = ((resp.get("aggregations") or {}).get("by_type") or {}).get("buckets") or {}
 
     return StaleCounts(
-        stale_issues_count=int(issues_count.get("count", 0)),
-        stale_prs_count=int(prs_count.get("count", 0)),
+        stale_issues_count=int((buckets.get("issues") or {}).get("doc_count", 0)),
+        stale_prs_count=int((buckets.get("prs") or {}).get("doc_count", 0)),
     )
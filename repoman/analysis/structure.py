@@ -2,10 +2,96 @@
 
 from __future__ import annotations
 
+import os
+from dataclasses import dataclass
 from pathlib import Path
 
 from repoman.constants import SKIP_DIRS
 
+_READ_CHUNK = 1 << 16
+
+
+def count_newlines(path: str | Path) -> int:
+    """Count ``\\n`` bytes in a file without decoding it.
+
+    Reads in 64 KiB chunks, so memory stays flat regardless of file size.
+
+    Args:
+        path: File to scan.
+
+    Returns:
+        Number of newline characters.
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    n = 0
+    with open(path, "rb", buffering=0) as f:
+        while chunk := f.read(_READ_CHUNK):
+            n += chunk.count(b"\n")
+    return n
+
+
+@dataclass(slots=True)
+class FileRecord:
+    rel_path: str
+    abs_path: str
+    size: int | None  # None when the file could not be stat'ed (e.g. a broken symlink)
+    ext: str  # lower-cased suffix including the dot, or ""
+
+
+def _suffix(name: str) -> str:
+    """Lower-cased ``Path(name).suffix`` computed with string operations."""
+    dot = name.rfind(".")
+    return name[dot:].lower() if 0 < dot < len(name) - 1 else ""
+
+
+def scan_repo(root_path: str) -> list[FileRecord]:
+    """Walk a directory once and describe every non-ignored file.
+
+    Files are listed in the same order as a top-down ``os.walk``: a directory's
+    files, then its subdirectories in listing order. Directories named in
+    ``SKIP_DIRS`` and symlinked directories are not descended into.
+
+    Args:
+        root_path: Root directory to walk.
+
+    Returns:
+        One FileRecord per file.
+    """
+    prefix_len = len(os.path.join(root_path, ""))
+    records: list[FileRecord] = []
+    stack = [root_path]
+    while stack:
+        subdirs: list[str] = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if entry.name not in SKIP_DIRS and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                        continue
+                    try:
+                        size: int | None = entry.stat().st_size
+                    except OSError:
+                        size = None
+                    records.append(
+                        FileRecord(
+                            rel_path=entry.path[prefix_len:],
+                            abs_path=entry.path,
+                            size=size,
+                            ext=_suffix(entry.name),
+                        )
+                    )
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+    return records
+
 
 def build_file_tree(root_path: str) -> list[str]:
     """Walk a directory and return relative paths of all non-ignored files.
@@ -16,16 +102,7 @@ def build_file_tree(root_path: str) -> list[str]:
     Returns:
         Sorted list of relative file paths.
     """
-    import os
-
-    files: list[str] = []
-    root = Path(root_path)
-    for dirpath, dirnames, filenames in os.walk(root_path):
-        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
-        for fname in filenames:
-            fpath = Path(dirpath) / fname
-            files.append(str(fpath.relative_to(root)))
-    return sorted(files)
+    return sorted(record.rel_path for record in scan_repo(root_path))
 
 
 def get_directory_structure(file_tree: list[str]) -> dict:
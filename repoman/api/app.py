@@ -2,35 +2,64 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from repoman.api.job_runner import JobRunner
+from repoman.api.job_store import JobStore
 from repoman.api.routes import analyze, dashboard, jobs, repos, search, ws
-from repoman.config import Settings
+from repoman.config import Settings, get_settings
 from repoman.core.events import EventBus
+from repoman.core.pipeline import Pipeline
 from repoman.elasticsearch.client import es_lifespan
-from repoman.embeddings.encoder import create_encoder
+from repoman.elasticsearch.coalescer import MSearchCoalescer
+from repoman.embeddings.batcher import EncoderBatcher
+from repoman.embeddings.encoder import CachedEncoder, create_encoder
 
 
 def create_app(config: Settings | None = None) -> FastAPI:
     """Create and configure the FastAPI application.
 
     Args:
-        config: Application settings. Defaults to Settings().
+        config: Application settings. Defaults to `get_settings()`.
 
     Returns:
         Configured FastAPI application instance.
     """
-    cfg = config or Settings()
+    cfg = config or get_settings()
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         async with es_lifespan(cfg) as es:
             app.state.elasticsearch = es
-            app.state.encoder = create_encoder(cfg)
-            yield
+            app.state.es_coalescer = (
+                MSearchCoalescer(es, window_seconds=cfg.elasticsearch_msearch_window_ms / 1000)
+                if es is not None and cfg.elasticsearch_msearch_window_ms > 0
+                else None
+            )
+            # The API encodes search queries only, which repeat often.
+            app.state.encoder = CachedEncoder(create_encoder(cfg))
+            app.state.encode_batcher = EncoderBatcher(app.state.encoder)
+            app.state.io_pool = ThreadPoolExecutor(
+                max_workers=cfg.io_workers, thread_name_prefix="repoman-io"
+            )
+            app.state.job_runner = JobRunner(cfg.max_concurrent_jobs)
+            # Shared by every job, so agents and LLM connection pools are built once.
+            app.state.pipeline = Pipeline(
+                cfg, event_bus=app.state.event_bus, io_pool=app.state.io_pool
+            )
+            try:
+                yield
+            finally:
+                await app.state.job_runner.aclose()
+                await app.state.pipeline.aclose()
+                await app.state.encode_batcher.aclose()
+                if app.state.es_coalescer is not None:
+                    await app.state.es_coalescer.aclose()
+                app.state.io_pool.shutdown(wait=False)
 
     app = FastAPI(
         title="RepoMan API",
@@ -49,7 +78,7 @@ def create_app(config: Settings | None = None) -> FastAPI:
 
     # Attach shared state
     app.state.config = cfg
-    app.state.jobs = {}
+    app.state.jobs = JobStore(maxsize=cfg.max_jobs, ttl_seconds=cfg.job_ttl_seconds)
     app.state.event_bus = EventBus()
 
     # Register routers
@@ -0,0 +1,63 @@
+"""In-process runner for pipeline jobs started by the API."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import structlog
+
+log = structlog.get_logger()
+
+
+class JobRunner:
+    """Run submitted jobs as detached tasks, at most ``max_concurrent`` at once.
+
+    Unlike FastAPI ``BackgroundTasks``, jobs are not tied to the request that
+    started them, excess jobs wait in line instead of all competing for the event
+    loop and the LLM providers, and running jobs are cancelled on shutdown.
+    """
+
+    def __init__(self, max_concurrent: int) -> None:
+        """Initialise the runner.
+
+        Args:
+            max_concurrent: Number of jobs allowed to run at the same time.
+        """
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._tasks: set[asyncio.Task] = set()
+
+    def submit(
+        self,
+        job_id: str,
+        job: Callable[[], Awaitable[None]],
+        *,
+        on_error: Callable[[BaseException], None] | None = None,
+    ) -> None:
+        """Queue a job to run once a slot is free.
+
+        Args:
+            job_id: Job identifier, used for the task name and logging.
+            job: Zero-argument coroutine function that runs the job.
+            on_error: Called with the exception if ``job`` raises.
+        """
+
+        async def run() -> None:
+            async with self._slots:
+                try:
+                    await job()
+                except Exception as exc:
+                    log.error("job_failed", job_id=job_id, error=str(exc))
+                    if on_error is not None:
+                        on_error(exc)
+
+        task = asyncio.create_task(run(), name=f"job-{job_id}")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def aclose(self) -> None:
+        """Cancel queued and running jobs and wait for them to stop."""
+        for task in self._tasks:
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -0,0 +1,59 @@
+"""Bounded, expiring store for API job records."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
+from typing import Any
+
+
+class JobStore(MutableMapping[str, dict[str, Any]]):
+    """Job records keyed by job ID, dropped after ``ttl_seconds`` or beyond ``maxsize``.
+
+    Finished jobs keep their full `PipelineResult` (transcripts included), so an
+    unbounded dict grows for the life of the process. Records expire a fixed time
+    after they were created and the oldest go first once the store is full.
+    Expiry is checked lazily on access, so no background task is needed.
+    """
+
+    def __init__(self, *, maxsize: int, ttl_seconds: float) -> None:
+        """Initialise an empty store.
+
+        Args:
+            maxsize: Most records kept; adding one more drops the oldest.
+            ttl_seconds: Age after which a record is dropped.
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._data: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def _expire(self) -> None:
+        deadline = time.monotonic() - self._ttl
+        while self._data:
+            created, _ = next(iter(self._data.values()))
+            if created > deadline:
+                break
+            self._data.popitem(last=False)
+
+    def __getitem__(self, job_id: str) -> dict[str, Any]:
+        self._expire()
+        return self._data[job_id][1]
+
+    def __setitem__(self, job_id: str, job: dict[str, Any]) -> None:
+        self._expire()
+        self._data.pop(job_id, None)
+        self._data[job_id] = (time.monotonic(), job)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def __delitem__(self, job_id: str) -> None:
+        del self._data[job_id]
+
+    def __iter__(self) -> Iterator[str]:
+        self._expire()
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._data)
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 
+import orjson
+import structlog
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 from repoman.api.schemas import AnalyzeRepoRequest, AnalyzeRepoResponse
 from repoman.config import Settings
 from repoman.elasticsearch.ingestion import ElasticsearchIngestionService
 
+log = structlog.get_logger()
+
 router = APIRouter(prefix="/api/analyze", tags=["analyze"])
 
 
@@ -44,3 +50,28 @@ async def analyze_repo(request: Request, body: AnalyzeRepoRequest) -> AnalyzeRep
         )
     finally:
         await service.aclose()
+
+
+@router.post("/repo/stream")
+async def analyze_repo_stream(request: Request, body: AnalyzeRepoRequest) -> StreamingResponse:
+    """Run repo analysis, streaming each stage as a line of NDJSON.
+
+    Lines carry a ``stage`` key (see `ElasticsearchIngestionService.analyze_repo_stream`);
+    the last is ``complete`` with the full analysis, or ``error`` with a ``detail``.
+    """
+    es = _get_es(request)
+    config: Settings = request.app.state.config
+    service = ElasticsearchIngestionService(config, es=es)
+
+    async def lines() -> AsyncIterator[bytes]:
+        try:
+            async for stage in service.analyze_repo_stream(body.repo_full_name):
+                yield orjson.dumps(stage) + b"\n"
+        except Exception as exc:
+            # Headers are already sent, so the failure is reported in-band.
+            log.warning("analyze_stream_failed", repo=body.repo_full_name, error=str(exc))
+            yield orjson.dumps({"stage": "error", "detail": str(exc)}) + b"\n"
+        finally:
+            await service.aclose()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
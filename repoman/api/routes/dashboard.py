@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
+
 from fastapi import APIRouter, HTTPException, Request
 
+from repoman.analysis.duplicates import find_duplicate_clusters
 from repoman.elasticsearch.constants import ANALYSIS_DATA_STREAM, ISSUES_INDEX, REPOSITORIES_INDEX
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
@@ -99,3 +102,11 @@ async def avg_time_to_close(request: Request) -> dict:
         },
     )
     return {"buckets": (resp.get("aggregations") or {}).get("by_repo", {}).get("buckets", [])}
+
+
+@router.get("/duplicate-clusters")
+async def duplicate_clusters(request: Request, repo_full_name: str) -> dict:
+    """Approximate duplicate-issue clusters for one repo, from `dup_cluster` buckets."""
+    es = _get_es(request)
+    groups = await find_duplicate_clusters(es, repo_full_name=repo_full_name)
+    return {"groups": [asdict(g) for g in groups]}
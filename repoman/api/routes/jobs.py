@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException, Request
 
+from repoman.api.job_store import JobStore
 from repoman.api.schemas import JobStatusResponse
 from repoman.core.state import PipelineResult
 
@@ -24,7 +25,7 @@ async def get_job(job_id: str, request: Request) -> JobStatusResponse:
     Raises:
         HTTPException: 404 if the job is not found.
     """
-    jobs: dict = request.app.state.jobs
+    jobs: JobStore = request.app.state.jobs
     job = jobs.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -58,7 +59,7 @@ async def get_transcript(job_id: str, request: Request) -> dict:
     Raises:
         HTTPException: 404 if the job is not found.
     """
-    jobs: dict = request.app.state.jobs
+    jobs: JobStore = request.app.state.jobs
     job = jobs.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import os
 import uuid
+from collections import deque
 
-from fastapi import APIRouter, BackgroundTasks, Request
+from fastapi import APIRouter, Request
 
 from repoman.api.schemas import TransformRequest, TransformResponse
 from repoman.core.pipeline import Pipeline
@@ -12,35 +14,49 @@ from repoman.core.state import JobStatus, PipelineResult
 
 router = APIRouter(prefix="/api/repos", tags=["repos"])
 
+_JOB_ID_BATCH = 256
+_job_ids: deque[str] = deque()
+
+
+def _new_job_id() -> str:
+    """Return a random UUID4 string, drawing entropy for a batch of IDs per syscall."""
+    if not _job_ids:
+        raw = os.urandom(16 * _JOB_ID_BATCH)
+        _job_ids.extend(
+            str(uuid.UUID(bytes=raw[i : i + 16], version=4)) for i in range(0, len(raw), 16)
+        )
+    return _job_ids.popleft()
+
 
 @router.post("/transform", response_model=TransformResponse)
 async def transform_repo(
     body: TransformRequest,
-    background_tasks: BackgroundTasks,
     request: Request,
 ) -> TransformResponse:
     """Enqueue a repository transformation job.
 
     Args:
         body: Request with repo_url.
-        background_tasks: FastAPI background task runner.
         request: The incoming request (used to access app state).
 
     Returns:
         TransformResponse with job_id and status.
     """
-    job_id = str(uuid.uuid4())
-    jobs: dict = request.app.state.jobs
-    jobs[job_id] = {"status": JobStatus.queued, "result": None}
+    job_id = _new_job_id()
+    # Updated through this reference, since the store may drop the record meanwhile.
+    job: dict = {"status": JobStatus.queued, "result": None}
+    request.app.state.jobs[job_id] = job
 
-    config = request.app.state.config
-    pipeline = Pipeline(config, event_bus=getattr(request.app.state, "event_bus", None))
+    pipeline: Pipeline = request.app.state.pipeline
 
     async def run_pipeline() -> None:
-        jobs[job_id]["status"] = JobStatus.running
+        job["status"] = JobStatus.running
         result: PipelineResult = await pipeline.run(body.repo_url, job_id=job_id)
-        jobs[job_id]["status"] = result.status
-        jobs[job_id]["result"] = result
+        job["status"] = result.status
+        job["result"] = result
+
+    def mark_failed(exc: BaseException) -> None:
+        job["status"] = JobStatus.failed
 
-    background_tasks.add_task(run_pipeline)
+    request.app.state.job_runner.submit(job_id, run_pipeline, on_error=mark_failed)
     return TransformResponse(job_id=job_id, status=JobStatus.queued.value)
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Query, Request
+import hashlib
+from typing import Any
 
-from repoman.api.schemas import SearchHit, SearchResponse, SemanticSearchRequest
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+
+from repoman.api.schemas import SearchResponse, SemanticSearchRequest
 from repoman.elasticsearch.queries import (
     issue_full_text_search,
     issue_semantic_search,
@@ -14,6 +18,9 @@ from repoman.elasticsearch.queries import (
 
 router = APIRouter(prefix="/api/search", tags=["search"])
 
+# Responses are built from the raw hits, so document the schema explicitly.
+_SEARCH_RESPONSES: dict[int | str, dict[str, Any]] = {200: {"model": SearchResponse}}
+
 
 def _get_es(request: Request):
     es = getattr(request.app.state, "elasticsearch", None)
@@ -27,7 +34,61 @@ def _get_es(request: Request):
     return es
 
 
-@router.get("/repositories", response_model=SearchResponse)
+def _preference(request: Request, query_text: str) -> str:
+    """Stable ``preference`` so one client's repeat searches hit the same shard copies.
+
+    Keyed on the client address, falling back to the query text, so the shard
+    request cache on those copies can answer the repeats.
+    """
+    key = (request.client.host if request.client else "") or query_text
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+async def _encode(request: Request, text: str) -> list[float]:
+    """Encode a search query, batched with concurrent ones when the app has a batcher."""
+    batcher = getattr(request.app.state, "encode_batcher", None)
+    if batcher is not None:
+        return await batcher.submit(text)
+    return request.app.state.encoder.encode(text)
+
+
+async def _search(request: Request, es, body: dict[str, Any], query_text: str) -> Any:
+    """Run a search, batched with concurrent ones when the app has a coalescer."""
+    body = {**body, "preference": _preference(request, query_text)}
+    coalescer = getattr(request.app.state, "es_coalescer", None)
+    if coalescer is not None:
+        return await coalescer.submit(body)
+    return await es.search(**body)
+
+
+def _search_response(resp: Any) -> Response:
+    """Serialise an Elasticsearch search response in the `SearchResponse` shape.
+
+    The hits are copied straight into the JSON body with orjson instead of being
+    validated into `SearchHit` models and serialised again, which dominates the
+    cost of large result pages.
+    """
+    hits_obj = resp.get("hits") or {}
+    total = hits_obj.get("total") or 0
+    total_value = int(total.get("value", 0) if isinstance(total, dict) else total)
+
+    get = dict.get
+    payload = {
+        "total": total_value,
+        "hits": [
+            {
+                "id": get(h, "_id"),
+                "score": get(h, "_score"),
+                "source": get(h, "_source") or {},
+                "highlight": get(h, "highlight"),
+            }
+            for h in hits_obj.get("hits") or ()
+        ],
+    }
+    return Response(orjson.dumps(payload), media_type="application/json")
+
+
+@router.get("/repositories", response_model=None, responses=_SEARCH_RESPONSES)
 async def search_repositories(
     request: Request,
     q: str = Query(..., description="Query string (full-text)"),
@@ -39,7 +100,7 @@ async def search_repositories(
     health_score_min: float | None = Query(None, description="Minimum health score"),
     health_score_max: float | None = Query(None, description="Maximum health score"),
     size: int = Query(20, ge=1, le=100),
-) -> SearchResponse:
+) -> Response:
     """Full-text search repositories.
 
     Example:
@@ -55,33 +116,11 @@ async def search_repositories(
         health_score_max=health_score_max,
         size=size,
     )
-    resp = await es.search(**body)
-    hits_obj = resp.get("hits") or {}
-    hits = hits_obj.get("hits") or []
-    total = hits_obj.get("total")
-    total_value = 0
-    if isinstance(total, dict):
-        value = total.get("value")
-        if isinstance(value, (int, float)):
-            total_value = int(value)
-    elif isinstance(total, (int, float)):
-        total_value = int(total)
-
-    return SearchResponse(
-        total=total_value,
-        hits=[
-            SearchHit(
-                id=h.get("_id"),
-                score=h.get("_score"),
-                source=h.get("_source") or {},
-                highlight=h.get("highlight"),
-            )
-            for h in hits
-        ],
-    )
+    resp = await _search(request, es, body, q)
+    return _search_response(resp)
 
 
-@router.get("/issues", response_model=SearchResponse)
+@router.get("/issues", response_model=None, responses=_SEARCH_RESPONSES)
 async def search_issues(
     request: Request,
     q: str = Query(..., description="Query string (full-text)"),
@@ -89,7 +128,7 @@ async def search_issues(
     state: str | None = Query(None, description="Filter by state (open/closed)"),
     is_pull_request: bool | None = Query(None, description="Filter issues vs PRs"),
     size: int = Query(20, ge=1, le=100),
-) -> SearchResponse:
+) -> Response:
     """Full-text search issues and pull requests.
 
     Example:
@@ -103,103 +142,33 @@ async def search_issues(
         is_pull_request=is_pull_request,
         size=size,
     )
-    resp = await es.search(**body)
-    hits_obj = resp.get("hits") or {}
-    hits = hits_obj.get("hits") or []
-    total = hits_obj.get("total")
-    total_value = 0
-    if isinstance(total, dict):
-        value = total.get("value")
-        if isinstance(value, (int, float)):
-            total_value = int(value)
-    elif isinstance(total, (int, float)):
-        total_value = int(total)
-
-    return SearchResponse(
-        total=total_value,
-        hits=[
-            SearchHit(
-                id=h.get("_id"),
-                score=h.get("_score"),
-                source=h.get("_source") or {},
-                highlight=h.get("highlight"),
-            )
-            for h in hits
-        ],
-    )
+    resp = await _search(request, es, body, q)
+    return _search_response(resp)
 
 
-@router.post("/semantic/repositories", response_model=SearchResponse)
-async def semantic_search_repositories(
-    request: Request, body: SemanticSearchRequest
-) -> SearchResponse:
+@router.post("/semantic/repositories", response_model=None, responses=_SEARCH_RESPONSES)
+async def semantic_search_repositories(request: Request, body: SemanticSearchRequest) -> Response:
     """Semantic repository search using kNN over `description_embedding`.
 
     Example:
         `POST /api/search/semantic/repositories` with JSON body `{ "query": "vector database" }`
     """
     es = _get_es(request)
-    encoder = request.app.state.encoder
-    vector = encoder.encode(body.query)
+    vector = await _encode(request, body.query)
     q = repo_semantic_search(vector, k=body.k)
-    resp = await es.search(**q)
-    hits_obj = resp.get("hits") or {}
-    hits = hits_obj.get("hits") or []
-    total = hits_obj.get("total")
-    total_value = 0
-    if isinstance(total, dict):
-        value = total.get("value")
-        if isinstance(value, (int, float)):
-            total_value = int(value)
-    elif isinstance(total, (int, float)):
-        total_value = int(total)
-
-    return SearchResponse(
-        total=total_value,
-        hits=[
-            SearchHit(
-                id=h.get("_id"),
-                score=h.get("_score"),
-                source=h.get("_source") or {},
-                highlight=h.get("highlight"),
-            )
-            for h in hits
-        ],
-    )
+    resp = await _search(request, es, q, body.query)
+    return _search_response(resp)
 
 
-@router.post("/semantic/issues", response_model=SearchResponse)
-async def semantic_search_issues(request: Request, body: SemanticSearchRequest) -> SearchResponse:
+@router.post("/semantic/issues", response_model=None, responses=_SEARCH_RESPONSES)
+async def semantic_search_issues(request: Request, body: SemanticSearchRequest) -> Response:
     """Semantic issue search using kNN over `body_embedding`.
 
     Example:
         `POST /api/search/semantic/issues` with JSON body `{ "query": "CI failing on python 3.12" }`
     """
     es = _get_es(request)
-    encoder = request.app.state.encoder
-    vector = encoder.encode(body.query)
+    vector = await _encode(request, body.query)
     q = issue_semantic_search(vector, repo_full_name=body.repo_full_name, k=body.k)
-    resp = await es.search(**q)
-    hits_obj = resp.get("hits") or {}
-    hits = hits_obj.get("hits") or []
-    total = hits_obj.get("total")
-    total_value = 0
-    if isinstance(total, dict):
-        value = total.get("value")
-        if isinstance(value, (int, float)):
-            total_value = int(value)
-    elif isinstance(total, (int, float)):
-        total_value = int(total)
-
-    return SearchResponse(
-        total=total_value,
-        hits=[
-            SearchHit(
-                id=h.get("_id"),
-                score=h.get("_score"),
-                source=h.get("_source") or {},
-                highlight=h.get("highlight"),
-            )
-            for h in hits
-        ],
-    )
+    resp = await _search(request, es, q, body.query)
+    return _search_response(resp)
@@ -3,18 +3,20 @@
 from __future__ import annotations
 
 import asyncio
-import json
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 router = APIRouter(tags=["websocket"])
 
+_PING = orjson.dumps({"event": "ping", "data": {}}).decode()
+
 
 @router.websocket("/ws/jobs/{job_id}")
 async def websocket_job(websocket: WebSocket, job_id: str) -> None:
     """Stream real-time events for a pipeline job.
 
-    Subscribes to the event bus and forwards job-scoped events to the client.
+    Subscribes to this job's events on the event bus and forwards them to the client.
 
     Args:
         websocket: The WebSocket connection.
@@ -22,18 +24,16 @@ async def websocket_job(websocket: WebSocket, job_id: str) -> None:
     """
     await websocket.accept()
     event_bus = websocket.app.state.event_bus
-    queue = event_bus.subscribe()
+    subscription = event_bus.subscribe(job_id=job_id)
     try:
         while True:
             try:
-                event = await asyncio.wait_for(queue.get(), timeout=30.0)
-                data = event.get("data") or {}
-                if data.get("job_id") != job_id:
-                    continue
-                await websocket.send_text(json.dumps(event))
+                message = await asyncio.wait_for(subscription.get(), timeout=30.0)
+                # Already serialised once by the bus for every subscriber.
+                await websocket.send_text(message.text)
             except TimeoutError:  # asyncio.TimeoutError is an alias in Python 3.12
-                await websocket.send_text(json.dumps({"event": "ping", "data": {}}))
+                await websocket.send_text(_PING)
     except WebSocketDisconnect:
         pass
     finally:
-        event_bus.unsubscribe(queue)
+        event_bus.unsubscribe(subscription)
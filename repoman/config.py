@@ -1,5 +1,7 @@
 """RepoMan configuration via Pydantic Settings."""
 
+import functools
+
 from pydantic import AliasChoices, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -34,6 +36,23 @@ class Settings(BaseSettings):
     max_files_to_process: int = Field(default=200, description="Maximum files to analyse")
     max_file_size_kb: int = Field(default=500, description="Maximum file size in KB")
     timeout_per_phase_seconds: int = Field(default=300, description="Timeout per pipeline phase")
+    llm_concurrency: int = Field(default=8, ge=1, description="Maximum concurrent LLM requests")
+    max_concurrent_jobs: int = Field(
+        default=2, ge=1, description="Transformation jobs the API runs at once; others queue"
+    )
+    io_workers: int = Field(
+        default=16, ge=1, description="Threads in the API's pool for blocking repo analysis"
+    )
+    max_jobs: int = Field(default=10_000, ge=1, description="Job records the API keeps")
+    job_ttl_seconds: int = Field(
+        default=86_400, ge=1, description="Seconds the API keeps a job record and its result"
+    )
+    llm_cache_enabled: bool = Field(
+        default=False, description="Reuse cached JSON replies for identical agent prompts"
+    )
+    llm_cache_dir: str = Field(
+        default="./.repoman_cache/llm", description="Directory for cached LLM replies"
+    )
 
     sandbox_enabled: bool = Field(default=True, description="Run execution in Docker sandbox")
     knowledge_base_path: str = Field(default="./repoman_knowledge", description="ChromaDB path")
@@ -60,6 +79,20 @@ class Settings(BaseSettings):
         description="Elasticsearch Cloud ID",
         validation_alias=AliasChoices("REPOMAN_ELASTICSEARCH_CLOUD_ID", "ELASTICSEARCH_CLOUD_ID"),
     )
+    elasticsearch_vector_lookup: bool = Field(
+        default=False,
+        description="Resolve kNN query vectors server-side via query_vector_builder.lookup "
+        "(requires Elasticsearch 9.4+)",
+    )
+    elasticsearch_msearch_window_ms: float = Field(
+        default=5.0,
+        ge=0,
+        description="How long API searches wait to be batched into one _msearch (0 disables)",
+    )
+    elasticsearch_http_compress: bool = Field(
+        default=True,
+        description="Gzip request bodies sent to Elasticsearch (mostly bulk indexing payloads)",
+    )
 
     github_token: str = Field(
         default="",
@@ -77,6 +110,11 @@ class Settings(BaseSettings):
             "GITHUB_ISSUE_INGEST_LIMIT",
         ),
     )
+    ingest_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum repositories ingested concurrently by the ES ingest commands",
+    )
 
     embedding_model: str = Field(
         default="all-MiniLM-L6-v2",
@@ -85,7 +123,7 @@ class Settings(BaseSettings):
     )
     embedding_provider: str = Field(
         default="hash",
-        description="Embedding provider: 'hash' (default) or 'sentence_transformers'",
+        description="Embedding provider: 'hash' (default), 'sentence_transformers' or 'model2vec'",
         validation_alias=AliasChoices("REPOMAN_EMBEDDING_PROVIDER", "EMBEDDING_PROVIDER"),
     )
 
@@ -95,3 +133,13 @@ class Settings(BaseSettings):
         description="Embedding vector dimensions (must match Elasticsearch mappings)",
         validation_alias=AliasChoices("REPOMAN_EMBEDDING_DIMS", "EMBEDDING_DIMS"),
     )
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading the environment and ``.env`` once.
+
+    Returns:
+        The shared Settings instance.
+    """
+    return Settings()
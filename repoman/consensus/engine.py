@@ -3,20 +3,26 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
+from collections.abc import Awaitable, Mapping
+from datetime import UTC, datetime
 
 import structlog
 
-from repoman.agents.base import BaseAgent
+from repoman.agents.base import BaseAgent, render_cache
 from repoman.agents.orchestrator_agent import OrchestratorAgent
 from repoman.config import Settings
-from repoman.core.events import EventBus
+from repoman.core.events import EventBus, current_job_id
 from repoman.core.state import AgentAuditReport, AgentVote, ConsensusResult, DebateMessage
 from repoman.utils.exceptions import reraise_if_fatal
 
 log = structlog.get_logger()
 
 
+def _now() -> datetime:
+    """Timezone-aware UTC time for debate messages (``datetime.utcnow`` is deprecated)."""
+    return datetime.now(tz=UTC)
+
+
 class ConsensusEngine:
     """Runs a structured multi-round debate to reach consensus on a unified plan."""
 
@@ -43,17 +49,72 @@ class ConsensusEngine:
             audit_reports: Audit reports from all agents.
             agents: Participating debate agents (excluding orchestrator).
             orchestrator: The mediating orchestrator agent.
+            job_id: Job the debate messages are published for; defaults to the
+                caller's `current_job_id`.
 
         Returns:
             ConsensusResult with the unified plan, votes, and transcript.
         """
+        if job_id is None:
+            return await self._debate(audit_reports, agents, orchestrator)
+        token = current_job_id.set(job_id)
+        try:
+            return await self._debate(audit_reports, agents, orchestrator)
+        finally:
+            current_job_id.reset(token)
+
+    async def _debate(
+        self,
+        audit_reports: list[AgentAuditReport],
+        agents: list[BaseAgent],
+        orchestrator: OrchestratorAgent,
+    ) -> ConsensusResult:
+        """Run the debate rounds; see `run`."""
         transcript: list[DebateMessage] = []
 
-        async def emit_message(msg: DebateMessage) -> None:
-            payload = msg.model_dump(mode="json")
-            if job_id is not None:
-                payload = {"job_id": job_id, **payload}
-            await self._event_bus.emit("debate_message", payload)
+        def emit_message(msg: DebateMessage) -> None:
+            # Python-mode dump: the bus encodes datetimes with orjson, so a JSON-mode
+            # pass over every field here would only be repeated work. The bus takes
+            # the job from `current_job_id`. Not awaited, so slow subscribers never
+            # hold up the debate.
+            self._event_bus.emit_nowait("debate_message", msg.model_dump())
+
+        async def critique(agent: BaseAgent, plans: dict[str, dict]) -> dict:
+            try:
+                result = await agent.critique_plans(plans, exclude=agent.name)
+            except Exception as exc:
+                log.warning("critique_failed", agent=agent.name, error=str(exc))
+                return {}
+            msg = DebateMessage(
+                agent=agent.name,
+                role="CRITIQUE",
+                timestamp=_now(),
+                content=str(result),
+            )
+            transcript.append(msg)
+            emit_message(msg)
+            return result
+
+        async def revise(
+            agent: BaseAgent, own_plan: dict, critique_tasks: Mapping[str, Awaitable[dict]]
+        ) -> dict | None:
+            received = {
+                name: await task for name, task in critique_tasks.items() if name != agent.name
+            }
+            try:
+                revision = await agent.revise_plan(own_plan, received)
+            except Exception as exc:
+                log.warning("revision_failed", agent=agent.name, error=str(exc))
+                return None
+            msg = DebateMessage(
+                agent=agent.name,
+                role="REVISION",
+                timestamp=_now(),
+                content=str(revision),
+            )
+            transcript.append(msg)
+            emit_message(msg)
+            return revision
 
         # Phase 1: All agents propose plans in parallel
         proposals = await asyncio.gather(
@@ -71,115 +132,100 @@ class ConsensusEngine:
                 msg = DebateMessage(
                     agent=agent.name,
                     role="PROPOSAL",
-                    timestamp=datetime.utcnow(),
+                    timestamp=_now(),
                     content=str(proposal),
                 )
                 transcript.append(msg)
-                await emit_message(msg)
+                emit_message(msg)
 
         unified_plan: dict = {}
         votes: dict[str, AgentVote] = {}
 
         for round_num in range(self._config.max_consensus_rounds):
-            log.info("consensus_round", round=round_num + 1)
-
-            # Phase 2a: Each agent critiques others' plans
-            critiques_list = await asyncio.gather(
-                *[
-                    agent.critique_plans({k: v for k, v in plans.items() if k != agent.name})
-                    for agent in agents
-                ],
-                return_exceptions=True,
-            )
-            critiques: dict[str, dict] = {}
-            for agent, critique in zip(agents, critiques_list):
-                if isinstance(critique, BaseException):
-                    reraise_if_fatal(critique)
-                    critiques[agent.name] = {}
-                else:
-                    critiques[agent.name] = critique
+            # Plans, critiques and the unified plan are rendered once per round for
+            # all agents; the renderings are dropped when the round ends.
+            with render_cache():
+                log.info("consensus_round", round=round_num + 1)
+
+                # Phase 2a/2b: Each agent critiques the others' plans, then revises its own
+                # as soon as the other agents' critiques are in. There is no barrier
+                # between the phases: an agent's revision never waits on its own critique.
+                critique_tasks = {
+                    agent.name: asyncio.ensure_future(critique(agent, plans)) for agent in agents
+                }
+                try:
+                    turns = await asyncio.gather(
+                        *[
+                            revise(agent, plans.get(agent.name, {}), critique_tasks)
+                            for agent in agents
+                        ],
+                        return_exceptions=True,
+                    )
+                    for turn in turns:
+                        if isinstance(turn, BaseException):
+                            reraise_if_fatal(turn)
+                    critiques = {name: await task for name, task in critique_tasks.items()}
+                except BaseException:
+                    for task in critique_tasks.values():
+                        task.cancel()
+                    raise
+                for agent, revision in zip(agents, turns):
+                    if isinstance(revision, dict):
+                        plans[agent.name] = revision
+
+                # Phase 2c: Orchestrator synthesises
+                try:
+                    unified_plan = await orchestrator.synthesize_plans(plans)
+                except Exception as exc:
+                    log.warning("synthesis_failed", error=str(exc))
+                    unified_plan = next(iter(plans.values()), {})
+
+                synthesis_msg = DebateMessage(
+                    agent=orchestrator.name,
+                    role="SYNTHESIS",
+                    timestamp=_now(),
+                    content=str(unified_plan),
+                )
+                transcript.append(synthesis_msg)
+                emit_message(synthesis_msg)
+
+                # Phase 2d: All agents vote
+                vote_results = await asyncio.gather(
+                    *[agent.vote_on_plan(unified_plan) for agent in agents],
+                    return_exceptions=True,
+                )
+                votes = {}
+                for agent, vote in zip(agents, vote_results):
+                    if isinstance(vote, BaseException):
+                        reraise_if_fatal(vote)
+                        votes[agent.name] = AgentVote(
+                            agent_name=agent.name,
+                            score=0.0,
+                            approve=False,
+                            rationale=f"Vote failed: {vote}",
+                        )
+                    else:
+                        votes[agent.name] = vote
                     msg = DebateMessage(
                         agent=agent.name,
-                        role="CRITIQUE",
-                        timestamp=datetime.utcnow(),
-                        content=str(critique),
+                        role="VOTE",
+                        timestamp=_now(),
+                        content=str(votes[agent.name].model_dump()),
+                        agreement_level=votes[agent.name].score / 10.0,
                     )
                     transcript.append(msg)
-                    await emit_message(msg)
-
-            # Phase 2b: Each agent revises their plan
-            revisions = await asyncio.gather(
-                *[agent.revise_plan(plans.get(agent.name, {}), critiques) for agent in agents],
-                return_exceptions=True,
-            )
-            for agent, revision in zip(agents, revisions):
-                if isinstance(revision, BaseException):
-                    reraise_if_fatal(revision)
-                    continue
-
-                plans[agent.name] = revision
-                msg = DebateMessage(
-                    agent=agent.name,
-                    role="REVISION",
-                    timestamp=datetime.utcnow(),
-                    content=str(revision),
-                )
-                transcript.append(msg)
-                await emit_message(msg)
-
-            # Phase 2c: Orchestrator synthesises
-            try:
-                unified_plan = await orchestrator.synthesize_plans(plans)
-            except Exception as exc:
-                log.warning("synthesis_failed", error=str(exc))
-                unified_plan = next(iter(plans.values()), {})
-
-            synthesis_msg = DebateMessage(
-                agent=orchestrator.name,
-                role="SYNTHESIS",
-                timestamp=datetime.utcnow(),
-                content=str(unified_plan),
-            )
-            transcript.append(synthesis_msg)
-            await emit_message(synthesis_msg)
-
-            # Phase 2d: All agents vote
-            vote_results = await asyncio.gather(
-                *[agent.vote_on_plan(unified_plan) for agent in agents],
-                return_exceptions=True,
-            )
-            votes = {}
-            for agent, vote in zip(agents, vote_results):
-                if isinstance(vote, BaseException):
-                    reraise_if_fatal(vote)
-                    votes[agent.name] = AgentVote(
-                        agent_name=agent.name,
-                        score=0.0,
-                        approve=False,
-                        rationale=f"Vote failed: {vote}",
+                    emit_message(msg)
+
+                # Phase 2e: Check consensus
+                if all(v.score >= self._config.consensus_threshold for v in votes.values()):
+                    log.info("consensus_reached", round=round_num + 1)
+                    return ConsensusResult(
+                        achieved=True,
+                        rounds=round_num + 1,
+                        unified_plan=unified_plan,
+                        votes=votes,
+                        transcript=transcript,
                     )
-                else:
-                    votes[agent.name] = vote
-                msg = DebateMessage(
-                    agent=agent.name,
-                    role="VOTE",
-                    timestamp=datetime.utcnow(),
-                    content=str(votes[agent.name].model_dump()),
-                    agreement_level=votes[agent.name].score / 10.0,
-                )
-                transcript.append(msg)
-                await emit_message(msg)
-
-            # Phase 2e: Check consensus
-            if all(v.score >= self._config.consensus_threshold for v in votes.values()):
-                log.info("consensus_reached", round=round_num + 1)
-                return ConsensusResult(
-                    achieved=True,
-                    rounds=round_num + 1,
-                    unified_plan=unified_plan,
-                    votes=votes,
-                    transcript=transcript,
-                )
 
         # No consensus — orchestrator makes final decision
         log.warning("consensus_not_reached", rounds=self._config.max_consensus_rounds)
@@ -192,11 +238,11 @@ class ConsensusEngine:
         final_msg = DebateMessage(
             agent=orchestrator.name,
             role="FINAL_DECISION",
-            timestamp=datetime.utcnow(),
+            timestamp=_now(),
             content=str(final_plan),
         )
         transcript.append(final_msg)
-        await self._event_bus.emit("debate_message", final_msg.model_dump(mode="json"))
+        emit_message(final_msg)
 
         return ConsensusResult(
             achieved=False,
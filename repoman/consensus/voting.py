@@ -17,15 +17,25 @@ def aggregate_votes(votes: dict[str, AgentVote]) -> dict:
     if not votes:
         return {"average_score": 0.0, "approve_count": 0, "total": 0, "consensus_reached": False}
 
-    scores = [v.score for v in votes.values()]
-    avg = sum(scores) / len(scores)
-    approve_count = sum(1 for v in votes.values() if v.approve)
+    # One pass for every statistic instead of a separate walk per figure.
+    total = 0.0
+    approve_count = 0
+    min_score = max_score = None
+    for v in votes.values():
+        score = v.score
+        total += score
+        if v.approve:
+            approve_count += 1
+        if min_score is None or score < min_score:
+            min_score = score
+        if max_score is None or score > max_score:
+            max_score = score
 
     return {
-        "average_score": round(avg, 2),
+        "average_score": round(total / len(votes), 2),
         "approve_count": approve_count,
         "total": len(votes),
-        "consensus_reached": all(v.approve for v in votes.values()),
-        "min_score": min(scores),
-        "max_score": max(scores),
+        "consensus_reached": approve_count == len(votes),
+        "min_score": min_score,
+        "max_score": max_score,
     }
@@ -3,17 +3,118 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any
 
+import orjson
+
+
+@dataclass(frozen=True, slots=True)
+class BusMessage:
+    """An emitted event as delivered to subscriber queues.
+
+    ``text`` is the JSON form of ``{"event": ..., "job_id": ..., "data": ...}``,
+    encoded once per emit and shared by every subscriber; ``job_id`` is left out
+    for events that belong to no job.
+    """
+
+    event: str
+    data: dict[str, Any]
+    text: str
+    job_id: str | None = None
+
+
+# Job whose events the current task emits. `Pipeline.run` sets it for the duration
+# of a run, and tasks started inside the run inherit it, so payloads need not carry
+# the ID for the bus to route them.
+current_job_id: ContextVar[str | None] = ContextVar("current_job_id", default=None)
+
+
+# Backlog a subscriber may fall behind by before its oldest events are dropped.
+_QUEUE_MAXSIZE = 1024
+
+
+class _Broadcast:
+    """Bounded ring of messages shared by every subscriber of one channel.
+
+    Publishing appends once, however many subscribers there are; each
+    `Subscription` keeps its own read position. Messages older than the last
+    ``_QUEUE_MAXSIZE`` are overwritten, so a stalled reader skips them instead
+    of holding memory or blocking the publisher.
+    """
+
+    def __init__(self) -> None:
+        self.messages: deque[BusMessage] = deque(maxlen=_QUEUE_MAXSIZE)
+        self.end = 0  # sequence number of the next message published
+        self.subscribers = 0
+        self._tick = asyncio.Event()
+
+    @property
+    def start(self) -> int:
+        return self.end - len(self.messages)
+
+    def publish(self, message: BusMessage) -> None:
+        self.messages.append(message)
+        self.end += 1
+        # Wakes every reader already waiting; later waiters block until the next tick.
+        self._tick.set()
+        self._tick.clear()
+
+    async def wait(self) -> None:
+        await self._tick.wait()
+
+
+class Subscription:
+    """A subscriber's read position in a channel, with a queue-like interface."""
+
+    def __init__(self, channel: _Broadcast, job_id: str | None) -> None:
+        self._channel = channel
+        self._next = channel.end
+        self._closed = False
+        self.job_id = job_id
+
+    def qsize(self) -> int:
+        """Number of unread messages."""
+        return self._channel.end - max(self._next, self._channel.start)
+
+    def empty(self) -> bool:
+        """Whether every published message has been read."""
+        return self.qsize() == 0
+
+    def get_nowait(self) -> BusMessage:
+        """Return the next unread message.
+
+        Raises:
+            asyncio.QueueEmpty: If there is none.
+        """
+        channel = self._channel
+        self._next = max(self._next, channel.start)
+        if self._next >= channel.end:
+            raise asyncio.QueueEmpty
+        message = channel.messages[self._next - channel.start]
+        self._next += 1
+        return message
+
+    async def get(self) -> BusMessage:
+        """Wait for and return the next unread message."""
+        while self.empty():
+            await self._channel.wait()
+        return self.get_nowait()
+
 
 class EventBus:
     """Simple async publish-subscribe event bus."""
 
     def __init__(self) -> None:
         """Initialise with empty listener and subscriber registries."""
-        self._callbacks: dict[str, list[Callable[..., Any]]] = {}
-        self._queues: list[asyncio.Queue[dict[str, Any]]] = []
+        # Copy-on-write: `on` swaps in a new tuple, so emits iterate without copying.
+        self._callbacks: dict[str, tuple[Callable[..., Any], ...]] = {}
+        self._callback_tasks: set[asyncio.Task] = set()
+        self._all = _Broadcast()
+        self._jobs: dict[str, _Broadcast] = {}
 
     def on(self, event: str, callback: Callable[..., Any]) -> None:
         """Register a callback for a named event.
@@ -22,40 +123,91 @@ class EventBus:
             event: Event name to listen for.
             callback: Async or sync callable invoked on emit.
         """
-        self._callbacks.setdefault(event, []).append(callback)
+        self._callbacks[event] = (*self._callbacks.get(event, ()), callback)
 
-    def subscribe(self) -> asyncio.Queue[dict[str, Any]]:
-        """Create and register a new subscriber queue.
+    def subscribe(self, job_id: str | None = None) -> Subscription:
+        """Register a new subscriber.
+
+        Args:
+            job_id: Only deliver events emitted for this job (see `_deliver`);
+                None subscribes to every event.
 
         Returns:
-            Queue that receives all emitted events.
+            Subscription that yields the matching events emitted from now on. A
+            subscriber more than ``_QUEUE_MAXSIZE`` events behind loses the
+            oldest ones rather than stalling the emitter.
         """
-        q: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
-        self._queues.append(q)
-        return q
+        if job_id is None:
+            channel = self._all
+        else:
+            existing = self._jobs.get(job_id)
+            if existing is None:
+                existing = self._jobs[job_id] = _Broadcast()
+            channel = existing
+        channel.subscribers += 1
+        return Subscription(channel, job_id)
 
-    def unsubscribe(self, queue: asyncio.Queue[dict[str, Any]]) -> None:
-        """Remove a subscriber queue.
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscriber.
 
         Args:
-            queue: The queue to deregister.
+            subscription: The subscription to deregister.
         """
-        try:
-            self._queues.remove(queue)
-        except ValueError:
-            pass
+        if subscription._closed:
+            return
+        subscription._closed = True
+        channel = subscription._channel
+        channel.subscribers -= 1
+        if channel.subscribers:
+            return
+        if subscription.job_id is None:
+            channel.messages.clear()  # nobody left to read them
+        elif self._jobs.get(subscription.job_id) is channel:
+            del self._jobs[subscription.job_id]
 
     async def emit(self, event: str, data: dict[str, Any]) -> None:
-        """Broadcast an event to all callbacks and subscriber queues.
+        """Broadcast an event to all callbacks and subscribers.
 
         Args:
             event: Event name.
             data: Payload dictionary.
         """
-        payload = {"event": event, "data": data}
-        for callback in self._callbacks.get(event, []):
+        for callback in self._callbacks.get(event, ()):
             result = callback(event, data)
             if asyncio.iscoroutine(result):
                 await result
-        for q in list(self._queues):
-            await q.put(payload)
+        self._deliver(event, data)
+
+    def emit_nowait(self, event: str, data: dict[str, Any]) -> None:
+        """Broadcast an event without waiting on anything.
+
+        Subscribers receive it immediately; coroutine callbacks are started as
+        tasks instead of being awaited, so the caller never stalls on them.
+
+        Args:
+            event: Event name.
+            data: Payload dictionary.
+        """
+        for callback in self._callbacks.get(event, ()):
+            result = callback(event, data)
+            if asyncio.iscoroutine(result):
+                task = asyncio.ensure_future(result)
+                self._callback_tasks.add(task)
+                task.add_done_callback(self._callback_tasks.discard)
+        self._deliver(event, data)
+
+    def _deliver(self, event: str, data: dict[str, Any]) -> None:
+        # An explicit ``data["job_id"]`` wins over the emitting task's context.
+        job_id = data.get("job_id") or current_job_id.get()
+        job_channel = self._jobs.get(job_id) if job_id else None
+        if not self._all.subscribers and job_channel is None:
+            return
+        envelope: dict[str, Any] = {"event": event, "data": data}
+        if job_id:
+            envelope["job_id"] = job_id
+        text = orjson.dumps(envelope, default=str).decode()
+        message = BusMessage(event=event, data=data, text=text, job_id=job_id)
+        if self._all.subscribers:
+            self._all.publish(message)
+        if job_channel is not None:
+            job_channel.publish(message)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from repoman.config import Settings
+from repoman.config import Settings, get_settings
 from repoman.core.pipeline import Pipeline
 from repoman.core.state import PipelineResult
 
@@ -14,9 +14,9 @@ class Orchestrator:
         """Initialise the orchestrator.
 
         Args:
-            config: Application settings. Defaults to Settings().
+            config: Application settings. Defaults to `get_settings()`.
         """
-        self._config = config or Settings()
+        self._config = config or get_settings()
         self._pipeline = Pipeline(self._config)
 
     async def transform(self, repo_url: str) -> PipelineResult:
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections.abc import Coroutine
+from concurrent.futures import Executor
 from typing import Any
 
 import structlog
@@ -15,7 +17,7 @@ from repoman.agents.orchestrator_agent import OrchestratorAgent
 from repoman.analysis.ingestion import RepoIngester
 from repoman.config import Settings
 from repoman.consensus.engine import ConsensusEngine
-from repoman.core.events import EventBus
+from repoman.core.events import EventBus, current_job_id
 from repoman.core.state import JobStatus, Phase, PipelineResult, PipelineState
 from repoman.execution.build_runner import ValidationEngine
 from repoman.execution.file_ops import FileOps
@@ -25,20 +27,62 @@ from repoman.utils.exceptions import reraise_if_fatal
 log = structlog.get_logger()
 
 
+async def _run_agents(calls: dict[str, Coroutine[Any, Any, Any]]) -> dict[str, Any]:
+    """Run agent calls concurrently, mapping each name to its result or exception.
+
+    Tasks start eagerly: a call that finishes without suspending (such as a reply
+    from the LLM cache) completes during task creation instead of waiting for an
+    event-loop iteration. Failures are returned rather than raised, so one agent
+    cannot cancel the others.
+
+    Args:
+        calls: Agent name to the coroutine to run.
+
+    Returns:
+        Agent name to the coroutine's result, or the exception it raised.
+    """
+    loop = asyncio.get_running_loop()
+    tasks = {name: asyncio.eager_task_factory(loop, coro) for name, coro in calls.items()}
+    pending = [task for task in tasks.values() if not task.done()]
+    if pending:
+        try:
+            await asyncio.wait(pending)
+        except BaseException:
+            for task in pending:
+                task.cancel()
+            raise
+
+    results: dict[str, Any] = {}
+    for name, task in tasks.items():
+        try:
+            results[name] = task.result()
+        except BaseException as exc:
+            results[name] = exc
+    return results
+
+
 class Pipeline:
     """Orchestrates the full 7-phase repo transformation pipeline."""
 
-    def __init__(self, config: Settings, event_bus: EventBus | None = None) -> None:
+    def __init__(
+        self,
+        config: Settings,
+        event_bus: EventBus | None = None,
+        *,
+        io_pool: Executor | None = None,
+    ) -> None:
         """Initialise the pipeline with all agents and services.
 
         Args:
             config: Application settings.
             event_bus: Optional shared event bus (e.g., API-owned) for broadcasting.
+            io_pool: Executor for blocking repository analysis; defaults to the
+                event loop's default executor.
         """
         self._config = config
         self.event_bus = event_bus or EventBus()
         self._router = ModelRouter(config)
-        self._ingester = RepoIngester(config)
+        self._ingester = RepoIngester(config, io_pool=io_pool)
         self._consensus_engine = ConsensusEngine(config, self.event_bus)
         self._validator = ValidationEngine()
 
@@ -56,9 +100,16 @@ class Pipeline:
             except Exception as exc:
                 log.warning("knowledge_base_disabled", error=str(exc))
 
+    async def aclose(self) -> None:
+        """Release the model router's pooled HTTP clients."""
+        await self._router.aclose()
+
     async def run(self, repo_url: str, job_id: str | None = None) -> PipelineResult:
         """Execute the full pipeline for a repository URL.
 
+        A pipeline keeps no per-run state, so one instance can run several jobs
+        concurrently.
+
         Args:
             repo_url: Git repository URL to transform.
             job_id: Optional externally-provided job identifier.
@@ -70,95 +121,102 @@ class Pipeline:
         if job_id is not None:
             state_kwargs["job_id"] = job_id
         state = PipelineState(**state_kwargs)
+        # The bus reads the job from this context variable, so payloads leave it out.
+        token = current_job_id.set(state.job_id)
+        try:
+            return await self._run(state)
+        finally:
+            current_job_id.reset(token)
+
+    async def _run(self, state: PipelineState) -> PipelineResult:
+        """Run every phase for ``state`` under its job's event context."""
+        repo_url = state.repo_url
         start_time = time.time()
 
+        # Phase payloads built once per run. Bus payloads are never mutated after an
+        # emit, so events without extra data can share them.
+        phase_payloads = {phase: {"phase": phase.value} for phase in Phase}
+
         async def emit(event: str, data: dict[str, Any] | None = None) -> None:
-            payload: dict[str, Any] = {"job_id": state.job_id}
-            if data:
-                payload.update(data)
-            await self.event_bus.emit(event, payload)
+            await self.event_bus.emit(event, data or {})
+
+        def mark(event: str, phase: Phase, **data: Any) -> None:
+            # Phase transitions are progress notices: delivered without awaiting, so a
+            # phase boundary costs no event-loop round-trips. Pipeline start, failure
+            # and completion still go through `emit`.
+            payload = phase_payloads[phase]
+            self.event_bus.emit_nowait(event, {**payload, **data} if data else payload)
 
         await emit("pipeline_started", {"repo_url": repo_url})
 
         try:
             # Phase 1: Ingestion
             state.current_phase = Phase.ingestion
-            await emit("phase_started", {"phase": Phase.ingestion.value})
+            mark("phase_started", Phase.ingestion)
             state.snapshot = await self._ingester.ingest(repo_url)
-            await emit("phase_completed", {"phase": Phase.ingestion.value})
+            mark("phase_completed", Phase.ingestion)
 
             # Phase 2: Parallel audit
             state.current_phase = Phase.audit
-            await emit("phase_started", {"phase": Phase.audit.value})
-            audit_tasks = [
-                ("architect", self._architect.audit(state.snapshot)),
-                ("auditor", self._auditor.audit(state.snapshot)),
-                ("builder", self._builder.audit(state.snapshot)),
-            ]
-            audit_results = await asyncio.gather(
-                *[t for _, t in audit_tasks],
-                return_exceptions=True,
+            mark("phase_started", Phase.audit)
+            audit_results = await _run_agents(
+                {
+                    "architect": self._architect.audit(state.snapshot),
+                    "auditor": self._auditor.audit(state.snapshot),
+                    "builder": self._builder.audit(state.snapshot),
+                }
             )
             failed_audit_agents: list[str] = []
-            for (agent_name, _), audit_result in zip(audit_tasks, audit_results):
+            for agent_name, audit_result in audit_results.items():
                 if isinstance(audit_result, BaseException):
                     failed_audit_agents.append(agent_name)
                     reraise_if_fatal(audit_result)
                     log.warning("audit_failed", agent=agent_name, error=str(audit_result))
                     continue
                 state.audit_reports.append(audit_result)
+                serious = len(audit_result.critical_issues) + len(audit_result.major_issues)
+                state.serious_issues += serious
 
             if not state.audit_reports:
                 raise RuntimeError(
                     f"All audit agents failed (agents: {', '.join(failed_audit_agents)})"
                 )
-            await emit(
-                "phase_completed",
-                {"phase": Phase.audit.value, "reports": len(state.audit_reports)},
-            )
+            mark("phase_completed", Phase.audit, reports=len(state.audit_reports))
 
             # Phase 3: Consensus
             state.current_phase = Phase.consensus
-            await emit("phase_started", {"phase": Phase.consensus.value})
+            mark("phase_started", Phase.consensus)
             state.consensus = await self._consensus_engine.run(
                 state.audit_reports,
                 [self._architect, self._auditor, self._builder],
                 self._orchestrator,
                 job_id=state.job_id,
             )
-            await emit(
-                "phase_completed",
-                {"phase": Phase.consensus.value, "achieved": state.consensus.achieved},
-            )
+            mark("phase_completed", Phase.consensus, achieved=state.consensus.achieved)
 
             # Phase 4: Execution
             state.current_phase = Phase.execution
-            await emit("phase_started", {"phase": Phase.execution.value})
+            mark("phase_started", Phase.execution)
             file_ops = FileOps(state.snapshot.clone_path)
             change_sets = await self._builder.execute_plan(
                 state.consensus.unified_plan, state.snapshot, file_ops
             )
             state.change_sets.extend(change_sets)
-            await emit(
-                "phase_completed",
-                {"phase": Phase.execution.value, "steps": len(change_sets)},
-            )
+            mark("phase_completed", Phase.execution, steps=len(change_sets))
 
             # Phase 5: Review
             state.current_phase = Phase.review
-            await emit("phase_started", {"phase": Phase.review.value})
-            review_tasks = [
-                ("architect", self._architect.review_changes(state.change_sets, state.snapshot)),
-                ("auditor", self._auditor.review_changes(state.change_sets, state.snapshot)),
-            ]
-            review_results = await asyncio.gather(
-                *[t for _, t in review_tasks],
-                return_exceptions=True,
+            mark("phase_started", Phase.review)
+            review_results = await _run_agents(
+                {
+                    "architect": self._architect.review_changes(state.change_sets, state.snapshot),
+                    "auditor": self._auditor.review_changes(state.change_sets, state.snapshot),
+                }
             )
             rejections: list[str] = []
             successful_reviews = 0
             failed_review_agents: list[str] = []
-            for (agent_name, _), review in zip(review_tasks, review_results):
+            for agent_name, review in review_results.items():
                 if isinstance(review, BaseException):
                     failed_review_agents.append(agent_name)
                     reraise_if_fatal(review)
@@ -176,29 +234,23 @@ class Pipeline:
                 fix_sets = await self._builder.apply_fixes(rejections, state.snapshot, file_ops)
                 state.change_sets.extend(fix_sets)
             state.review_approved = len(rejections) == 0
-            await emit(
-                "phase_completed",
-                {"phase": Phase.review.value, "approved": state.review_approved},
-            )
+            mark("phase_completed", Phase.review, approved=state.review_approved)
 
             # Phase 6: Validation
             state.current_phase = Phase.validation
-            await emit("phase_started", {"phase": Phase.validation.value})
+            mark("phase_started", Phase.validation)
             state.validation = await self._validator.validate(
                 state.snapshot.clone_path, state.snapshot.primary_language
             )
-            await emit(
-                "phase_completed",
-                {"phase": Phase.validation.value, "passed": state.validation.all_passed},
-            )
+            mark("phase_completed", Phase.validation, passed=state.validation.all_passed)
 
             # Phase 7: Learning
             state.current_phase = Phase.learning
             if self._knowledge_base:
-                await emit("phase_started", {"phase": Phase.learning.value})
+                mark("phase_started", Phase.learning)
                 result_for_learning = self._build_result(state, start_time, JobStatus.completed)
                 self._knowledge_base.learn_from_run(result_for_learning)
-                await emit("phase_completed", {"phase": Phase.learning.value})
+                mark("phase_completed", Phase.learning)
 
             state.status = JobStatus.completed
 
@@ -227,11 +279,9 @@ class Pipeline:
         """
         before_score = state.snapshot.health_score if state.snapshot else 0.0
         after_score = state.validation.health_score if state.validation else before_score
-        issues_fixed = sum(
-            len(r.critical_issues) + len(r.major_issues) for r in state.audit_reports
-        )
-
-        return PipelineResult(
+        # The parts are already-validated models and plain values built here, so
+        # skip re-walking every nested list through the validating constructor.
+        return PipelineResult.model_construct(
             job_id=state.job_id,
             status=status,
             repo_url=state.repo_url,
@@ -242,7 +292,7 @@ class Pipeline:
             validation=state.validation,
             before_score=before_score,
             after_score=after_score,
-            issues_fixed=issues_fixed,
+            issues_fixed=state.serious_issues,
             total_tokens_used=state.tokens_used,
             total_duration_seconds=round(time.time() - start_time, 2),
             error=state.errors[-1] if state.errors else None,
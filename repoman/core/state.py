@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from enum import StrEnum
-from typing import Any
+from typing import Any, TypedDict
 
 from pydantic import BaseModel, Field
 
 
+def _utcnow() -> datetime:
+    return datetime.now(tz=UTC)
+
+
 class Phase(StrEnum):
     """Pipeline phase names."""
 
@@ -31,6 +36,17 @@ class JobStatus(StrEnum):
     failed = "failed"
 
 
+class IssueDict(TypedDict, total=False):
+    """Issue as returned in an agent's raw LLM JSON, before validation into `Issue`."""
+
+    severity: str
+    category: str
+    file_path: str | None
+    line_number: int | None
+    description: str
+    suggested_fix: str
+
+
 class Issue(BaseModel):
     """A single repository issue detected by an agent."""
 
@@ -93,7 +109,7 @@ class AgentAuditReport(BaseModel):
     agent_name: str
     agent_role: str
     model_used: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     critical_issues: list[Issue] = Field(default_factory=list)
     major_issues: list[Issue] = Field(default_factory=list)
     minor_issues: list[Issue] = Field(default_factory=list)
@@ -112,7 +128,7 @@ class DebateMessage(BaseModel):
 
     agent: str
     role: str  # PROPOSAL | CRITIQUE | REVISION | VOTE | SYNTHESIS | FINAL_DECISION
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     content: str
     references: list[str] = Field(default_factory=list)
     agreement_level: float | None = None
@@ -177,18 +193,25 @@ class PipelineResult(BaseModel):
     error: str | None = None
 
 
-class PipelineState(BaseModel):
-    """Mutable state threaded through all pipeline phases."""
+@dataclass(slots=True)
+class PipelineState:
+    """Mutable state threaded through all pipeline phases.
+
+    A plain slotted dataclass rather than a model: it never leaves `Pipeline.run`
+    and is only read and assigned attribute by attribute, so validation and a
+    per-instance ``__dict__`` would buy nothing.
+    """
 
-    job_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    job_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     status: JobStatus = JobStatus.queued
     current_phase: Phase = Phase.ingestion
     repo_url: str = ""
     snapshot: RepoSnapshot | None = None
-    audit_reports: list[AgentAuditReport] = Field(default_factory=list)
+    audit_reports: list[AgentAuditReport] = field(default_factory=list)
+    serious_issues: int = 0  # critical + major issues across audit_reports
     consensus: ConsensusResult | None = None
-    change_sets: list[ChangeSet] = Field(default_factory=list)
+    change_sets: list[ChangeSet] = field(default_factory=list)
     review_approved: bool = False
     validation: ValidationReport | None = None
     tokens_used: int = 0
-    errors: list[str] = Field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
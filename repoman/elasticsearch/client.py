@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from typing import Any
 
 from elasticsearch import AsyncElasticsearch
 
 from repoman.config import Settings
 from repoman.elasticsearch.errors import ElasticsearchNotConfiguredError
 
+# Open clients handed out by `es_lifespan`: key -> [client, number of users].
+_shared_clients: dict[tuple[Any, ...], list[Any]] = {}
+
 
 def create_es_client(config: Settings) -> AsyncElasticsearch:
     """Create an AsyncElasticsearch client from settings.
@@ -32,6 +38,7 @@ def create_es_client(config: Settings) -> AsyncElasticsearch:
         "request_timeout": 30,
         "retry_on_timeout": True,
         "max_retries": 3,
+        "http_compress": config.elasticsearch_http_compress,
     }
     if config.elasticsearch_api_key:
         kwargs["api_key"] = config.elasticsearch_api_key
@@ -42,11 +49,22 @@ def create_es_client(config: Settings) -> AsyncElasticsearch:
     return AsyncElasticsearch(hosts=[config.elasticsearch_url], **kwargs)
 
 
+def _client_key(config: Settings) -> tuple[str, str, str]:
+    api_key = config.elasticsearch_api_key
+    return (
+        config.elasticsearch_cloud_id,
+        config.elasticsearch_url,
+        hashlib.sha256(api_key.encode()).hexdigest() if api_key else "",
+    )
+
+
 @asynccontextmanager
 async def es_lifespan(config: Settings) -> AsyncIterator[AsyncElasticsearch | None]:
     """FastAPI lifespan helper for Elasticsearch.
 
-    If Elasticsearch is not configured, yields None.
+    Lifespans that overlap on the same event loop with the same cluster and
+    credentials share one client and its connection pool; it is closed when the
+    last of them exits. If Elasticsearch is not configured, yields None.
 
     Args:
         config: Application settings.
@@ -54,14 +72,22 @@ async def es_lifespan(config: Settings) -> AsyncIterator[AsyncElasticsearch | No
     Yields:
         AsyncElasticsearch client or None.
     """
-    client: AsyncElasticsearch | None
-    try:
-        client = create_es_client(config)
-    except ElasticsearchNotConfiguredError:
-        client = None
+    # Clients are bound to the loop their connections were opened on.
+    key = (asyncio.get_running_loop(), *_client_key(config))
+    shared = _shared_clients.get(key)
+    if shared is None:
+        try:
+            client = create_es_client(config)
+        except ElasticsearchNotConfiguredError:
+            yield None
+            return
+        shared = _shared_clients[key] = [client, 0]
+    shared[1] += 1
 
     try:
-        yield client
+        yield shared[0]
     finally:
-        if client is not None:
-            await client.close()
+        shared[1] -= 1
+        if shared[1] == 0:
+            del _shared_clients[key]
+            await shared[0].close()
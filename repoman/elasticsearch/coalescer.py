@@ -0,0 +1,124 @@
+"""Coalesce concurrent searches into batched ``_msearch`` requests."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import Any
+
+import structlog
+from elasticsearch import AsyncElasticsearch
+
+from repoman.elasticsearch.errors import MSearchItemError
+
+log = structlog.get_logger()
+
+_Pending = tuple[dict[str, Any], dict[str, Any], asyncio.Future]
+
+# ``es.search`` parameters that `_msearch` takes in each search's header line.
+_HEADER_KEYS = frozenset({"index", "preference", "request_cache", "routing", "search_type"})
+
+
+class MSearchCoalescer:
+    """Batch searches submitted within a short window into one ``_msearch`` call.
+
+    Each `submit` queues a search and awaits its own response. A background task
+    waits ``window_seconds`` after the first queued search, then sends everything
+    queued so far (at most ``max_batch``) as a single request and hands each
+    response back to its caller. Under concurrent load this replaces one HTTP
+    round-trip per search with one per batch; a lone search pays the window.
+    """
+
+    def __init__(
+        self,
+        es: AsyncElasticsearch,
+        *,
+        window_seconds: float = 0.005,
+        max_batch: int = 32,
+    ) -> None:
+        """Initialise the coalescer.
+
+        Args:
+            es: Elasticsearch client.
+            window_seconds: How long to gather searches before sending a batch.
+            max_batch: Largest number of searches per ``_msearch`` request.
+        """
+        self._es = es
+        self._window = window_seconds
+        self._max_batch = max_batch
+        self._queue: asyncio.Queue[_Pending] = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+        self._inflight: set[asyncio.Task] = set()
+
+    async def submit(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Run a search as part of the next batch.
+
+        Args:
+            body: ``es.search`` keyword arguments, as built by
+                `repoman.elasticsearch.queries`; ``index``, ``preference`` and
+                similar request parameters go in the msearch header.
+
+        Returns:
+            The search response for ``body``.
+
+        Raises:
+            MSearchItemError: If Elasticsearch rejected this search.
+        """
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+        header = {k: v for k, v in body.items() if k in _HEADER_KEYS}
+        search = {k: v for k, v in body.items() if k not in _HEADER_KEYS}
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((header, search, future))
+        return await future
+
+    async def aclose(self) -> None:
+        """Stop batching and wait for batches already sent."""
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        while not self._queue.empty():
+            _, _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("MSearchCoalescer is closed"))
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            await asyncio.sleep(self._window)
+            while len(batch) < self._max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            # Send without waiting, so the next batch gathers while this one is out.
+            task = asyncio.create_task(self._send(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, batch: list[_Pending]) -> None:
+        searches: list[dict[str, Any]] = []
+        for header, search, _ in batch:
+            searches.append(header)
+            searches.append(search)
+        try:
+            resp = await self._es.msearch(searches=searches)
+        except Exception as exc:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        responses = resp.get("responses") or []
+        log.debug("es_msearch_coalesced", searches=len(batch))
+        for i, (_, _, future) in enumerate(batch):
+            if future.done():  # the caller went away
+                continue
+            item = responses[i] if i < len(responses) else None
+            if item is None:
+                future.set_exception(MSearchItemError(None, "missing msearch response"))
+            elif "error" in item:
+                future.set_exception(MSearchItemError(item.get("status"), item["error"]))
+            else:
+                future.set_result(item)
@@ -9,3 +9,12 @@ class ElasticsearchNotConfiguredError(RuntimeError):
 
 class ElasticsearchUnavailableError(RuntimeError):
     """Raised when Elasticsearch cannot be reached."""
+
+
+class MSearchItemError(RuntimeError):
+    """Raised for one search of an ``_msearch`` batch that Elasticsearch rejected."""
+
+    def __init__(self, status: int | None, error: object) -> None:
+        super().__init__(f"msearch item failed: {status} {error}")
+        self.status = status
+        self.error = error
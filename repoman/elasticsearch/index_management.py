@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-import json
+import functools
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
+import orjson
 import structlog
-from elasticsearch import AsyncElasticsearch, NotFoundError
+from elasticsearch import AsyncElasticsearch, BadRequestError, NotFoundError
 
 from repoman.elasticsearch.constants import (
     ANALYSIS_DATA_STREAM,
@@ -19,24 +22,38 @@ from repoman.elasticsearch.constants import (
 
 log = structlog.get_logger()
 
+# Fields added to a mapping after its index may already have been created. They
+# are put on existing indices, which would otherwise map them dynamically on first
+# write (``dup_cluster`` as ``text``, which a ``terms`` aggregation cannot use).
+_ADDED_FIELDS: dict[str, tuple[str, ...]] = {
+    ISSUES_INDEX: ("dup_cluster", "duplicate_neighbors"),
+}
+
 
 def _apply_vector_dims(obj: Any, vector_dims: int) -> None:
     """Apply a global `dense_vector.dims` override to a mapping body."""
-    if isinstance(obj, dict):
-        if obj.get("type") == "dense_vector" and "dims" in obj:
-            obj["dims"] = vector_dims
-        for v in obj.values():
-            _apply_vector_dims(v, vector_dims)
-        return
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if type(node) is dict:
+            if node.get("type") == "dense_vector" and "dims" in node:
+                node["dims"] = vector_dims
+                continue  # a vector field's options hold no further fields
+            stack.extend(v for v in node.values() if type(v) is dict or type(v) is list)
+        elif type(node) is list:
+            stack.extend(v for v in node if type(v) is dict or type(v) is list)
+
 
-    if isinstance(obj, list):
-        for item in obj:
-            _apply_vector_dims(item, vector_dims)
+@functools.lru_cache(maxsize=8)
+def _read_mapping(name: str) -> bytes:
+    """Read (once per process) a bundled mapping file."""
+    return (Path(__file__).parent / "mappings" / f"{name}.json").read_bytes()
 
 
 def _load_mapping(name: str, *, vector_dims: int) -> dict:
-    path = Path(__file__).parent / "mappings" / f"{name}.json"
-    body = json.loads(path.read_text(encoding="utf-8"))
+    # Parsing the cached bytes gives every caller its own dict to patch and pass
+    # on, which is cheaper than deep-copying a cached parsed mapping.
+    body = orjson.loads(_read_mapping(name))
     _apply_vector_dims(body, vector_dims)
     return body
 
@@ -44,7 +61,8 @@ def _load_mapping(name: str, *, vector_dims: int) -> dict:
 async def ensure_indices(es: AsyncElasticsearch, *, vector_dims: int) -> None:
     """Create indices/data streams required by RepoMan.
 
-    Operations are idempotent; existing resources are left untouched.
+    Operations are idempotent; existing indices only gain the mappings of fields
+    added since they were created.
 
     Args:
         es: Elasticsearch client.
@@ -56,9 +74,50 @@ async def ensure_indices(es: AsyncElasticsearch, *, vector_dims: int) -> None:
     await _ensure_analysis_data_stream(es, vector_dims=vector_dims)
 
 
+@asynccontextmanager
+async def bulk_load(
+    es: AsyncElasticsearch,
+    indices: Sequence[str] = (REPOSITORIES_INDEX, ISSUES_INDEX),
+) -> AsyncIterator[None]:
+    """Suspend periodic refresh on ``indices`` for the duration of a bulk load.
+
+    Each index's previous ``refresh_interval`` is restored on exit (unset values
+    reset to the cluster default) and the indices are refreshed once so the loaded
+    documents become searchable.
+
+    Args:
+        es: Elasticsearch client.
+        indices: Indices being loaded.
+    """
+    target = ",".join(indices)
+    current = await es.indices.get_settings(index=target, name="index.refresh_interval")
+    await es.indices.put_settings(index=target, settings={"index": {"refresh_interval": "-1"}})
+    try:
+        yield
+    finally:
+        for index in indices:
+            previous = (((current.get(index) or {}).get("settings") or {}).get("index") or {}).get(
+                "refresh_interval"
+            )
+            await es.indices.put_settings(
+                index=index, settings={"index": {"refresh_interval": previous}}
+            )
+        await es.indices.refresh(index=target)
+
+
 async def _ensure_index(es: AsyncElasticsearch, index: str, body: dict) -> None:
     exists = await es.indices.exists(index=index)
     if exists:
+        added = _ADDED_FIELDS.get(index)
+        if added:
+            properties = body["mappings"]["properties"]
+            try:
+                await es.indices.put_mapping(
+                    index=index, properties={field: properties[field] for field in added}
+                )
+            except BadRequestError as exc:
+                # Already mapped differently (e.g. dynamically); needs a reindex.
+                log.warning("es_mapping_conflict", index=index, fields=added, error=str(exc))
         return
 
     log.info("es_create_index", index=index)
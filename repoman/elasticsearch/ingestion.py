@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from dataclasses import asdict
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -148,11 +149,6 @@ class ElasticsearchIngestionService:
             derived_scores=derived,
         )
 
-        # Index repository metadata.
-        await self._es.index(
-            index=REPOSITORIES_INDEX, id=repo_doc["repo_id"], document=repo_doc, refresh=False
-        )
-
         # Issues/PRs
         if issues_limit is None:
             effective_issues_limit = self._config.github_issue_ingest_limit
@@ -181,8 +177,19 @@ class ElasticsearchIngestionService:
             for d in issue_docs
             if d.get("issue_id")
         ]
-        if actions:
-            await bulk_index(self._es, actions)
+        # Repository metadata rides in the same bulk request as its issues.
+        await bulk_index(
+            self._es,
+            [
+                {
+                    "_op_type": "index",
+                    "_index": REPOSITORIES_INDEX,
+                    "_id": repo_doc["repo_id"],
+                    "_source": repo_doc,
+                },
+                *actions,
+            ],
+        )
 
         log.info(
             "es_ingest_completed",
@@ -199,8 +206,29 @@ class ElasticsearchIngestionService:
             "health_score": derived.health_score,
         }
 
+    async def refresh(self) -> None:
+        """Make documents ingested so far visible to search.
+
+        Needed before `analyze_repo` when ingesting inside `bulk_load`, which
+        suspends periodic refresh.
+        """
+        await self._es.indices.refresh(index=f"{REPOSITORIES_INDEX},{ISSUES_INDEX}")
+
     async def analyze_repo(self, repo_full_name: str) -> dict[str, Any]:
         """Run analysis powered by Elasticsearch queries and index results."""
+        analysis_doc: dict[str, Any] = {}
+        async for stage in self.analyze_repo_stream(repo_full_name):
+            if stage["stage"] == "complete":
+                analysis_doc = stage["analysis"]
+        return analysis_doc
+
+    async def analyze_repo_stream(self, repo_full_name: str) -> AsyncIterator[dict[str, Any]]:
+        """Run `analyze_repo`, yielding each partial result as soon as it is known.
+
+        Every item has a ``stage`` key: ``scores``, ``stale``, ``duplicates`` and
+        ``direction`` carry that step's results, and the final ``complete`` item
+        carries the indexed ``analysis`` document.
+        """
         repo_doc = await self._get_repo_doc(repo_full_name)
 
         completeness_score = compute_completeness_score(
@@ -221,17 +249,34 @@ class ElasticsearchIngestionService:
             forks=int(repo_doc.get("forks") or 0),
             contributors=0,
         )
+        yield {
+            "stage": "scores",
+            "completeness_score": completeness_score,
+            "activity_score": activity_score,
+            "community_score": community_score,
+        }
 
         stale: StaleCounts = await query_stale_counts(self._es, repo_full_name=repo_full_name)
+        yield {"stage": "stale", **asdict(stale)}
         duplicates: list[DuplicateIssueGroup] = await find_duplicate_issue_groups(
-            self._es, repo_full_name=repo_full_name
+            self._es,
+            repo_full_name=repo_full_name,
+            vector_lookup=self._config.elasticsearch_vector_lookup,
+            store_neighbors=True,
         )
+        duplicate_groups = [asdict(d) for d in duplicates]
+        yield {"stage": "duplicates", "duplicate_issue_groups": duplicate_groups}
         direction = await assess_repo_direction(
             self._es,
             repo_full_name=repo_full_name,
             repo_topics=list(repo_doc.get("topics") or []),
             repo_description=repo_doc.get("description") or "",
         )
+        yield {
+            "stage": "direction",
+            "direction_assessment": direction.summary,
+            "diverges": direction.diverges,
+        }
 
         missing_elements = []
         if not repo_doc.get("has_readme"):
@@ -258,7 +303,7 @@ class ElasticsearchIngestionService:
             "activity_score": activity_score,
             "community_score": community_score,
             "missing_elements": missing_elements,
-            "duplicate_issue_groups": [asdict(d) for d in duplicates],
+            "duplicate_issue_groups": duplicate_groups,
             "stale_issues_count": stale.stale_issues_count,
             "stale_prs_count": stale.stale_prs_count,
             "direction_assessment": direction.summary,
@@ -277,7 +322,7 @@ class ElasticsearchIngestionService:
             refresh=False,
         )
 
-        return analysis_doc
+        yield {"stage": "complete", "analysis": analysis_doc}
 
     async def _file_exists_any(self, repo_full_name: str, paths: list[str]) -> bool:
         for p in paths:
@@ -290,6 +335,7 @@ class ElasticsearchIngestionService:
             index=REPOSITORIES_INDEX,
             size=1,
             query={"term": {"full_name": repo_full_name}},
+            source_excludes=["description_embedding"],
         )
         hits = (resp.get("hits") or {}).get("hits") or []
         if not hits:
@@ -6,6 +6,20 @@ from typing import Any
 
 from repoman.elasticsearch.constants import ISSUES_INDEX, REPOSITORIES_INDEX
 
+# Static parts of the request bodies, built once and shared by every query; the
+# client serialises bodies without modifying them, so callers must not either.
+# Embeddings (hundreds of floats per hit) and stored duplicate neighbours are
+# internal, so search hits never ship them back to API clients.
+_REPO_SOURCE: dict[str, Any] = {"excludes": ["description_embedding"]}
+_ISSUE_SOURCE: dict[str, Any] = {"excludes": ["body_embedding", "duplicate_neighbors"]}
+_REPO_MATCH_FIELDS = ["name^3", "description", "topics^2"]
+_ISSUE_MATCH_FIELDS = ["title^3", "body"]
+# Full-text totals are counted exactly only up to this many matches (reported as a
+# lower bound beyond it), so broad queries stop scoring once the page is filled.
+_TRACK_TOTAL_HITS = 1000
+_REPO_HIGHLIGHT: dict[str, Any] = {"fields": {"description": {}, "name": {}}}
+_ISSUE_HIGHLIGHT: dict[str, Any] = {"fields": {"title": {}, "body": {}}}
+
 
 def repo_full_text_search(
     query: str,
@@ -34,14 +48,19 @@ def repo_full_text_search(
 
     body: dict[str, Any] = {
         "index": REPOSITORIES_INDEX,
+        "_source": _REPO_SOURCE,
+        # The shard request cache skips size > 0 searches unless asked per request.
+        # None of these builders use `now`, so identical repeats are cacheable.
+        "request_cache": True,
         "size": size,
+        "track_total_hits": _TRACK_TOTAL_HITS,
         "query": {
             "bool": {
                 "must": [
                     {
                         "multi_match": {
                             "query": query,
-                            "fields": ["name^3", "description", "topics^2"],
+                            "fields": _REPO_MATCH_FIELDS,
                             "type": "best_fields",
                         }
                     }
@@ -49,7 +68,7 @@ def repo_full_text_search(
                 "filter": filters,
             }
         },
-        "highlight": {"fields": {"description": {}, "name": {}}},
+        "highlight": _REPO_HIGHLIGHT,
     }
 
     return body
@@ -76,14 +95,17 @@ def issue_full_text_search(
 
     return {
         "index": ISSUES_INDEX,
+        "_source": _ISSUE_SOURCE,
+        "request_cache": True,
         "size": size,
+        "track_total_hits": _TRACK_TOTAL_HITS,
         "query": {
             "bool": {
                 "must": [
                     {
                         "multi_match": {
                             "query": query,
-                            "fields": ["title^3", "body"],
+                            "fields": _ISSUE_MATCH_FIELDS,
                             "type": "best_fields",
                         }
                     }
@@ -91,7 +113,7 @@ def issue_full_text_search(
                 "filter": filters,
             }
         },
-        "highlight": {"fields": {"title": {}, "body": {}}},
+        "highlight": _ISSUE_HIGHLIGHT,
     }
 
 
@@ -103,6 +125,8 @@ def repo_semantic_search(
 ) -> dict[str, Any]:
     return {
         "index": REPOSITORIES_INDEX,
+        "_source": _REPO_SOURCE,
+        "request_cache": True,
         "size": k,
         "knn": {
             "field": "description_embedding",
@@ -122,6 +146,8 @@ def issue_semantic_search(
 ) -> dict[str, Any]:
     body: dict[str, Any] = {
         "index": ISSUES_INDEX,
+        "_source": _ISSUE_SOURCE,
+        "request_cache": True,
         "size": k,
         "knn": {
             "field": "body_embedding",
@@ -0,0 +1,89 @@
+"""Micro-batch concurrent query encodes into one encoder call."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+
+import structlog
+
+from repoman.embeddings.encoder import EmbeddingEncoder
+
+log = structlog.get_logger()
+
+
+class EncoderBatcher:
+    """Gather texts submitted within a short window and encode them together.
+
+    A transformer encodes a batch in little more time than a single text, so
+    concurrent semantic searches share one forward pass instead of queuing for
+    one each. Batches run on a worker thread, keeping the event loop free.
+    """
+
+    def __init__(
+        self,
+        encoder: EmbeddingEncoder,
+        *,
+        window_seconds: float = 0.01,
+        max_batch: int = 32,
+    ) -> None:
+        """Initialise the batcher.
+
+        Args:
+            encoder: Encoder whose `encode_batch` runs each batch.
+            window_seconds: How long to gather texts before encoding a batch.
+            max_batch: Largest number of texts per batch.
+        """
+        self._encoder = encoder
+        self._window = window_seconds
+        self._max_batch = max_batch
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future]] = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+
+    async def submit(self, text: str) -> list[float]:
+        """Encode ``text`` as part of the next batch.
+
+        Args:
+            text: Text to encode.
+
+        Returns:
+            Embedding vector for ``text``.
+        """
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+
+    async def aclose(self) -> None:
+        """Stop the worker and fail any texts still queued."""
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("EncoderBatcher is closed"))
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            await asyncio.sleep(self._window)
+            while len(batch) < self._max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            texts = [text for text, _ in batch]
+            try:
+                # Batches run one at a time: the encoder is the bottleneck, and a
+                # busy encoder lets the next batch grow while it waits.
+                vectors = await asyncio.to_thread(self._encoder.encode_batch, texts)
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            log.debug("encoder_batch", texts=len(batch))
+            for (_, future), vector in zip(batch, vectors, strict=True):
+                if not future.done():
+                    future.set_result(vector)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import aiofiles  # type: ignore[import-untyped]
@@ -95,8 +96,19 @@ class FileOps:
             Sorted list of relative file paths.
         """
         base = self._resolve(sub_path) if sub_path else self._root
+        prefix_len = len(os.path.join(self._root, ""))
         result = []
-        for fpath in base.rglob("*"):
-            if fpath.is_file():
-                result.append(str(fpath.relative_to(self._root)))
+        # DirEntry file-type checks come from the directory listing itself, unlike
+        # Path.is_file(), which stats every path.
+        stack = [str(base)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            result.append(entry.path[prefix_len:])
+            except OSError:
+                continue
         return sorted(result)
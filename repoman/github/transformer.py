@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+from repoman.analysis.duplicates import duplicate_cluster_keys
 from repoman.embeddings.encoder import EmbeddingEncoder
 
 
@@ -153,6 +154,7 @@ def issues_to_documents(
             if isinstance(a, dict) and a.get("login")
         ]
         body = item.get("body") or ""
+        embedding = encoder.encode(body)
 
         out.append(
             {
@@ -160,7 +162,8 @@ def issues_to_documents(
                 "repo_full_name": repo_full_name,
                 "title": item.get("title") or "",
                 "body": body,
-                "body_embedding": encoder.encode(body),
+                "body_embedding": embedding,
+                "dup_cluster": duplicate_cluster_keys(embedding),
                 "state": item.get("state") or "",
                 "labels": labels,
                 "is_pull_request": is_pull_request,
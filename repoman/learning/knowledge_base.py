@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
+import orjson
 import structlog
 
 from repoman.config import Settings
@@ -67,7 +67,7 @@ class KnowledgeBase:
                     )
 
             if result.consensus and result.after_score > result.before_score:
-                plan_str = json.dumps(result.consensus.unified_plan, default=str)
+                plan_str = orjson.dumps(result.consensus.unified_plan, default=str).decode()
                 self._strategies.upsert(
                     ids=[result.job_id],
                     documents=[plan_str],
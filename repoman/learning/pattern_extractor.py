@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections import Counter
+
 from repoman.core.state import AgentAuditReport
 
 
@@ -14,13 +16,13 @@ def extract_patterns(audit_reports: list[AgentAuditReport]) -> list[dict]:
     Returns:
         List of pattern dicts with category, severity, and count.
     """
-    counts: dict[tuple, int] = {}
-    for report in audit_reports:
-        for issue in report.critical_issues + report.major_issues + report.minor_issues:
-            key = (issue.category, issue.severity)
-            counts[key] = counts.get(key, 0) + 1
+    counts = Counter(
+        (issue.category, issue.severity)
+        for report in audit_reports
+        for issues in (report.critical_issues, report.major_issues, report.minor_issues)
+        for issue in issues
+    )
 
     return [
-        {"category": cat, "severity": sev, "count": cnt}
-        for (cat, sev), cnt in sorted(counts.items(), key=lambda x: -x[1])
+        {"category": cat, "severity": sev, "count": cnt} for (cat, sev), cnt in counts.most_common()
     ]
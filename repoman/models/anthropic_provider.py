@@ -4,28 +4,45 @@ from __future__ import annotations
 
 import anthropic
 
-from repoman.models.base import BaseLLMProvider, LLMResponse, Message
+from repoman.models.base import HTTP2_AVAILABLE, BaseLLMProvider, LLMResponse, Message
 
 
 class AnthropicProvider(BaseLLMProvider):
     """Wraps the Anthropic async client for Claude models."""
 
-    def __init__(self, api_key: str, model: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        *,
+        http_client: anthropic.DefaultAsyncHttpxClient | None = None,
+    ) -> None:
         """Initialise the provider.
 
         Args:
             api_key: Anthropic API key.
             model: Claude model identifier.
+            http_client: Optional shared HTTP client (see `create_http_client`).
         """
-        self._client = anthropic.AsyncAnthropic(api_key=api_key)
+        self._client = anthropic.AsyncAnthropic(api_key=api_key, http_client=http_client)
         self._model = model
 
+    @staticmethod
+    def create_http_client() -> anthropic.DefaultAsyncHttpxClient:
+        """Create a pooled HTTP client that several providers can share.
+
+        Returns:
+            SDK-compatible async HTTP client (HTTP/2 when `h2` is installed).
+        """
+        return anthropic.DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE)
+
     async def complete(
         self,
         messages: list[Message],
         system_prompt: str = "",
         temperature: float = 0.3,
         max_tokens: int = 8192,
+        cache_key: str | None = None,
     ) -> LLMResponse:
         """Send messages to Claude and return the response.
 
@@ -34,6 +51,8 @@ class AnthropicProvider(BaseLLMProvider):
             system_prompt: Claude system prompt.
             temperature: Sampling temperature.
             max_tokens: Maximum tokens in the completion.
+            cache_key: When set, the system prompt is marked as a cache breakpoint.
+                Anthropic keys its cache on content, so the key itself is not sent.
 
         Returns:
             LLMResponse with content and token usage.
@@ -49,7 +68,11 @@ class AnthropicProvider(BaseLLMProvider):
             "temperature": temperature,
             "messages": anthropic_messages,
         }
-        if system_prompt:
+        if system_prompt and cache_key:
+            kwargs["system"] = [
+                {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+            ]
+        elif system_prompt:
             kwargs["system"] = system_prompt
 
         response = await self._client.messages.create(**kwargs)
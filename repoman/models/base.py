@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import importlib.util
 from abc import ABC, abstractmethod
 
 from pydantic import BaseModel
 
+# httpx only negotiates HTTP/2 when the optional `h2` package is importable.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class Message(BaseModel):
     """A single LLM conversation message."""
@@ -33,6 +37,7 @@ class BaseLLMProvider(ABC):
         system_prompt: str = "",
         temperature: float = 0.3,
         max_tokens: int = 8192,
+        cache_key: str | None = None,
     ) -> LLMResponse:
         """Send messages and return the model response.
 
@@ -41,6 +46,8 @@ class BaseLLMProvider(ABC):
             system_prompt: Optional system-level instruction.
             temperature: Sampling temperature.
             max_tokens: Maximum tokens in the response.
+            cache_key: Optional key shared by requests with the same prompt prefix,
+                enabling provider-side prompt caching.
 
         Returns:
             LLMResponse with content and usage stats.
@@ -52,6 +59,7 @@ class BaseLLMProvider(ABC):
         system_prompt: str = "",
         temperature: float = 0.3,
         max_tokens: int = 8192,
+        cache_key: str | None = None,
     ) -> LLMResponse:
         """Like complete() but appends a JSON-only instruction to the system prompt.
 
@@ -60,9 +68,10 @@ class BaseLLMProvider(ABC):
             system_prompt: Optional system-level instruction.
             temperature: Sampling temperature.
             max_tokens: Maximum tokens in the response.
+            cache_key: Optional prompt-prefix cache key (see `complete`).
 
         Returns:
             LLMResponse guaranteed to contain only JSON content.
         """
         json_prompt = (system_prompt + "\nRespond with valid JSON only.").strip()
-        return await self.complete(messages, json_prompt, temperature, max_tokens)
+        return await self.complete(messages, json_prompt, temperature, max_tokens, cache_key)
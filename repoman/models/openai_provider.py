@@ -4,28 +4,41 @@ from __future__ import annotations
 
 import openai
 
-from repoman.models.base import BaseLLMProvider, LLMResponse, Message
+from repoman.models.base import HTTP2_AVAILABLE, BaseLLMProvider, LLMResponse, Message
 
 
 class OpenAIProvider(BaseLLMProvider):
     """Wraps the OpenAI async client for GPT models."""
 
-    def __init__(self, api_key: str, model: str) -> None:
+    def __init__(
+        self, api_key: str, model: str, *, http_client: openai.DefaultAsyncHttpxClient | None = None
+    ) -> None:
         """Initialise the provider.
 
         Args:
             api_key: OpenAI API key.
             model: GPT model identifier.
+            http_client: Optional shared HTTP client (see `create_http_client`).
         """
-        self._client = openai.AsyncOpenAI(api_key=api_key)
+        self._client = openai.AsyncOpenAI(api_key=api_key, http_client=http_client)
         self._model = model
 
+    @staticmethod
+    def create_http_client() -> openai.DefaultAsyncHttpxClient:
+        """Create a pooled HTTP client that several providers can share.
+
+        Returns:
+            SDK-compatible async HTTP client (HTTP/2 when `h2` is installed).
+        """
+        return openai.DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE)
+
     async def complete(
         self,
         messages: list[Message],
         system_prompt: str = "",
         temperature: float = 0.3,
         max_tokens: int = 8192,
+        cache_key: str | None = None,
     ) -> LLMResponse:
         """Send messages to GPT and return the response.
 
@@ -34,6 +47,8 @@ class OpenAIProvider(BaseLLMProvider):
             system_prompt: System-level instruction prepended to messages.
             temperature: Sampling temperature.
             max_tokens: Maximum tokens in the completion.
+            cache_key: Forwarded as ``prompt_cache_key`` so requests sharing a
+                prefix are routed to the same prompt cache.
 
         Returns:
             LLMResponse with content and token usage.
@@ -44,11 +59,16 @@ class OpenAIProvider(BaseLLMProvider):
         for m in messages:
             oai_messages.append({"role": m.role, "content": m.content})
 
+        kwargs: dict = {}
+        if cache_key:
+            kwargs["prompt_cache_key"] = cache_key
+
         response = await self._client.chat.completions.create(
             model=self._model,
             messages=oai_messages,  # type: ignore[arg-type]
             temperature=temperature,
             max_tokens=max_tokens,
+            **kwargs,
         )
         content = response.choices[0].message.content or ""
         usage = response.usage
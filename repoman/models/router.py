@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+from typing import Any
+
 import structlog
 
 from repoman.config import Settings
@@ -24,25 +28,46 @@ class ModelRouter:
         self._config = config
         self._providers: dict[str, BaseLLMProvider] = {}
         self._fallback_chain: list[BaseLLMProvider] = []
+        self._http_clients: list[Any] = []
+        self._semaphore = asyncio.Semaphore(config.llm_concurrency)
         self._setup_providers()
 
     def _setup_providers(self) -> None:
         """Construct provider instances for each agent role."""
         cfg = self._config
+        # One pooled client per SDK, shared by every provider of that SDK, so
+        # concurrent agent calls reuse keep-alive connections instead of each
+        # provider opening its own TLS session.
         if cfg.anthropic_api_key:
+            client = AnthropicProvider.create_http_client()
+            self._http_clients.append(client)
             self._providers["orchestrator"] = AnthropicProvider(
-                cfg.anthropic_api_key, cfg.orchestrator_model
+                cfg.anthropic_api_key, cfg.orchestrator_model, http_client=client
             )
             self._providers["architect"] = AnthropicProvider(
-                cfg.anthropic_api_key, cfg.architect_model
+                cfg.anthropic_api_key, cfg.architect_model, http_client=client
+            )
+            self._providers["builder"] = AnthropicProvider(
+                cfg.anthropic_api_key, cfg.builder_model, http_client=client
             )
-            self._providers["builder"] = AnthropicProvider(cfg.anthropic_api_key, cfg.builder_model)
             self._fallback_chain.append(
-                AnthropicProvider(cfg.anthropic_api_key, cfg.orchestrator_model)
+                AnthropicProvider(cfg.anthropic_api_key, cfg.orchestrator_model, http_client=client)
             )
         if cfg.openai_api_key:
-            self._providers["auditor"] = OpenAIProvider(cfg.openai_api_key, cfg.auditor_model)
-            self._fallback_chain.append(OpenAIProvider(cfg.openai_api_key, cfg.auditor_model))
+            client = OpenAIProvider.create_http_client()
+            self._http_clients.append(client)
+            self._providers["auditor"] = OpenAIProvider(
+                cfg.openai_api_key, cfg.auditor_model, http_client=client
+            )
+            self._fallback_chain.append(
+                OpenAIProvider(cfg.openai_api_key, cfg.auditor_model, http_client=client)
+            )
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP clients."""
+        clients, self._http_clients = self._http_clients, []
+        for client in clients:
+            await client.aclose()
 
     async def complete(
         self,
@@ -54,7 +79,8 @@ class ModelRouter:
         """Complete a request for the given agent role.
 
         Tries the primary provider for the role, then falls through to the
-        fallback chain on any exception.
+        fallback chain on any exception. At most ``llm_concurrency`` requests
+        are in flight at once across all roles.
 
         Args:
             role: Agent role name used to select the provider.
@@ -76,7 +102,8 @@ class ModelRouter:
         last_exc: Exception | None = None
         for provider in providers_to_try:
             try:
-                response = await provider.complete(messages, system_prompt, **kwargs)
+                async with self._semaphore:
+                    response = await provider.complete(messages, system_prompt, **kwargs)
                 await log.ainfo(
                     "llm_call",
                     role=role,
@@ -111,3 +138,52 @@ class ModelRouter:
         """
         json_prompt = (system_prompt + "\nRespond with valid JSON only.").strip()
         return await self.complete(role, messages, json_prompt, **kwargs)
+
+    async def complete_json_continue(
+        self,
+        role: str,
+        messages: list[Message],
+        prior_response: LLMResponse,
+        correction: str,
+        system_prompt: str = "",
+        **kwargs,
+    ) -> LLMResponse:
+        """Continue a JSON conversation after an unusable reply.
+
+        Appends the prior assistant turn and a correction to ``messages`` and
+        re-issues the request with a cache key derived from the unchanged prefix
+        (system prompt and first user turn), so providers can serve that prefix
+        from their prompt cache instead of re-processing it.
+
+        Args:
+            role: Agent role name.
+            messages: Conversation history of the original request; extended in place.
+            prior_response: The response being corrected.
+            correction: Follow-up user instruction.
+            system_prompt: System instruction used for the original request.
+            **kwargs: Additional arguments forwarded to the provider.
+
+        Returns:
+            LLMResponse with JSON content.
+        """
+        kwargs.setdefault(
+            "cache_key", prefix_cache_key(system_prompt, messages[0].content if messages else "")
+        )
+        messages.append(Message(role="assistant", content=prior_response.content))
+        messages.append(Message(role="user", content=correction))
+        return await self.complete_json(role, messages, system_prompt, **kwargs)
+
+
+def prefix_cache_key(system_prompt: str, prefix: str) -> str:
+    """Derive a stable prompt-cache key from the system prompt and a shared prefix.
+
+    Args:
+        system_prompt: System instruction.
+        prefix: Leading user content shared by the requests that should share a cache.
+
+    Returns:
+        Hex digest identifying the shared prompt prefix.
+    """
+    digest = hashlib.blake2b(system_prompt.encode(), digest_size=16)
+    digest.update(prefix.encode())
+    return digest.hexdigest()
@@ -0,0 +1,38 @@
+"""Terminal UI helpers for the CLI."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@contextmanager
+def maybe_progress(console: Console, description: str) -> Iterator[Callable[[str], None]]:
+    """Show a spinner on interactive terminals and plain status lines elsewhere.
+
+    Rich's live display refreshes from a background thread and writes ANSI escapes,
+    which only adds CPU and log noise under CI or when output is redirected.
+
+    Args:
+        console: Console to render to.
+        description: Initial status text.
+
+    Yields:
+        Callable that replaces the status text.
+    """
+    if not console.is_terminal:
+        console.print(description)
+        yield console.print
+        return
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    with Progress(
+        SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
+    ) as progress:
+        task = progress.add_task(description, total=None)
+        yield lambda text: progress.update(task, description=text)
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from repoman.core.state import AgentVote, Issue
+from repoman.models.base import LLMResponse
 from repoman.models.router import ModelRouter
 
 
@@ -39,6 +40,84 @@ class TestBaseAgent:
         agent = BuilderAgent(router)
         assert agent.role == "builder"
 
+    def test_strip_fences(self) -> None:
+        """Markdown code fences around JSON replies should be removed."""
+        from repoman.agents.base import _strip_fences
+
+        assert _strip_fences('```json\n{"a": 1}\n```') == '{"a": 1}'
+        assert _strip_fences('  ```\n{"a": 1}```  ') == '{"a": 1}'
+        assert _strip_fences('{"a": 1}') == '{"a": 1}'
+
+    def test_shared_json_reuses_rendering_within_a_round(self) -> None:
+        """Inside a round the same input is rendered once; nothing outlives the round."""
+        from repoman.agents.base import _round_renders, _shared_json, render_cache
+
+        plan = {"steps": {"a": 1}}
+        with render_cache():
+            first = _shared_json(plan)
+            assert _shared_json(plan) is first
+            assert _shared_json({"steps": {"a": 1}}) == first
+            assert _shared_json({"other": True}) != first
+        assert _round_renders.get() is None
+        assert _shared_json(plan) is not first
+
+    def test_plans_json_matches_dumps_of_filtered_plans(self) -> None:
+        """Each agent's view should equal the filtered mapping, built from shared pieces."""
+        from repoman.agents._json import dumps
+        from repoman.agents.base import _plans_json
+
+        plans = {"Architect": {"steps": ["a"]}, "Auditor": {}, "Builder": {"x": "é"}}
+        assert _plans_json(plans) == dumps(plans)
+        assert _plans_json(plans, "Auditor") == dumps(
+            {"Architect": plans["Architect"], "Builder": plans["Builder"]}
+        )
+        assert _plans_json({"A": {}}, "A") == "{}"
+
+    async def test_invalid_json_retries_via_continuation(self, settings) -> None:
+        """A non-JSON reply should be retried once with the same prefix cache key."""
+        router = MagicMock(spec=ModelRouter)
+        router._config = settings
+        router.complete_json = AsyncMock(return_value=LLMResponse(content="oops", model="m"))
+        router.complete_json_continue = AsyncMock(
+            return_value=LLMResponse(content='{"ok": true}', model="m")
+        )
+        from repoman.agents.architect import ArchitectAgent
+
+        agent = ArchitectAgent(router)
+        assert await agent._call_llm_json("hello") == {"ok": True}
+        first_key = router.complete_json.await_args.kwargs["cache_key"]
+        assert router.complete_json_continue.await_args.kwargs["cache_key"] == first_key
+
+    async def test_near_miss_json_parsed_without_retry(self, settings) -> None:
+        """Trailing commas should be recovered locally instead of re-prompting."""
+        router = MagicMock(spec=ModelRouter)
+        router._config = settings
+        router.complete_json = AsyncMock(
+            return_value=LLMResponse(content='{"ok": true, "items": [1, 2,],}', model="m")
+        )
+        router.complete_json_continue = AsyncMock()
+        from repoman.agents.architect import ArchitectAgent
+
+        agent = ArchitectAgent(router)
+        assert await agent._call_llm_json("hello") == {"ok": True, "items": [1, 2]}
+        router.complete_json_continue.assert_not_awaited()
+
+    async def test_llm_cache_skips_repeat_calls(self, settings, tmp_path) -> None:
+        """Identical prompts should be served from the disk cache when enabled."""
+        settings.llm_cache_enabled = True
+        settings.llm_cache_dir = str(tmp_path)
+        router = MagicMock(spec=ModelRouter)
+        router._config = settings
+        router.complete_json = AsyncMock(return_value=LLMResponse(content='{"a": 1}', model="m"))
+        from repoman.agents.architect import ArchitectAgent
+
+        agent = ArchitectAgent(router)
+        assert await agent._call_llm_json("same") == {"a": 1}
+        assert await agent._call_llm_json("same") == {"a": 1}
+        assert router.complete_json.await_count == 1
+        await agent._call_llm_json("different")
+        assert router.complete_json.await_count == 2
+
 
 class TestIssueModel:
     """Tests for Issue Pydantic model."""
@@ -75,6 +154,15 @@ class TestIssueModel:
         assert d["file_path"] == "src/app.py"
         assert d["line_number"] == 10
 
+    def test_validators_compiled_at_import(self) -> None:
+        """Hot-path models should not defer validator compilation to first use."""
+        from repoman.agents.base import _ISSUE_LIST_ADAPTER
+        from repoman.core.state import AgentAuditReport, ChangeSet
+
+        for model in (Issue, AgentAuditReport, AgentVote, ChangeSet):
+            assert model.__pydantic_complete__, model.__name__
+        assert _ISSUE_LIST_ADAPTER.validate_python([]) == []
+
 
 class TestAgentVote:
     """Tests for AgentVote model."""
@@ -101,3 +189,91 @@ class TestAgentVote:
         d = vote.model_dump()
         assert d["agent_name"] == "Auditor"
         assert d["blocking_concerns"] == ["Missing auth"]
+
+
+class TestBuilderExecution:
+    """Tests for BuilderAgent plan execution scheduling."""
+
+    def test_plan_waves_split_on_shared_files(self) -> None:
+        """Only steps touching the same files should be serialised into later waves."""
+        from repoman.agents.builder import _plan_waves
+
+        steps = [
+            ("fix_critical_bugs", {"files": ["app.py"]}),
+            ("refactor_code", {"files": ["app.py", "util.py"]}),
+            ("write_tests", {"files": ["tests/test_app.py"]}),
+            ("generate_documentation", {}),
+            ("final_lint_format", {"files": ["util.py"]}),
+        ]
+        waves = [[name for name, _ in wave] for wave in _plan_waves(steps)]
+        assert waves == [
+            ["fix_critical_bugs", "write_tests", "generate_documentation"],
+            ["refactor_code"],
+            ["final_lint_format"],
+        ]
+
+    async def test_execute_plan_returns_steps_in_execution_order(
+        self, settings, sample_snapshot
+    ) -> None:
+        """Change sets should follow EXECUTION_ORDER regardless of wave grouping."""
+        router = MagicMock(spec=ModelRouter)
+        router._config = settings
+        router.complete_json = AsyncMock(
+            return_value=LLMResponse(content='{"summary": "ok"}', model="m")
+        )
+        from repoman.agents.builder import BuilderAgent
+
+        plan = {
+            "steps": {
+                "write_tests": {"files": ["a.py"]},
+                "fix_critical_bugs": {"files": ["a.py"]},
+                "setup_docker": {},
+            }
+        }
+        change_sets = await BuilderAgent(router).execute_plan(plan, sample_snapshot, MagicMock())
+        assert [cs.step_name for cs in change_sets] == [
+            "fix_critical_bugs",
+            "write_tests",
+            "setup_docker",
+        ]
+        assert router.complete_json.await_count == 3
+
+    async def test_apply_change_set_last_operation_wins(self, tmp_path) -> None:
+        """Concurrent file ops should leave the same state as sequential application."""
+        from repoman.agents.builder import _apply_change_set
+        from repoman.core.state import ChangeSet, FileChange
+        from repoman.execution.file_ops import FileOps
+
+        (tmp_path / "old.txt").write_text("x")
+        cs = ChangeSet(
+            step_name="s",
+            files_created=[
+                FileChange(path="a.txt", action="create", content="1", summary=""),
+                FileChange(path="b/c.txt", action="create", content="2", summary=""),
+            ],
+            files_modified=[FileChange(path="a.txt", action="modify", content="3", summary="")],
+            files_deleted=["old.txt"],
+            summary="",
+        )
+        await _apply_change_set(cs, FileOps(str(tmp_path)))
+        assert (tmp_path / "a.txt").read_text() == "3"
+        assert (tmp_path / "b" / "c.txt").read_text() == "2"
+        assert not (tmp_path / "old.txt").exists()
+
+    async def test_step_prompts_share_repo_prefix(self, settings, sample_snapshot) -> None:
+        """Every step prompt should open with the same repo context and cache key."""
+        router = MagicMock(spec=ModelRouter)
+        router._config = settings
+        router.complete_json = AsyncMock(return_value=LLMResponse(content="{}", model="m"))
+        from repoman.agents.builder import BuilderAgent
+
+        agent = BuilderAgent(router)
+        await agent._generate_step("write_tests", {"files": ["a.py"]}, sample_snapshot)
+        await agent._generate_step("setup_docker", {"changes": [{"b": 1, "a": 2}]}, sample_snapshot)
+
+        (first, second) = router.complete_json.await_args_list
+        prefix = agent._repo_prefix(sample_snapshot)
+        assert first.args[1][0].content.startswith(prefix)
+        assert second.args[1][0].content.startswith(prefix)
+        assert '[{"a":2,"b":1}]' in second.args[1][0].content
+        assert first.kwargs["cache_key"] == second.kwargs["cache_key"]
@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+import ast
 from pathlib import Path
 
 import pytest
 
-from repoman.analysis.complexity import analyse_python_file, cyclomatic_complexity
+from repoman.analysis.complexity import (
+    analyse_python_file,
+    cyclomatic_complexity,
+    cyclomatic_complexity_fast,
+    cyclomatic_complexity_tree,
+)
 from repoman.analysis.dependency import parse_dependencies
 from repoman.analysis.health import compute_initial_health_score, compute_weighted_score
 from repoman.analysis.language import detect_frameworks, detect_languages
-from repoman.analysis.structure import build_file_tree, get_directory_structure
+from repoman.analysis.structure import (
+    build_file_tree,
+    count_newlines,
+    get_directory_structure,
+    scan_repo,
+)
 from repoman.core.state import RepoSnapshot
 
 
@@ -53,6 +64,13 @@ class TestLanguageDetection:
         frameworks = detect_frameworks(str(tmp_path))
         assert "FastAPI" in frameworks
 
+    def test_frameworks_reported_in_declaration_order(self, tmp_path: Path) -> None:
+        """Should report each framework once, in manifest then marker order."""
+        (tmp_path / "requirements.txt").write_text("Tornado\nFlask\nflask-cors\nDjango\n")
+        (tmp_path / "go.mod").write_text("require github.com/gin-gonic/gin v1.9.0\n")
+        frameworks = detect_frameworks(str(tmp_path))
+        assert frameworks == ["Django", "Flask", "Tornado", "Gin"]
+
     def test_detects_django_framework(self, tmp_path: Path) -> None:
         """Should detect Django from requirements.txt."""
         (tmp_path / "requirements.txt").write_text("Django>=4.0\n")
@@ -63,39 +81,53 @@ class TestLanguageDetection:
 class TestDependencyParsing:
     """Tests for dependency parsing."""
 
-    def test_parses_requirements_txt(self, tmp_path: Path) -> None:
+    async def test_parses_requirements_txt(self, tmp_path: Path) -> None:
         """Should parse Python requirements.txt."""
         (tmp_path / "requirements.txt").write_text("fastapi>=0.111.0\nuvicorn==0.29.0\n")
-        deps = parse_dependencies(str(tmp_path))
+        deps = await parse_dependencies(str(tmp_path))
         names = [d["name"] for d in deps]
         assert "fastapi" in names
         assert "uvicorn" in names
 
-    def test_parses_package_json(self, tmp_path: Path) -> None:
+    async def test_parses_package_json(self, tmp_path: Path) -> None:
         """Should parse Node.js package.json."""
         (tmp_path / "package.json").write_text(
             '{"dependencies": {"express": "^4.0.0"}, "devDependencies": {"jest": "^29.0.0"}}'
         )
-        deps = parse_dependencies(str(tmp_path))
+        deps = await parse_dependencies(str(tmp_path))
         names = [d["name"] for d in deps]
         assert "express" in names
         assert "jest" in names
 
-    def test_dep_types(self, tmp_path: Path) -> None:
+    async def test_dep_types(self, tmp_path: Path) -> None:
         """Should assign correct runtime/dev types."""
         (tmp_path / "package.json").write_text(
             '{"dependencies": {"react": "^18"}, "devDependencies": {"typescript": "^5"}}'
         )
-        deps = parse_dependencies(str(tmp_path))
+        deps = await parse_dependencies(str(tmp_path))
         types = {d["name"]: d["type"] for d in deps}
         assert types.get("react") == "runtime"
         assert types.get("typescript") == "dev"
 
-    def test_empty_directory(self, tmp_path: Path) -> None:
+    async def test_empty_directory(self, tmp_path: Path) -> None:
         """Should return empty list for a repo with no manifest files."""
-        deps = parse_dependencies(str(tmp_path))
+        deps = await parse_dependencies(str(tmp_path))
         assert deps == []
 
+    async def test_manifest_order_preserved(self, tmp_path: Path) -> None:
+        """Dependencies should be reported in manifest order regardless of read timing."""
+        (tmp_path / "go.mod").write_text("require (\n\tgithub.com/x/y v1.2.3\n)\n")
+        (tmp_path / "Cargo.toml").write_text('[dependencies]\nserde = "1.0"\n[dev]\n')
+        (tmp_path / "requirements-dev.txt").write_text("pytest>=8\n")
+        (tmp_path / "requirements.txt").write_text("# pinned\nrequests==2.31\n")
+        deps = await parse_dependencies(str(tmp_path))
+        assert [(d["name"], d["type"]) for d in deps] == [
+            ("requests", "runtime"),
+            ("pytest", "dev"),
+            ("serde", "runtime"),
+            ("github.com/x/y", "runtime"),
+        ]
+
 
 class TestHealthScoring:
     """Tests for health score computation."""
@@ -185,6 +217,17 @@ def foo(x):
     return x
 """
         assert cyclomatic_complexity(source) > 1
+        assert cyclomatic_complexity_tree(ast.parse(source)) == cyclomatic_complexity(source)
+
+    def test_branches_nested_in_expressions_counted(self) -> None:
+        """Comprehensions inside calls, lambdas and annotations still count."""
+        source = """
+@deco([x for x in y])
+def f(a: list[int] = [i for i in z]) -> None:
+    g = lambda: {k: v for k, v in w}
+    print(f"{[q for q in r]}")
+"""
+        assert cyclomatic_complexity(source) == 5
 
     def test_invalid_syntax_returns_one(self) -> None:
         """Invalid Python syntax should return complexity of 1."""
@@ -199,6 +242,41 @@ def foo(x):
         assert result["classes"] == 1
         assert result["lines"] >= 4
 
+    def test_analyse_python_file_reanalyses_modified_file(self, tmp_path: Path) -> None:
+        """Cached metrics should be reused until the file changes."""
+        import os
+
+        f = tmp_path / "sample.py"
+        f.write_text("def foo():\n    pass\n")
+        first = analyse_python_file(str(f))
+        first["functions"] = 99
+        assert analyse_python_file(str(f))["functions"] == 1
+
+        f.write_text("def foo():\n    pass\n\n\ndef bar():\n    pass\n")
+        st = f.stat()
+        os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert analyse_python_file(str(f))["functions"] == 2
+
+    def test_fast_scan_matches_ast_and_ignores_prose(self) -> None:
+        """The keyword scanner should agree with the AST count on ordinary code."""
+        source = '''
+def foo(xs):
+    """Loop for each item; if empty, while away. # not code"""
+    # for if while
+    if xs:
+        for x in xs:
+            with open(x) as f:
+                assert f
+    elif not xs:
+        return [y for y in xs if y]
+    try:
+        pass
+    except ValueError:
+        s = "for while if"
+    return s
+'''
+        assert cyclomatic_complexity_fast(source) == cyclomatic_complexity(source) == 8
+
 
 class TestStructureAnalysis:
     """Tests for file tree structure analysis."""
@@ -223,6 +301,28 @@ class TestStructureAnalysis:
         assert "main.py" in tree
         assert not any("__pycache__" in p for p in tree)
 
+    def test_scan_repo_records(self, tmp_path: Path) -> None:
+        """Should describe each file once, in walk order, without following dir links."""
+        (tmp_path / "App.PY").write_text("x\n")
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / "b.rs").write_text("fn main() {}\n")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "dep.js").write_text("x")
+        (tmp_path / "link").symlink_to(sub, target_is_directory=True)
+
+        records = scan_repo(str(tmp_path))
+        assert [(r.rel_path, r.ext, r.size) for r in records] == [
+            ("App.PY", ".py", 2),
+            ("sub/b.rs", ".rs", 13),
+        ]
+
+    def test_count_newlines_spans_chunks(self, tmp_path: Path) -> None:
+        """Should count newlines across read-chunk boundaries without decoding."""
+        f = tmp_path / "big.txt"
+        f.write_bytes(b"\xff\xfe line\r\n" * 20_000)
+        assert count_newlines(f) == 20_000
+
     def test_directory_structure(self) -> None:
         """Should build nested dict from file tree."""
         tree = ["src/main.py", "src/utils/helper.py", "README.md"]
@@ -230,3 +330,54 @@ class TestStructureAnalysis:
         assert "src" in structure
         assert "main.py" in structure["src"]
         assert "README.md" in structure
+
+
+class TestRepoIngester:
+    """Tests for local repository analysis."""
+
+    async def test_analyse_counts_lines_and_flags(self, settings, tmp_path: Path) -> None:
+        """Should count lines of every small file and detect key files."""
+        from repoman.analysis.ingestion import RepoIngester
+
+        (tmp_path / "README.md").write_text("# Title\n\nBody\n")
+        (tmp_path / "requirements.txt").write_text("fastapi>=0.111\n")
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_app.py").write_text("def test():\n    pass\n")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "dep.js").write_text("x\n" * 100)
+
+        snapshot = await RepoIngester(settings)._analyse("https://x/o/repo.git", str(tmp_path))
+        assert snapshot.name == "repo"
+        assert sorted(snapshot.file_tree) == ["README.md", "requirements.txt", "tests/test_app.py"]
+        assert snapshot.total_lines == 6
+        assert snapshot.file_summaries["README.md"] == "3 lines"
+        assert snapshot.has_readme and snapshot.has_tests
+        assert [d["name"] for d in snapshot.dependencies] == ["fastapi"]
+        assert not (snapshot.has_ci or snapshot.has_dockerfile or snapshot.has_license)
+
+    async def test_analyse_scans_on_given_io_pool(self, settings, tmp_path: Path) -> None:
+        """The blocking scan should run on the supplied executor."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from repoman.analysis.ingestion import RepoIngester
+
+        (tmp_path / "main.py").write_text("print()\n")
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="io-test") as pool:
+            ingester = RepoIngester(settings, io_pool=pool)
+            threads = []
+            scan_tree = ingester._scan_tree
+            ingester._scan_tree = lambda path: (
+                threads.append(threading.current_thread().name) or scan_tree(path)
+            )
+            snapshot = await ingester._analyse("https://x/o/repo", str(tmp_path))
+        assert [name.split("_")[0] for name in threads] == ["io-test"]
+        assert snapshot.entry_points == ["main.py"]
+
+    def test_key_file_flags(self) -> None:
+        """Each flag should be set by any matching path in the tree."""
+        from repoman.analysis.ingestion import _key_file_flags
+
+        tree = ["LICENSE", "docker/Dockerfile", ".github/workflows/ci.yml", ".env.sample"]
+        assert _key_file_flags(tree) == (False, False, True, True, True, True)
+        assert _key_file_flags([]) == (False,) * 6
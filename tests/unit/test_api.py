@@ -0,0 +1,104 @@
+"""Unit tests for API infrastructure: job running, job storage and responses."""
+
+from __future__ import annotations
+
+
+class TestSearchResponse:
+    """Tests for serialising search responses."""
+
+    def test_raw_hits_serialised_in_schema_shape(self) -> None:
+        """Raw hits are encoded in the SearchResponse schema shape."""
+        import orjson
+
+        from repoman.api.routes.search import _search_response
+        from repoman.api.schemas import SearchResponse
+
+        resp = _search_response(
+            {
+                "hits": {
+                    "total": {"value": 2, "relation": "eq"},
+                    "hits": [
+                        {"_id": "a", "_score": 1.5, "_source": {"name": "x"}},
+                        {"_id": "b", "_score": None, "highlight": {"name": ["<em>y</em>"]}},
+                    ],
+                }
+            }
+        )
+
+        data = orjson.loads(resp.body)
+        assert resp.media_type == "application/json"
+        assert data == SearchResponse.model_validate(data).model_dump()
+        assert data["total"] == 2
+        assert data["hits"][0] == {
+            "id": "a",
+            "score": 1.5,
+            "source": {"name": "x"},
+            "highlight": None,
+        }
+        assert data["hits"][1]["source"] == {}
+
+    def test_plain_and_missing_totals(self) -> None:
+        """Integer and missing hit totals are both handled."""
+        import orjson
+
+        from repoman.api.routes.search import _search_response
+
+        assert orjson.loads(_search_response({"hits": {"total": 7}}).body)["total"] == 7
+        assert orjson.loads(_search_response({}).body) == {"total": 0, "hits": []}
+
+
+class TestJobRunner:
+    """Tests for the API's in-process job runner."""
+
+    async def test_jobs_beyond_limit_wait_for_a_slot(self) -> None:
+        """Only max_concurrent jobs should run at once; failures reach on_error."""
+        import asyncio
+
+        from repoman.api.job_runner import JobRunner
+
+        runner = JobRunner(max_concurrent=1)
+        release = asyncio.Event()
+        started: list[str] = []
+        errors: list[BaseException] = []
+
+        async def blocking() -> None:
+            started.append("a")
+            await release.wait()
+
+        async def failing() -> None:
+            started.append("b")
+            raise ValueError("boom")
+
+        runner.submit("a", blocking)
+        runner.submit("b", failing, on_error=errors.append)
+        await asyncio.sleep(0.01)
+        assert started == ["a"]
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert started == ["a", "b"]
+        assert [str(e) for e in errors] == ["boom"]
+        await runner.aclose()
+
+
+class TestJobStore:
+    """Tests for the API's bounded job record store."""
+
+    def test_records_expire_and_oldest_are_evicted(self, monkeypatch) -> None:
+        """Records should drop after the TTL, and the oldest once the store is full."""
+        from repoman.api import job_store
+        from repoman.api.job_store import JobStore
+
+        now = [100.0]
+        monkeypatch.setattr(job_store.time, "monotonic", lambda: now[0])
+        jobs = JobStore(maxsize=2, ttl_seconds=10)
+        jobs["a"] = {"status": "queued"}
+        now[0] = 105.0
+        jobs["b"] = {"status": "queued"}
+        now[0] = 108.0
+        jobs["c"] = {"status": "queued"}
+        assert "a" not in jobs and list(jobs) == ["b", "c"]
+
+        now[0] = 115.0
+        assert jobs.get("b") is None
+        assert jobs["c"] == {"status": "queued"} and len(jobs) == 1
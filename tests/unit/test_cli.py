@@ -0,0 +1,77 @@
+"""Unit tests for the command-line interface."""
+
+from __future__ import annotations
+
+import io
+from unittest.mock import AsyncMock, Mock
+
+from rich.console import Console
+
+import repoman.__main__ as cli
+from repoman import _manifest
+
+
+class TestIngestRepos:
+    """Tests for concurrent repository ingestion."""
+
+    async def test_failed_repo_is_reported_without_stopping_others(self, monkeypatch) -> None:
+        """One failing repo prints a failure line; the others still finish and print."""
+        buf = io.StringIO()
+        monkeypatch.setattr(cli, "_console", lambda: Console(file=buf, width=200))
+
+        async def ingest_repo(repo_full_name: str, *, issues_limit: int | None) -> dict:
+            if repo_full_name == "o/typo":
+                raise RuntimeError("not found")
+            return {"issues_indexed": 3, "health_score": 70}
+
+        service = AsyncMock()
+        service.ingest_repo.side_effect = ingest_repo
+        await cli._ingest_repos(
+            service, ["o/a", "o/typo", "o/b"], issues_limit=None, analyze=False, concurrency=2
+        )
+        assert buf.getvalue().splitlines() == [
+            "o/a indexed: issues=3 health=70",
+            "o/typo failed: not found",
+            "o/b indexed: issues=3 health=70",
+        ]
+
+
+class TestHelpManifest:
+    """Tests for the cached ``repoman --help`` entry point."""
+
+    def test_help_is_built_once_then_served_from_cache(self, monkeypatch, tmp_path, capsys) -> None:
+        """A miss builds and saves the help; a hit skips the build; edits invalidate it."""
+        commands = tmp_path / "__main__.py"
+        commands.write_text("# commands\n")
+        monkeypatch.setattr(_manifest, "_COMMANDS_MODULE", commands)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        monkeypatch.setattr("sys.argv", ["repoman", "--help"])
+        builds: list[int] = []
+
+        def build() -> str:
+            builds.append(1)
+            text = f"help v{len(builds)}\n"
+            print(text, end="")
+            return text
+
+        monkeypatch.setattr(_manifest, "build_manifest", build)
+
+        _manifest.main()
+        assert _manifest.manifest_path().read_text() == "help v1\n"
+        _manifest.main()
+        assert len(builds) == 1
+        assert capsys.readouterr().out == "help v1\nhelp v1\n"
+
+        commands.write_text("# commands, one more\n")
+        _manifest.main()
+        assert len(builds) == 2
+        assert capsys.readouterr().out == "help v2\n"
+
+    def test_other_arguments_go_to_the_typer_app(self, monkeypatch) -> None:
+        """Anything but a bare ``--help`` dispatches to the full app."""
+        app = Mock()
+        monkeypatch.setattr(cli, "app", app)
+        monkeypatch.setattr(_manifest, "load_manifest", Mock(side_effect=AssertionError))
+        monkeypatch.setattr("sys.argv", ["repoman", "es", "--help"])
+        _manifest.main()
+        app.assert_called_once_with()
@@ -79,3 +79,65 @@ class TestTranscript:
         )
         result = format_transcript([msg])
         assert "0.9" in result
+
+
+class TestConsensusEngine:
+    """Tests for the debate round scheduling."""
+
+    async def test_revision_does_not_wait_for_own_critique(self) -> None:
+        """A slow critic should start revising once the others' critiques are in."""
+        import asyncio
+        from datetime import datetime
+        from types import SimpleNamespace
+        from unittest.mock import AsyncMock, MagicMock
+
+        import orjson
+
+        from repoman.consensus.engine import ConsensusEngine
+        from repoman.core.events import EventBus
+
+        order: list[str] = []
+
+        def make_agent(name: str, delay: float) -> MagicMock:
+            agent = MagicMock()
+            agent.name = name
+
+            async def critique_plans(plans: dict, exclude: str | None = None) -> dict:
+                assert exclude == name
+                await asyncio.sleep(delay)
+                order.append(f"critique:{name}")
+                return {"by": name}
+
+            async def revise_plan(own: dict, critiques: dict) -> dict:
+                order.append(f"revise:{name}")
+                assert name not in critiques
+                return {"revised": name, "seen": sorted(critiques)}
+
+            agent.propose_plan = AsyncMock(return_value={"plan": name})
+            agent.critique_plans = critique_plans
+            agent.revise_plan = revise_plan
+            agent.vote_on_plan = AsyncMock(
+                return_value=AgentVote(agent_name=name, score=9.0, approve=True, rationale="")
+            )
+            return agent
+
+        agents = [make_agent("fast", 0.0), make_agent("slow", 0.05)]
+        orchestrator = MagicMock()
+        orchestrator.name = "Orchestrator"
+        orchestrator.synthesize_plans = AsyncMock(return_value={"unified": True})
+        config = SimpleNamespace(max_consensus_rounds=1, consensus_threshold=7.0)
+
+        bus = EventBus()
+        events = bus.subscribe(job_id="j1")
+        result = await ConsensusEngine(config, bus).run([], agents, orchestrator, job_id="j1")
+
+        assert result.achieved
+        assert order.index("revise:slow") < order.index("critique:slow")
+        plans = orchestrator.synthesize_plans.await_args.args[0]
+        assert plans == {
+            "fast": {"revised": "fast", "seen": ["slow"]},
+            "slow": {"revised": "slow", "seen": ["fast"]},
+        }
+        first = orjson.loads(events.get_nowait().text)
+        assert first["job_id"] == "j1" and first["data"]["role"] == "PROPOSAL"
+        assert datetime.fromisoformat(first["data"]["timestamp"]).tzinfo is not None
@@ -0,0 +1,184 @@
+"""Unit tests for the Elasticsearch client, indices, queries and ingestion."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+
+class TestBulkLoad:
+    """Tests for suspending index refresh during bulk loads."""
+
+    async def test_restores_refresh_interval_and_refreshes(self) -> None:
+        """Each index gets its old refresh interval back and is refreshed once."""
+        from repoman.elasticsearch.index_management import bulk_load
+
+        es = MagicMock()
+        es.indices.get_settings = AsyncMock(
+            return_value={"a": {"settings": {"index": {"refresh_interval": "5s"}}}, "b": {}}
+        )
+        es.indices.put_settings = AsyncMock()
+        es.indices.refresh = AsyncMock()
+
+        async with bulk_load(es, ("a", "b")):
+            es.indices.put_settings.assert_awaited_once_with(
+                index="a,b", settings={"index": {"refresh_interval": "-1"}}
+            )
+
+        restored = {
+            c.kwargs["index"]: c.kwargs["settings"]["index"]["refresh_interval"]
+            for c in es.indices.put_settings.await_args_list[1:]
+        }
+        assert restored == {"a": "5s", "b": None}
+        es.indices.refresh.assert_awaited_once_with(index="a,b")
+
+
+class TestAnalyzeStream:
+    """Tests for the streamed repository analysis."""
+
+    async def test_stages_precede_indexed_analysis(self, settings) -> None:
+        """Every stage is yielded before the analysis document is indexed."""
+        from repoman.elasticsearch.ingestion import ElasticsearchIngestionService
+
+        es = AsyncMock()
+        es.search.side_effect = [
+            {"hits": {"hits": [{"_source": {"repo_id": "1", "has_readme": True}}]}},
+            {"aggregations": {"by_type": {"buckets": {}}}},
+            {"hits": {"hits": []}},
+            {"aggregations": {"top_labels": {"buckets": []}}},
+        ]
+        es.msearch.return_value = {"responses": []}
+        service = ElasticsearchIngestionService(
+            settings, es=es, github=MagicMock(), encoder=MagicMock()
+        )
+
+        stages = [s async for s in service.analyze_repo_stream("o/r")]
+        assert [s["stage"] for s in stages] == [
+            "scores",
+            "stale",
+            "duplicates",
+            "direction",
+            "complete",
+        ]
+        assert stages[-1]["analysis"]["missing_elements"] == ["LICENSE", "CONTRIBUTING"]
+        es.index.assert_awaited_once()
+        es.update.assert_awaited_once()
+
+
+class TestMappings:
+    """Tests for the bundled index mappings."""
+
+    def test_vectors_use_quantized_hnsw(self) -> None:
+        """Vector fields take the configured dims and use int8 HNSW."""
+        from repoman.elasticsearch.index_management import _load_mapping
+
+        issues = _load_mapping("issues", vector_dims=8)["mappings"]["properties"]
+        repos = _load_mapping("repositories", vector_dims=8)["mappings"]["properties"]
+        for field in (issues["body_embedding"], repos["description_embedding"]):
+            assert field["dims"] == 8
+            assert field["index_options"] == {"type": "int8_hnsw"}
+
+    async def test_existing_index_gains_added_fields(self) -> None:
+        """An existing index is not recreated but gets the newer fields mapped."""
+        from repoman.elasticsearch.index_management import _ensure_index, _load_mapping
+
+        es = AsyncMock()
+        es.indices.exists.return_value = True
+        await _ensure_index(es, "repoman-issues", _load_mapping("issues", vector_dims=8))
+        es.indices.create.assert_not_awaited()
+        properties = es.indices.put_mapping.await_args.kwargs["properties"]
+        assert properties == {
+            "dup_cluster": {"type": "keyword"},
+            "duplicate_neighbors": {"type": "object", "enabled": False},
+        }
+
+    def test_mapping_file_read_once_and_each_call_gets_its_own_copy(self) -> None:
+        """Mapping files are read once; callers get independent dicts."""
+        from repoman.elasticsearch.index_management import _load_mapping, _read_mapping
+
+        _read_mapping.cache_clear()
+        small = _load_mapping("issues", vector_dims=8)
+        large = _load_mapping("issues", vector_dims=16)
+        assert _read_mapping.cache_info().misses == 1
+        props = small["mappings"]["properties"]
+        assert props["body_embedding"]["dims"] == 8
+        assert large["mappings"]["properties"]["body_embedding"]["dims"] == 16
+
+
+class TestClientLifespan:
+    """Tests for sharing Elasticsearch clients across lifespans."""
+
+    async def test_overlapping_lifespans_share_one_client(self, settings) -> None:
+        """Nested lifespans share a client, which is released with the last one."""
+        from repoman.elasticsearch.client import _shared_clients, es_lifespan
+
+        settings.elasticsearch_url = "http://localhost:9200"
+        async with es_lifespan(settings) as first:
+            async with es_lifespan(settings) as second:
+                assert first is second
+            assert _shared_clients
+        assert not _shared_clients
+
+        settings.elasticsearch_url = ""
+        async with es_lifespan(settings) as missing:
+            assert missing is None
+
+
+class TestQueries:
+    """Tests for the search body builders."""
+
+    def test_bodies_share_static_parts_and_skip_embeddings(self) -> None:
+        """Static parts are shared between bodies and embeddings stay out of _source."""
+        from repoman.elasticsearch.queries import (
+            issue_full_text_search,
+            issue_semantic_search,
+            repo_semantic_search,
+        )
+
+        first = issue_semantic_search([0.1], repo_full_name="a/b")
+        second = issue_semantic_search([0.2])
+        assert first["_source"] is second["_source"]
+        assert "body_embedding" in first["_source"]["excludes"]
+        assert "description_embedding" in repo_semantic_search([0.1])["_source"]["excludes"]
+        assert issue_full_text_search("x")["highlight"] is issue_full_text_search("y")["highlight"]
+        assert issue_full_text_search("x")["track_total_hits"] == 1000
+
+
+class TestMSearchCoalescer:
+    """Tests for batching searches into _msearch requests."""
+
+    async def test_concurrent_searches_share_one_msearch(self) -> None:
+        """Concurrent searches go out in one request and get their own results."""
+        import asyncio
+
+        from repoman.elasticsearch.coalescer import MSearchCoalescer
+        from repoman.elasticsearch.errors import MSearchItemError
+
+        es = AsyncMock()
+        es.msearch.return_value = {
+            "responses": [
+                {"hits": {"hits": [{"_id": "a"}]}},
+                {"error": {"type": "parse_exception"}, "status": 400},
+                {"hits": {"hits": [{"_id": "c"}]}},
+            ]
+        }
+        coalescer = MSearchCoalescer(es, window_seconds=0.01)
+        results = await asyncio.gather(
+            coalescer.submit({"index": "i1", "preference": "p", "request_cache": True, "size": 1}),
+            coalescer.submit({"index": "i2", "size": 2}),
+            coalescer.submit({"index": "i1", "size": 3}),
+            return_exceptions=True,
+        )
+        await coalescer.aclose()
+
+        es.msearch.assert_awaited_once()
+        assert es.msearch.await_args.kwargs["searches"] == [
+            {"index": "i1", "preference": "p", "request_cache": True},
+            {"size": 1},
+            {"index": "i2"},
+            {"size": 2},
+            {"index": "i1"},
+            {"size": 3},
+        ]
+        assert results[0]["hits"]["hits"][0]["_id"] == "a"
+        assert isinstance(results[1], MSearchItemError) and results[1].status == 400
+        assert results[2]["hits"]["hits"][0]["_id"] == "c"
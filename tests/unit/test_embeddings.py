@@ -0,0 +1,48 @@
+"""Unit tests for text embedding encoders."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+
+class TestCachedEncoder:
+    """Tests for query embedding caching and batching."""
+
+    def test_repeat_queries_encoded_once(self) -> None:
+        """Normalised repeat queries hit the cache and get their own copy."""
+        from repoman.embeddings.encoder import CachedEncoder, HashEmbeddingEncoder
+
+        inner = HashEmbeddingEncoder(dims=16)
+        spy = MagicMock(wraps=inner)
+        encoder = CachedEncoder(spy)
+        first = encoder.encode("vector  database")
+        first[0] = 99.0
+        assert encoder.encode(" vector database ") == inner.encode("vector database")
+        spy.encode_batch.assert_called_once_with(["vector database"])
+
+    async def test_batcher_encodes_concurrent_texts_together(self) -> None:
+        """Texts submitted together are encoded in one batch."""
+        import asyncio
+
+        from repoman.embeddings.batcher import EncoderBatcher
+        from repoman.embeddings.encoder import HashEmbeddingEncoder
+
+        inner = HashEmbeddingEncoder(dims=16)
+        spy = MagicMock(wraps=inner)
+        batcher = EncoderBatcher(spy, window_seconds=0.01)
+        texts = ["alpha", "beta gamma", "alpha"]
+        vectors = await asyncio.gather(*(batcher.submit(t) for t in texts))
+        await batcher.aclose()
+
+        spy.encode_batch.assert_called_once_with(texts)
+        assert vectors == [inner.encode(t) for t in texts]
+
+    def test_vectors_are_compact_unit_vectors(self) -> None:
+        """Vectors are rounded to six decimals and stay unit length."""
+        import math
+
+        from repoman.embeddings.encoder import HashEmbeddingEncoder
+
+        vec = HashEmbeddingEncoder(dims=384).encode("a fairly long issue body " * 20)
+        assert all(v == round(v, 6) for v in vec)
+        assert math.isclose(math.sqrt(sum(v * v for v in vec)), 1.0, abs_tol=1e-5)
@@ -9,7 +9,11 @@ import pytest
 
 from repoman.analysis.completeness import compute_completeness
 from repoman.analysis.direction import assess_repo_direction
-from repoman.analysis.duplicates import find_duplicate_issue_groups
+from repoman.analysis.duplicates import (
+    duplicate_cluster_keys,
+    find_duplicate_clusters,
+    find_duplicate_issue_groups,
+)
 from repoman.analysis.recommendations import generate_action_items
 from repoman.analysis.staleness import is_stale, query_stale_counts
 
@@ -39,6 +43,18 @@ class TestCompleteness:
         assert set(result.missing_elements) == {"README", "LICENSE", "CI_CONFIG", "PACKAGE_MANAGER"}
         assert 0.0 < result.completeness_score < 100.0
 
+    def test_readme_padding_does_not_count(self) -> None:
+        flags = dict(
+            has_license=True,
+            has_contributing=True,
+            has_ci_config=True,
+            has_tests=True,
+            has_package_manager_config=True,
+        )
+        padded = compute_completeness(readme_text="\n" + "x" * 450 + " " * 100, **flags)
+        assert padded.missing_elements == ["README"]
+        assert compute_completeness(readme_text="x" * 500, **flags).missing_elements == []
+
 
 class TestStaleness:
     def test_is_stale_true(self) -> None:
@@ -48,11 +64,18 @@ class TestStaleness:
     @pytest.mark.asyncio
     async def test_query_stale_counts(self) -> None:
         es = AsyncMock()
-        es.count = AsyncMock(side_effect=[{"count": 2}, {"count": 1}])
+        es.search = AsyncMock(
+            return_value={
+                "aggregations": {
+                    "by_type": {"buckets": {"issues": {"doc_count": 2}, "prs": {"doc_count": 1}}}
+                }
+            }
+        )
         result = await query_stale_counts(es, repo_full_name="o/r", threshold_days=30)
         assert result.stale_issues_count == 2
         assert result.stale_prs_count == 1
-        assert es.count.call_count == 2
+        assert es.search.call_count == 1
+        assert es.search.await_args.kwargs["size"] == 0
 
 
 class TestDuplicates:
@@ -75,32 +98,197 @@ class TestDuplicates:
                         ]
                     }
                 },
-                {"hits": {"hits": [{"_source": {"issue_id": "B"}, "_score": 0.9}]}},
-                {"hits": {"hits": [{"_source": {"issue_id": "A"}, "_score": 0.9}]}},
-                {"hits": {"hits": []}},
             ]
         )
+        es.msearch = AsyncMock(
+            return_value={
+                "responses": [
+                    {"hits": {"hits": [{"_source": {"issue_id": "B"}, "_score": 0.9}]}},
+                    {"hits": {"hits": [{"_source": {"issue_id": "A"}, "_score": 0.9}]}},
+                    {"hits": {"hits": []}},
+                ]
+            }
+        )
 
         groups = await find_duplicate_issue_groups(es, repo_full_name="o/r", threshold=0.85)
         assert len(groups) == 1
         assert groups[0].issue_ids == ["A", "B"]
         assert groups[0].representative_issue_id == "A"
+        assert groups[0].max_similarity == pytest.approx(0.9)
+        es.msearch.assert_awaited_once()
+        assert len(es.msearch.await_args.kwargs["searches"]) == 6
 
+    def test_cluster_keys_pair_vectors_at_realistic_similarity(self) -> None:
+        import math
+        import random
+
+        rng = random.Random(7)
+
+        def unit(v: list[float]) -> list[float]:
+            norm = math.sqrt(sum(x * x for x in v))
+            return [x / norm for x in v]
+
+        shared = 0
+        for _ in range(20):
+            a = unit([rng.gauss(0.0, 1.0) for _ in range(384)])
+            r = [rng.gauss(0.0, 1.0) for _ in range(384)]
+            dot = sum(x * y for x, y in zip(r, a, strict=True))
+            r = unit([x - dot * y for x, y in zip(r, a, strict=True)])
+            # b is at cosine 0.9 to a.
+            b = [0.9 * x + math.sqrt(1 - 0.81) * y for x, y in zip(a, r, strict=True)]
+            shared += bool(set(duplicate_cluster_keys(a)) & set(duplicate_cluster_keys(b)))
+        assert shared >= 19
+
+        base = [1.0, 0.5, -0.25, 0.0] * 96
+        assert len(duplicate_cluster_keys(base)) == 10
+        assert not set(duplicate_cluster_keys(base)) & set(
+            duplicate_cluster_keys([-v for v in base])
+        )
+        assert duplicate_cluster_keys([0.0] * 384) == []
 
-class TestDirectionAndRecommendations:
     @pytest.mark.asyncio
-    async def test_direction_diverges(self) -> None:
+    async def test_clusters_from_terms_aggregation(self) -> None:
+        es = AsyncMock()
+
+        def member(issue_id: str, vec: list[float]) -> dict:
+            return {"_source": {"issue_id": issue_id, "body_embedding": vec}}
+
+        es.search.return_value = {
+            "aggregations": {
+                "clusters": {
+                    "buckets": [
+                        {
+                            "key": "0:12",
+                            "doc_count": 3,
+                            "members": {
+                                "hits": {
+                                    "hits": [
+                                        member("1", [1.0, 0.0]),
+                                        member("2", [0.28, 0.96]),
+                                        member("3", [0.6, 0.8]),
+                                    ]
+                                }
+                            },
+                        },
+                        # Another band pairs 1 with 4; 1 and 2 meet again.
+                        {
+                            "key": "1:05",
+                            "doc_count": 3,
+                            "members": {
+                                "hits": {
+                                    "hits": [
+                                        member("1", [1.0, 0.0]),
+                                        member("2", [0.28, 0.96]),
+                                        member("4", [0.99, 0.14]),
+                                    ]
+                                }
+                            },
+                        },
+                        {"key": "2:34", "doc_count": 2, "members": {"hits": {"hits": []}}},
+                    ]
+                }
+            }
+        }
+        groups = await find_duplicate_clusters(es, repo_full_name="o/r")
+        assert [g.issue_ids for g in groups] == [["1", "4"], ["2", "3"]]
+        assert groups[0].representative_issue_id == "1"
+        # Similarities are on the kNN _score scale, (1 + cos) / 2.
+        assert groups[0].max_similarity == pytest.approx(0.995, abs=1e-3)
+        assert groups[1].max_similarity == pytest.approx(0.968)
+        terms = es.search.await_args.kwargs["aggs"]["clusters"]["terms"]
+        assert terms["size"] == 40
+        assert es.search.await_args.kwargs["size"] == 0
+
+    def test_disjoint_set_merges_transitively(self) -> None:
+        from repoman.analysis.duplicates import _DisjointSet
+
+        dsu = _DisjointSet()
+        dsu.union("D", "C", 0.95)
+        dsu.union("B", "A", 0.9)
+        dsu.union("C", "B", 0.86)
+        dsu.union("E", "E", 0.99)
+        assert dsu.components() == [(["A", "B", "C", "D"], 0.95)]
+
+    @pytest.mark.asyncio
+    async def test_vector_lookup_skips_embedding_fetch(self) -> None:
         es = AsyncMock()
+        es.search = AsyncMock(
+            return_value={"hits": {"hits": [{"_id": "A", "_source": {"issue_id": "A"}}]}}
+        )
+        es.msearch = AsyncMock(return_value={"responses": [{"hits": {"hits": []}}]})
+
+        groups = await find_duplicate_issue_groups(es, repo_full_name="o/r", vector_lookup=True)
+        assert groups == []
+        assert "body_embedding" not in es.search.await_args.kwargs["source_includes"]
+        knn = es.msearch.await_args.kwargs["searches"][1]["knn"]
+        assert "query_vector" not in knn
+        assert knn["query_vector_builder"]["lookup"]["id"] == "A"
+
+    @pytest.mark.asyncio
+    async def test_stored_neighbors_reused_and_new_ones_saved(self, monkeypatch) -> None:
+        saved: list[dict] = []
+
+        async def fake_bulk_index(es, actions):
+            saved.extend(actions)
+
+        monkeypatch.setattr("repoman.analysis.duplicates.bulk_index", fake_bulk_index)
+        es = AsyncMock()
+        stored = [{"issue_id": "B", "score": 0.9}, {"issue_id": "Z", "score": 0.99}]
         es.search = AsyncMock(
             return_value={
                 "hits": {
                     "hits": [
-                        {"_source": {"labels": ["ui", "frontend"], "title": "Add UI"}},
-                        {"_source": {"labels": ["ui"], "title": "Improve UI"}},
+                        {"_id": "A", "_source": {"issue_id": "A", "duplicate_neighbors": stored}},
+                        {"_id": "B", "_source": {"issue_id": "B"}},
+                        {"_id": "D", "_source": {"issue_id": "D"}},
+                        {"_id": "E", "_source": {"issue_id": "E"}},
                     ]
                 }
             }
         )
+        # D's search is rejected and E gets no response: neither may be stored.
+        es.msearch = AsyncMock(
+            return_value={
+                "responses": [
+                    {"hits": {"hits": [{"_score": 0.88, "_source": {"issue_id": "C"}}]}},
+                    {"error": {"type": "es_rejected_execution_exception"}, "status": 429},
+                ]
+            }
+        )
+
+        groups = await find_duplicate_issue_groups(
+            es, repo_full_name="o/r", vector_lookup=True, store_neighbors=True
+        )
+        # Z is no longer open, so its stored edge is ignored.
+        assert [(g.issue_ids, g.max_similarity) for g in groups] == [(["A", "B", "C"], 0.9)]
+        assert len(es.msearch.await_args.kwargs["searches"]) == 6
+        assert saved == [
+            {
+                "_op_type": "update",
+                "_index": "repoman-issues",
+                "_id": "B",
+                "_source": {"doc": {"duplicate_neighbors": [{"issue_id": "C", "score": 0.88}]}},
+            }
+        ]
+
+
+class TestDirectionAndRecommendations:
+    @pytest.mark.asyncio
+    async def test_direction_diverges(self) -> None:
+        es = AsyncMock()
+        es.search = AsyncMock(
+            return_value={
+                "hits": {"hits": []},
+                "aggregations": {
+                    "top_labels": {
+                        "buckets": [
+                            {"key": "ui", "doc_count": 2},
+                            {"key": "frontend", "doc_count": 1},
+                        ]
+                    }
+                },
+            }
+        )
 
         assessment = await assess_repo_direction(
             es,
@@ -109,7 +297,10 @@ class TestDirectionAndRecommendations:
             repo_description="A CLI tool",
         )
         assert assessment.diverges is True
-        assert "Recent closed work labels" in assessment.summary
+        assert "Recent closed work labels: ui, frontend" in assessment.summary
+        assert es.search.await_args.kwargs["size"] == 0
+        filters = es.search.await_args.kwargs["query"]["bool"]["filter"]
+        assert {"range": {"updated_at": {"gte": "now-90d"}}} in filters
 
     def test_generate_action_items(self) -> None:
         items = generate_action_items(
@@ -0,0 +1,82 @@
+"""Unit tests for the event bus."""
+
+from __future__ import annotations
+
+
+class TestEventBus:
+    """Tests for event fan-out to subscriber queues."""
+
+    async def test_subscribers_share_one_serialisation(self) -> None:
+        """Every subscriber should receive the same pre-encoded message."""
+        import orjson
+
+        from repoman.core.events import EventBus
+
+        bus = EventBus()
+        first, second = bus.subscribe(), bus.subscribe()
+        await bus.emit("phase_started", {"job_id": "j1", "phase": 1})
+        a, b = first.get_nowait(), second.get_nowait()
+        assert a is b
+        assert a.data == {"job_id": "j1", "phase": 1}
+        assert orjson.loads(a.text) == {"event": "phase_started", "job_id": "j1", "data": a.data}
+
+    async def test_job_subscription_receives_only_that_job(self) -> None:
+        """A job-scoped queue should skip other jobs' events; unsubscribing stops delivery."""
+        from repoman.core.events import EventBus
+
+        bus = EventBus()
+        everything, job = bus.subscribe(), bus.subscribe(job_id="j1")
+        await bus.emit("phase_started", {"job_id": "j2"})
+        await bus.emit("phase_started", {"job_id": "j1"})
+        assert everything.qsize() == 2
+        assert job.qsize() == 1 and job.get_nowait().data["job_id"] == "j1"
+
+        bus.unsubscribe(job)
+        await bus.emit("phase_started", {"job_id": "j1"})
+        assert job.empty()
+
+    async def test_job_id_is_taken_from_the_emitting_context(self) -> None:
+        """Payloads without a job_id should be routed by `current_job_id`."""
+        import orjson
+
+        from repoman.core.events import EventBus, current_job_id
+
+        bus = EventBus()
+        job = bus.subscribe(job_id="j1")
+        await bus.emit("phase_started", {"phase": 1})
+        token = current_job_id.set("j1")
+        try:
+            await bus.emit("phase_started", {"phase": 2})
+        finally:
+            current_job_id.reset(token)
+        assert job.qsize() == 1
+        message = job.get_nowait()
+        assert message.job_id == "j1" and message.data == {"phase": 2}
+        assert orjson.loads(message.text)["job_id"] == "j1"
+
+    def test_emit_nowait_drops_oldest_for_a_full_queue(self, monkeypatch) -> None:
+        """A subscriber that falls behind should lose its oldest events, not block."""
+        from repoman.core import events
+        from repoman.core.events import EventBus
+
+        monkeypatch.setattr(events, "_QUEUE_MAXSIZE", 2)
+        bus = EventBus()
+        q = bus.subscribe()
+        for i in range(3):
+            bus.emit_nowait("debate_message", {"n": i})
+        assert [q.get_nowait().data["n"] for _ in range(q.qsize())] == [1, 2]
+
+    async def test_waiting_subscribers_wake_on_one_publish(self) -> None:
+        """A single emit should wake every waiting reader of the shared channel."""
+        import asyncio
+
+        from repoman.core.events import EventBus
+
+        bus = EventBus()
+        readers = [bus.subscribe(), bus.subscribe()]
+        waiting = [asyncio.ensure_future(r.get()) for r in readers]
+        await asyncio.sleep(0)
+        bus.emit_nowait("phase_started", {"phase": 1})
+        first, second = await asyncio.wait_for(asyncio.gather(*waiting), timeout=1)
+        assert first is second and first.data == {"phase": 1}
+        assert all(r.empty() for r in readers)
@@ -41,6 +41,13 @@ class TestInitialHealthScore:
         with_ci = compute_initial_health_score(make_snapshot(has_ci=True))
         assert with_ci - without == pytest.approx(10.0)
 
+    def test_remaining_flags_add_points(self) -> None:
+        """Dockerfile, licence and env example should add 5 points each."""
+        without = compute_initial_health_score(make_snapshot())
+        for flag in ("has_dockerfile", "has_license", "has_env_example"):
+            with_flag = compute_initial_health_score(make_snapshot(**{flag: True}))
+            assert with_flag - without == pytest.approx(5.0), flag
+
     def test_large_file_count_penalised(self) -> None:
         """More than 1000 files should lower the score."""
         normal = compute_initial_health_score(make_snapshot(total_files=50))
@@ -0,0 +1,29 @@
+"""Unit tests for pipeline helpers."""
+
+from __future__ import annotations
+
+
+class TestRunAgents:
+    """Tests for the pipeline's agent fan-out."""
+
+    async def test_results_and_failures_by_name(self) -> None:
+        """Synchronous completions finish eagerly; a failure does not cancel the others."""
+        import asyncio
+
+        from repoman.core.pipeline import _run_agents
+
+        async def cached() -> str:
+            return "hit"
+
+        async def slow() -> str:
+            await asyncio.sleep(0.01)
+            return "done"
+
+        async def broken() -> str:
+            raise ValueError("boom")
+
+        task_count = len(asyncio.all_tasks())
+        results = await _run_agents({"a": cached(), "b": slow(), "c": broken()})
+        assert results["a"] == "hit" and results["b"] == "done"
+        assert isinstance(results["c"], ValueError)
+        assert len(asyncio.all_tasks()) == task_count
@@ -0,0 +1,22 @@
+"""Unit tests for CLI UI helpers."""
+
+from __future__ import annotations
+
+import io
+
+from rich.console import Console
+
+from repoman.utils.ui import maybe_progress
+
+
+class TestMaybeProgress:
+    """Tests for the TTY-aware progress helper."""
+
+    def test_non_terminal_prints_plain_status_lines(self) -> None:
+        """Without a TTY, status updates are printed as plain lines."""
+        buf = io.StringIO()
+        console = Console(file=buf, force_terminal=False)
+        with maybe_progress(console, "Working...") as status:
+            status("Done!")
+        assert buf.getvalue().splitlines() == ["Working...", "Done!"]
+        assert "\x1b" not in buf.getvalue()